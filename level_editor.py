@@ -1,7 +1,7 @@
-import pathlib
-
+from src.PlatformerGame.main.configs.build_config import BuildConfig
 from src.PlatformerGame.main.configs.build_config import EditorConfig
 from src.PlatformerGame.main.game_manager import GameManager
+from src.PlatformerGame.scene.map_saver import MapSaver
 from src.PyEng.main.engine import Engine
 from src.PyEng.main.engine_files import EngineFiles
 from src.shared import api
@@ -17,6 +17,7 @@ class LevelEditor:
     # Get necessary components
     self.window = self.game_manager.components_manager.get_window()
     self.input = self.game_manager.components_manager.get_input()
+    self.camera = self.game_manager.components_manager.get_camera()
     self.scene = self.game_manager.current_session.get_scene()
     self.world = self.scene.world_grid
 
@@ -32,64 +33,109 @@ class LevelEditor:
 
     # Mouse position
     self.mx, self.my = 0, 0
+    # Tile where the current rectangle fill started
+    self.fill_start: tuple[int, int] | None = None
+
+    # Maps are written on a worker thread so saving does not stall the loop
+    self.map_saver = MapSaver(
+      self.world,
+      EngineFiles.DATA_FOLDER / 'map.map',
+      autosave=EditorConfig.auto_save,
+    )
+    self.map_saver.start()
 
   def run(self) -> None:
-    while True:
-      self.game_manager.update()
-      self.engine.update()
-      self.mx, self.my = self.input.mouse.get_position()
-
-      # Adding and removing tiles
-      self.add_tiles(key_mappings.EditorMapping.MOUSE_LEFT)
-      self.remove_tiles(key_mappings.EditorMapping.MOUSE_RIGHT)
-
-      # Save and load map
-      self.save(
-        key_mappings.EditorMapping.LEFT, EngineFiles.DATA_FOLDER / 'map.map'
-      )
-      self.load(
-        key_mappings.EditorMapping.RIGHT, EngineFiles.DATA_FOLDER / 'map.map'
+    try:
+      self.engine.run(update=self.update)
+    finally:
+      # Finish writing the map and the journal before the game closes
+      self.map_saver.close()
+
+  def update(self) -> None:
+    self.mx, self.my = self.get_mouse_tile()
+
+    # Adding and removing tiles
+    self.fill_tiles(
+      key_mappings.EditorMapping.MOUSE_LEFT,
+      key_mappings.EditorMapping.CONTROL,
+    )
+    self.add_tiles(key_mappings.EditorMapping.MOUSE_LEFT)
+    self.remove_tiles(key_mappings.EditorMapping.MOUSE_RIGHT)
+
+    # Save and load map
+    self.save(key_mappings.EditorMapping.LEFT)
+    self.load(key_mappings.EditorMapping.RIGHT)
+    self.map_saver.update()
+
+    # Show or hide the grid overlay
+    if self.input.pressed(key_mappings.EditorMapping.MOUSE_MIDDLE):
+      self.world.toggle_grid()
+
+    # Update tile type if control + scroll
+    if self.input.pressed(
+      key_mappings.EditorMapping.MOUSE_SCROLL_UP,
+      modifier=key_mappings.EditorMapping.CONTROL,
+    ):
+      self.tile_type_index = (self.tile_type_index + 1) % len(self.tile_types)
+      self.variant = 0
+      self.update_tile = True
+    elif self.input.pressed(
+      key_mappings.EditorMapping.MOUSE_SCROLL_DOWN,
+      modifier=key_mappings.EditorMapping.CONTROL,
+    ):
+      self.tile_type_index = (self.tile_type_index - 1) % len(self.tile_types)
+      self.variant = 0
+      self.update_tile = True
+
+    elif self.input.pressed(key_mappings.EditorMapping.MOUSE_SCROLL_UP):
+      self.variant = (self.variant + 1) % len(self.selected_tile.images)
+      self.update_tile = True
+    elif self.input.pressed(key_mappings.EditorMapping.MOUSE_SCROLL_DOWN):
+      self.variant = (self.variant - 1) % len(self.selected_tile.images)
+      self.update_tile = True
+
+    if self.update_tile:
+      self.current_tile_type = self.tile_types[self.tile_type_index]
+      self.selected_tile = self.tiles_blueprint.get(
+        self.current_tile_type.value
       )
-
-      # Update tile type if control + scroll
-      if self.input.pressed(
-        key_mappings.EditorMapping.MOUSE_SCROLL_UP,
-        modifier=key_mappings.EditorMapping.CONTROL,
-      ):
-        self.tile_type_index = (self.tile_type_index + 1) % len(self.tile_types)
-        self.variant = 0
-        self.update_tile = True
-      elif self.input.pressed(
-        key_mappings.EditorMapping.MOUSE_SCROLL_DOWN,
-        modifier=key_mappings.EditorMapping.CONTROL,
-      ):
-        self.tile_type_index = (self.tile_type_index - 1) % len(self.tile_types)
-        self.variant = 0
-        self.update_tile = True
-
-      elif self.input.pressed(key_mappings.EditorMapping.MOUSE_SCROLL_UP):
-        self.variant = (self.variant + 1) % len(self.selected_tile.images)
-        self.update_tile = True
-      elif self.input.pressed(key_mappings.EditorMapping.MOUSE_SCROLL_DOWN):
-        self.variant = (self.variant - 1) % len(self.selected_tile.images)
-        self.update_tile = True
-
-      if self.update_tile:
-        self.current_tile_type = self.tile_types[self.tile_type_index]
-        self.selected_tile = self.tiles_blueprint.get(
-          self.current_tile_type.value
-        )
-        self.update_tile = False
-
-      self.selected_tile.render_preview(
-        self.window.display,
-        self.mx,
-        self.my,
-        self.variant,
+      self.update_tile = False
+
+    self.selected_tile.render_preview(
+      self.window.display,
+      self.mx,
+      self.my,
+      self.variant,
+      self.camera,
+    )
+
+  def get_mouse_tile(self) -> tuple[int, int]:
+    # Convert the mouse position on the display to a tile in the world
+    world_x, world_y = self.camera.screen_to_world(*self.input.mouse.position)
+    return (
+      int(world_x // BuildConfig.tile_width),
+      int(world_y // BuildConfig.tile_height),
+    )
+
+  def fill_tiles(
+    self,
+    key: key_mappings.EditorMapping,
+    modifier: key_mappings.EditorMapping,
+  ):
+    # Modifier + drag fills the rectangle between the press and the release
+    if self.input.pressed(key, modifier=modifier):
+      self.fill_start = (self.mx, self.my)
+    elif self.fill_start is not None and self.input.released(key):
+      start_x, start_y = self.fill_start
+      self.fill_start = None
+      self.world.create_tiles(
+        (x, y, self.current_tile_type, self.variant, self.layer)
+        for x in range(min(start_x, self.mx), max(start_x, self.mx) + 1)
+        for y in range(min(start_y, self.my), max(start_y, self.my) + 1)
       )
 
   def add_tiles(self, key: key_mappings.EditorMapping):
-    if self.input.holding(key):
+    if self.fill_start is None and self.input.holding(key):
       self.world.create_tile(
         self.mx, self.my, self.current_tile_type, self.variant, self.layer
       )
@@ -98,14 +144,13 @@ class LevelEditor:
     if self.input.holding(key):
       self.world.remove_tile(self.mx, self.my, self.layer)
 
-  def save(self, key: key_mappings.EditorMapping, file_path: pathlib.Path):
+  def save(self, key: key_mappings.EditorMapping):
     if self.input.pressed(key):
-      self.scene.world_grid.save(file_path)
-      print('Saved!')
+      self.map_saver.save()
 
-  def load(self, key: key_mappings.EditorMapping, file_path: pathlib.Path):
+  def load(self, key: key_mappings.EditorMapping):
     if self.input.pressed(key):
-      self.scene.world_grid.load(file_path)
+      self.map_saver.load()
       print('Loaded!')
 
   def update_tile_preview(
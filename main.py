@@ -12,8 +12,7 @@ class EngineTester:
     self.engine.update()
 
   def run(self) -> None:
-    while True:
-      self.update()
+    self.engine.run()
 
 
 class GameApp:
@@ -23,15 +22,14 @@ class GameApp:
     self.input = self.game_manager.components_manager.get_input()
 
   def run(self) -> None:
-    while True:
-      self.game_manager.update()
-      self.engine.update()
-
-      if self.input.pressed(key_mappings.GameMapping.DOWN):
-        print('DOWN')
-      if self.input.pressed(key_mappings.GameMapping.MOUSE_LEFT):
-        print('MOUSE_LEFT')
-        print(self.input.mouse.position)
+    self.engine.run(update=self.update)
+
+  def update(self) -> None:
+    if self.input.pressed(key_mappings.GameMapping.DOWN):
+      print('DOWN')
+    if self.input.pressed(key_mappings.GameMapping.MOUSE_LEFT):
+      print('MOUSE_LEFT')
+      print(self.input.mouse.position)
 
     # self.game_manager.clean_up()
 
@@ -0,0 +1,50 @@
+import argparse
+import pathlib
+import sys
+
+# Run from the root of the project
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig  # noqa: E402
+from src.PlatformerGame.main.game_manager import GameManager  # noqa: E402
+from src.PyEng.main.engine import Engine  # noqa: E402
+
+
+class BenchmarkConfig(BuildConfig):
+  """Runs the game without a window and without a frame rate cap"""
+
+  headless = True
+  fps = 0
+
+
+def main():
+  parser = argparse.ArgumentParser(
+    description='Measure the frame and simulation rate of the game headless'
+  )
+  parser.add_argument('--seconds', type=float, default=5.0)
+  args = parser.parse_args()
+
+  engine = Engine.create(BenchmarkConfig)
+  # The game manager is updated by the engine once it is created
+  GameManager(engine)
+  counts = {'frames': 0, 'steps': 0}
+
+  def simulate(delta: float) -> None:
+    counts['steps'] += 1
+
+  def update() -> None:
+    counts['frames'] += 1
+    if engine.get_current_time() - start_time >= args.seconds:
+      engine.close_flag = True
+
+  start_time = engine.get_current_time()
+  engine.run(simulate, update)
+  elapsed = engine.get_current_time() - start_time
+  print(
+    f'{counts["frames"] / elapsed:.1f} frames/s, '
+    f'{counts["steps"] / elapsed:.1f} steps/s over {elapsed:.2f}s'
+  )
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,11 @@
+#!/bin/bash
+#
+# Measure the frame and simulation rate of the game without a display
+
+# Set failure conditions
+set -o errexit  # Fail on any error
+set -o pipefail # Trace ERR through pipes
+set -o errtrace # Trace ERR through sub-shell commands
+
+echo "Benchmarking the engine..."
+python scripts/benchmark_engine.py "$@"
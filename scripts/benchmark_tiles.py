@@ -0,0 +1,64 @@
+import argparse
+import pathlib
+import sys
+import time
+
+# Run from the root of the project
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig  # noqa: E402
+from src.PlatformerGame.main.game_manager import GameManager  # noqa: E402
+from src.PyEng.main.engine import Engine  # noqa: E402
+from src.shared import api  # noqa: E402
+
+
+class BenchmarkConfig(BuildConfig):
+  """Runs the game without a window"""
+
+  headless = True
+
+
+def main():
+  parser = argparse.ArgumentParser(
+    description='Compare placing tiles one at a time and in bulk'
+  )
+  parser.add_argument('--width', type=int, default=300)
+  parser.add_argument('--height', type=int, default=200)
+  parser.add_argument(
+    '--track-changes',
+    action='store_true',
+    help='Record the changed regions, as the editor does with dirty rects',
+  )
+  args = parser.parse_args()
+
+  game_manager = GameManager(Engine.create(BenchmarkConfig))
+  grid = game_manager.current_session.get_scene().world_grid
+  grid.track_changes = args.track_changes
+  tiles = [
+    (x, y, api.TileType.DIRT if (x + y) % 3 else api.TileType.BUSH, 0, 0)
+    for x in range(args.width)
+    for y in range(args.height)
+  ]
+
+  def measure(name: str, place) -> float:
+    grid.reset()
+    start_time = time.perf_counter()
+    place()
+    elapsed = time.perf_counter() - start_time
+    print(
+      f'{name}: {elapsed:.3f}s, {len(tiles) / elapsed:.0f} tiles/s '
+      f'({grid.get_tile_count()} tiles)'
+    )
+    return elapsed
+
+  def create_each() -> None:
+    for tile in tiles:
+      grid.create_tile(*tile)
+
+  single_time = measure('create_tile', create_each)
+  bulk_time = measure('create_tiles', lambda: grid.create_tiles(tiles))
+  print(f'create_tiles is {single_time / bulk_time:.1f}x faster')
+
+
+if __name__ == '__main__':
+  main()
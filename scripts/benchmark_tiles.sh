@@ -0,0 +1,11 @@
+#!/bin/bash
+#
+# Measure placing tiles one at a time against placing them in bulk
+
+# Set failure conditions
+set -o errexit  # Fail on any error
+set -o pipefail # Trace ERR through pipes
+set -o errtrace # Trace ERR through sub-shell commands
+
+echo "Benchmarking the tile placement..."
+python scripts/benchmark_tiles.py "$@"
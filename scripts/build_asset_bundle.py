@@ -0,0 +1,24 @@
+import pathlib
+import sys
+
+import pygame
+
+# Run from the root of the project
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from src.PlatformerGame.repository import asset_bundle  # noqa: E402
+from src.PlatformerGame.repository.game_files import GameFiles  # noqa: E402
+
+
+def main():
+  # Images are converted to the display format when loaded
+  pygame.init()
+  pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+  registries = asset_bundle.build_bundle()
+  count = sum(len(registry.get_all()) for registry in registries.values())
+  print(f'Bundled {count} blueprints in {GameFiles.get_blueprint_bundle()}')
+
+
+if __name__ == '__main__':
+  main()
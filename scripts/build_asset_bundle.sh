@@ -0,0 +1,11 @@
+#!/bin/bash
+#
+# Build the blueprint asset bundle from the data folder
+
+# Set failure conditions
+set -o errexit  # Fail on any error
+set -o pipefail # Trace ERR through pipes
+set -o errtrace # Trace ERR through sub-shell commands
+
+echo "Building asset bundle..."
+python scripts/build_asset_bundle.py
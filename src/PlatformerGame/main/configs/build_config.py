@@ -27,6 +27,8 @@ class EditorConfig(GameConfig):
   title = f'Level Editor - Version: {GameConfig.version}'
   fullscreen = 0
   is_editor = True
+  show_grid = True
+  dirty_rects = True
 
   # World settings
   map_width = 10
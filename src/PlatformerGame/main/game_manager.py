@@ -2,11 +2,16 @@ from src.PlatformerGame.main.configs.game_config import GameConfig
 from src.PlatformerGame.main.game_state import GameState
 from src.PlatformerGame.main.session import GameSession
 from src.PlatformerGame.repository.game_database import BlueprintDatabase
+from src.PyEng.components.components import Phase
 from src.PyEng.components.components import SystemComponent
 from src.PyEng.main.engine import Engine
 
 
 class GameManager(SystemComponent):
+  # Queues the scene before the renderer draws the frame
+  phase = Phase.RENDER
+  priority = 0
+
   configs: GameConfig
   engine: Engine
   blueprint_db: BlueprintDatabase
@@ -40,5 +45,6 @@ class GameManager(SystemComponent):
       # in the renderer
       pass
 
-    # Update the current session which renders the world
+    # Update the current session which renders the world, the game
+    # components are simulated by the component manager
     self.current_session.update()
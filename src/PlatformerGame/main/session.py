@@ -10,6 +10,5 @@ class GameSession(GameComponent):
     return self.scene
 
   def update(self):
-    self.scene.update()
     self.scene.render()
     # self.renderer.render_scene(self.scene)
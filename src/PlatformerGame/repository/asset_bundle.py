@@ -0,0 +1,233 @@
+"""Cache of the loaded blueprints in a single file
+
+Loading the blueprints from data/ parses every info json file and decodes
+and scales every image. The bundle stores the result: the fields of every
+blueprint and the pixels of its scaled images, so later start ups only read
+one file, and only the images of the blueprints that are used. It is little
+endian:
+
+  header     magic (4s), version (u16), reserved (u16), source key (32s),
+             metadata size (u32)
+  metadata   utf-8 json: per registry, the fields of every blueprint and the
+             size of each of its images
+  pixels     the RGBA pixels of every image, in the order of the metadata
+
+The source key is a hash of the path, size and modification time of every
+file the blueprints are loaded from, and of the tile size, so the bundle is
+rebuilt whenever one of them changes. The files are listed by the data
+manifest, so checking the bundle does not walk data/.
+"""
+
+from concurrent import futures
+import dataclasses
+import enum
+import functools
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+import struct
+from typing import Any
+
+import pygame
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PlatformerGame.repository import data_manifest
+from src.PlatformerGame.repository.blueprint_loader import BlueprintLoader
+from src.PlatformerGame.repository.blueprint_loader import EntityLoader
+from src.PlatformerGame.repository.blueprint_loader import ItemLoader
+from src.PlatformerGame.repository.blueprint_loader import TilesLoader
+from src.PlatformerGame.repository.game_components import Blueprint
+from src.PlatformerGame.repository.game_files import GameFiles
+from src.shared import io
+from src.shared.debug import LOGGER
+from src.shared.hash_registry import HashRegistry
+
+MAGIC = b'PBDL'
+VERSION = 1
+HEADER = struct.Struct('<4sHH32sI')
+PIXEL_FORMAT = 'RGBA'
+
+# Registries of the blueprint database and the loader of each one
+LOADERS: dict[str, type[BlueprintLoader]] = {
+  'entities': EntityLoader,
+  'tiles': TilesLoader,
+  'items': ItemLoader,
+}
+
+Registries = dict[str, HashRegistry[Any]]
+
+
+def get_source_key(
+  manifest: data_manifest.DataManifest, folders: list[pathlib.Path]
+) -> bytes:
+  key = hashlib.sha256()
+  tile_size = f'{BuildConfig.tile_width}x{BuildConfig.tile_height}'
+  key.update(f'{VERSION}:{tile_size}'.encode())
+  for folder in folders:
+    key.update(str(folder).encode())
+    # Files edited in place keep the modification time of their directory,
+    # so every file is still checked
+    for path in manifest.get_all_files(folder):
+      stat = os.stat(path)
+      key.update(f'{path}:{stat.st_size}:{stat.st_mtime_ns}'.encode())
+  return key.digest()
+
+
+def export_fields(blueprint: Blueprint) -> dict[str, Any]:
+  """Return the init fields of a blueprint as json values, without images"""
+  fields = {}
+  for field in dataclasses.fields(blueprint):
+    if field.init and field.name != 'images':
+      value = getattr(blueprint, field.name)
+      if isinstance(value, enum.Enum):
+        value = value.value
+      fields[field.name] = value
+  return fields
+
+
+def write_bundle(
+  file_path: pathlib.Path, key: bytes, registries: Registries
+) -> None:
+  metadata: dict[str, list[dict[str, Any]]] = {}
+  pixels = []
+  for name, registry in registries.items():
+    entries = metadata[name] = []
+    for blueprint in registry:
+      entries.append(
+        {
+          'fields': export_fields(blueprint),
+          'images': [list(image.get_size()) for image in blueprint.images],
+        }
+      )
+      pixels.extend(
+        pygame.image.tobytes(image, PIXEL_FORMAT) for image in blueprint.images
+      )
+
+  encoded = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+  file_path.parent.mkdir(parents=True, exist_ok=True)
+  with io.atomic_write(file_path) as temp_path:
+    with open(temp_path, 'wb') as f:
+      f.write(HEADER.pack(MAGIC, VERSION, 0, key, len(encoded)))
+      f.write(encoded)
+      f.writelines(pixels)
+
+
+def read_bundle(file_path: pathlib.Path, key: bytes) -> Registries | None:
+  """Return the registries stored in the bundle, or None if there is no
+  bundle or it was built from other sources.
+
+  The bundle is mapped in memory and only its metadata is read: every
+  blueprint is a lazy entry whose images are decoded on its first get.
+  """
+  try:
+    with open(file_path, 'rb') as f:
+      buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+  except (FileNotFoundError, ValueError):
+    # Empty files can not be mapped
+    return None
+
+  if len(buffer) < HEADER.size:
+    buffer.close()
+    return None
+  magic, version, _, bundle_key, metadata_size = HEADER.unpack_from(buffer, 0)
+  if magic != MAGIC or version != VERSION or bundle_key != key:
+    buffer.close()
+    return None
+
+  try:
+    return read_registries(buffer, metadata_size)
+  except (ValueError, json.JSONDecodeError, struct.error, KeyError) as error:
+    # A bundle cut short or damaged on disk is rebuilt like a stale one
+    LOGGER.warning(f'The blueprint bundle is corrupt: {error!r}')
+    buffer.close()
+    return None
+
+
+def read_registries(buffer: mmap.mmap, metadata_size: int) -> Registries:
+  offset = HEADER.size
+  metadata = json.loads(buffer[offset : offset + metadata_size])
+  offset += metadata_size
+
+  registries: Registries = {}
+  for name, loader in LOADERS.items():
+    registry: HashRegistry[Any] = HashRegistry(registry_name=name)
+    for entry in metadata.get(name, []):
+      registry.register_lazy(
+        entry['fields']['name'],
+        functools.partial(
+          create_blueprint, loader.blueprint_type, entry, buffer, offset
+        ),
+      )
+      offset += sum(
+        width * height * len(PIXEL_FORMAT) for width, height in entry['images']
+      )
+    registries[name] = registry
+
+  # The images are only decoded on first use, make sure they are all there
+  if offset > len(buffer):
+    raise ValueError(f'Pixels end at {offset}, the bundle at {len(buffer)}')
+  return registries
+
+
+def create_blueprint(
+  blueprint_type: type[Blueprint],
+  entry: dict[str, Any],
+  buffer: mmap.mmap,
+  offset: int,
+) -> Blueprint:
+  """Decode the images of a bundle entry and create its blueprint"""
+  display_set = pygame.display.get_surface() is not None
+  images = []
+  for width, height in entry['images']:
+    size = width * height * len(PIXEL_FORMAT)
+    image = pygame.image.frombytes(
+      buffer[offset : offset + size], (width, height), PIXEL_FORMAT
+    )
+    images.append(image.convert_alpha() if display_set else image)
+    offset += size
+
+  fields = dict(entry['fields'], images=list(range(len(images))))
+  return io.create_data_model(blueprint_type, fields, images.__getitem__)
+
+
+def get_folders() -> list[pathlib.Path]:
+  return [loader.folder for loader in LOADERS.values()]
+
+
+def get_key(manifest: data_manifest.DataManifest) -> bytes:
+  return get_source_key(manifest, get_folders())
+
+
+def build_bundle(
+  file_path: pathlib.Path | None = None,
+  manifest: data_manifest.DataManifest | None = None,
+) -> Registries:
+  """Load the registries from data/ and write them to the bundle"""
+  file_path = file_path or GameFiles.get_blueprint_bundle()
+  manifest = manifest or data_manifest.load_manifest(get_folders())
+  # Decoding the images is spread over the cores
+  with futures.ThreadPoolExecutor() as executor:
+    registries = {
+      name: loader.load(executor, manifest) for name, loader in LOADERS.items()
+    }
+  try:
+    write_bundle(file_path, get_key(manifest), registries)
+  except OSError as error:
+    LOGGER.warning(f'Could not write the blueprint bundle: {error!r}')
+  return registries
+
+
+def load_blueprints(file_path: pathlib.Path | None = None) -> Registries:
+  """Load the registries of the blueprint database from the bundle, and
+  build the bundle first if it is missing or out of date"""
+  file_path = file_path or GameFiles.get_blueprint_bundle()
+  manifest = data_manifest.load_manifest(get_folders())
+  key = get_key(manifest)
+  registries = read_bundle(file_path, key)
+  if registries is None:
+    built = build_bundle(file_path, manifest)
+    # Read the new bundle back so the blueprints are lazy from now on
+    registries = read_bundle(file_path, key) or built
+  return registries
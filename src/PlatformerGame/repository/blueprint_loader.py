@@ -1,7 +1,11 @@
+from concurrent import futures
 import dataclasses
 import pathlib
 from typing import Any
 
+import pygame
+
+from src.PlatformerGame.repository.data_manifest import DataManifest
 from src.PlatformerGame.repository.game_components import Blueprint
 from src.PlatformerGame.repository.game_components import EntityBlueprint
 from src.PlatformerGame.repository.game_components import ItemBlueprint
@@ -17,20 +21,62 @@ class BlueprintLoader:
   file_prefix: str
   blueprint_type: type[Blueprint]
   folder: pathlib.Path
+  # Lists the blueprint folders and their files without reading the disk
+  manifest: DataManifest | None = None
 
   def load_folder(
-    self, folder: pathlib.Path, repository: HashRegistry[Any]
+    self,
+    folder: pathlib.Path,
+    repository: HashRegistry[Any],
+    executor: futures.Executor | None = None,
   ) -> None:
-    if not folder.exists():
+    """Load every blueprint under folder into the repository, in the order of
+    their folder paths.
+
+    With an executor, the info files are read and the images decoded on its
+    workers, and only converting and scaling the images (which need the
+    display) is done on the calling thread.
+    """
+    if not self.folder_exists(folder):
       raise exceptions.FilePathNotFound(
         f'The following file path was not found: {folder}'
       )
 
-    for item in folder.iterdir():
+    blueprint_folders = self.find_blueprint_folders(folder)
+    if executor is None:
+      for blueprint_folder in blueprint_folders:
+        self.load_file(blueprint_folder, repository)
+      return
+
+    decoded = [
+      executor.submit(self.decode_folder, blueprint_folder)
+      for blueprint_folder in blueprint_folders
+    ]
+    for future in decoded:
+      json_data, images = future.result()
+      blueprint = io.create_data_model(
+        self.blueprint_type,
+        json_data,
+        lambda image: images[image].convert_alpha(),
+      )
+      repository.register(blueprint)
+
+  def folder_exists(self, folder: pathlib.Path) -> bool:
+    if self.manifest is not None:
+      return self.manifest.has_folder(folder)
+    return folder.exists()
+
+  def find_blueprint_folders(self, folder: pathlib.Path) -> list[pathlib.Path]:
+    if self.manifest is not None:
+      return self.manifest.get_blueprint_folders(folder)
+
+    blueprint_folders = []
+    for item in sorted(folder.iterdir()):
       if self.is_folder(item):
-        self.load_file(item, repository)
+        blueprint_folders.append(item)
       else:
-        self.load_folder(item, repository)
+        blueprint_folders.extend(self.find_blueprint_folders(item))
+    return blueprint_folders
 
   def load_file(
     self, folder: pathlib.Path, repository: HashRegistry[Blueprint]
@@ -39,6 +85,19 @@ class BlueprintLoader:
     blueprint = io.get_data_model(self.blueprint_type, info_json_file)
     repository.register(blueprint)
 
+  def decode_folder(
+    self, folder: pathlib.Path
+  ) -> tuple[dict[str, Any], dict[str, pygame.Surface]]:
+    """Read the info file of a blueprint folder and decode its images, by
+    file name. Does not need the display, so it can run on any thread"""
+    json_data = io.load_json(self.get_info_file(folder))
+    names = json_data.get('images', [])
+    images = {
+      name: pygame.image.load(folder / name)
+      for name in (names if isinstance(names, list) else [])
+    }
+    return json_data, images
+
   def is_folder(self, folder: pathlib.Path) -> bool:
     # Check if any file in the folder ends with .json
     return any(
@@ -47,7 +106,11 @@ class BlueprintLoader:
     )
 
   def get_info_file(self, folder: pathlib.Path) -> pathlib.Path:
-    for file in folder.iterdir():
+    if self.manifest is not None:
+      files = self.manifest.get_files(folder)
+    else:
+      files = list(folder.iterdir())
+    for file in files:
       if file.name.startswith(self.file_prefix):
         return file
 
@@ -61,12 +124,16 @@ class EntityLoader(BlueprintLoader):
   folder = GameFiles.get_entities_folder()
 
   @classmethod
-  def load(cls) -> HashRegistry[EntityBlueprint]:
+  def load(
+    cls,
+    executor: futures.Executor | None = None,
+    manifest: DataManifest | None = None,
+  ) -> HashRegistry[EntityBlueprint]:
     registry: HashRegistry[EntityBlueprint] = HashRegistry(
       registry_name='entities'
     )
-    loader = cls(cls.file_prefix, cls.blueprint_type, cls.folder)
-    loader.load_folder(loader.folder, registry)
+    loader = cls(cls.file_prefix, cls.blueprint_type, cls.folder, manifest)
+    loader.load_folder(loader.folder, registry, executor)
     return registry
 
 
@@ -77,10 +144,14 @@ class TilesLoader(BlueprintLoader):
   folder = GameFiles.get_tiles_folder()
 
   @classmethod
-  def load(cls) -> HashRegistry[TileBlueprint]:
+  def load(
+    cls,
+    executor: futures.Executor | None = None,
+    manifest: DataManifest | None = None,
+  ) -> HashRegistry[TileBlueprint]:
     registry: HashRegistry[TileBlueprint] = HashRegistry(registry_name='tiles')
-    loader = cls(cls.file_prefix, cls.blueprint_type, cls.folder)
-    loader.load_folder(loader.folder, registry)
+    loader = cls(cls.file_prefix, cls.blueprint_type, cls.folder, manifest)
+    loader.load_folder(loader.folder, registry, executor)
     return registry
 
 
@@ -91,8 +162,12 @@ class ItemLoader(BlueprintLoader):
   folder = GameFiles.get_items_folder()
 
   @classmethod
-  def load(cls) -> HashRegistry[ItemBlueprint]:
+  def load(
+    cls,
+    executor: futures.Executor | None = None,
+    manifest: DataManifest | None = None,
+  ) -> HashRegistry[ItemBlueprint]:
     registry: HashRegistry[ItemBlueprint] = HashRegistry(registry_name='items')
-    loader = cls(cls.file_prefix, cls.blueprint_type, cls.folder)
-    loader.load_folder(loader.folder, registry)
+    loader = cls(cls.file_prefix, cls.blueprint_type, cls.folder, manifest)
+    loader.load_folder(loader.folder, registry, executor)
     return registry
@@ -0,0 +1,171 @@
+"""Index of the blueprint folders under data/
+
+Finding the blueprints lists every folder under data/ and checks the type
+of every entry, which is slow on network disks. The manifest is built with a
+single os.scandir walk of the blueprint folders and saved next to the
+blueprint bundle. Later start ups only stat the directories it lists:
+adding, removing or renaming a file changes the modification time of its
+directory, and the walk is done again.
+"""
+
+from collections.abc import Iterable
+import dataclasses
+import os
+import pathlib
+from typing import Any
+
+from src.PlatformerGame.repository.game_files import GameFiles
+from src.PyEng.main.engine_files import EngineFiles
+from src.shared import io
+from src.shared.debug import LOGGER
+
+VERSION = 1
+
+
+@dataclasses.dataclass
+class DataManifest:
+  root: pathlib.Path
+  # Path of every directory walked, relative to root, and its modification
+  # time, or None if it does not exist
+  directories: dict[str, int | None]
+  # Path of every blueprint folder, relative to root, and its file names
+  blueprints: dict[str, list[str]]
+
+  def is_current(self) -> bool:
+    """Return whether no file was added, removed or renamed since the
+    manifest was built"""
+    return all(
+      get_mtime(self.root / path) == mtime
+      for path, mtime in self.directories.items()
+    )
+
+  def has_folder(self, folder: pathlib.Path) -> bool:
+    return self.directories.get(self.get_key(folder)) is not None
+
+  def get_key(self, folder: pathlib.Path) -> str:
+    return get_relative_path(folder, self.root)
+
+  def get_blueprint_folders(self, folder: pathlib.Path) -> list[pathlib.Path]:
+    """Return the blueprint folders under folder, sorted by path"""
+    key = self.get_key(folder)
+    prefix = '' if key == '.' else key + '/'
+    return sorted(
+      self.root / path
+      for path in self.blueprints
+      if path == key or path.startswith(prefix)
+    )
+
+  def get_files(self, folder: pathlib.Path) -> list[pathlib.Path]:
+    """Return the files of a blueprint folder"""
+    return [folder / name for name in self.blueprints[self.get_key(folder)]]
+
+  def get_all_files(self, folder: pathlib.Path) -> list[pathlib.Path]:
+    """Return the files of every blueprint folder under folder"""
+    return [
+      file
+      for blueprint_folder in self.get_blueprint_folders(folder)
+      for file in self.get_files(blueprint_folder)
+    ]
+
+  def export(self) -> dict[str, Any]:
+    return {
+      'version': VERSION,
+      'root': str(self.root),
+      'directories': self.directories,
+      'blueprints': self.blueprints,
+    }
+
+
+def get_relative_path(path: pathlib.Path, root: pathlib.Path) -> str:
+  return pathlib.Path(os.path.relpath(path, root)).as_posix()
+
+
+def get_mtime(path: pathlib.Path) -> int | None:
+  try:
+    return os.stat(path).st_mtime_ns
+  except FileNotFoundError:
+    return None
+
+
+def scan_folders(
+  root: pathlib.Path, folders: Iterable[pathlib.Path]
+) -> DataManifest:
+  """Walk the folders once and record every directory and blueprint folder
+  under them. A blueprint folder holds a json file, its sub folders are not
+  walked"""
+  directories: dict[str, int | None] = {}
+  blueprints: dict[str, list[str]] = {}
+  pending = [get_relative_path(folder, root) for folder in folders]
+  while pending:
+    path = pending.pop()
+    directory = root / path
+    directories[path] = get_mtime(directory)
+    if directories[path] is None:
+      continue
+
+    files = []
+    sub_folders = []
+    with os.scandir(directory) as entries:
+      for entry in entries:
+        if entry.is_dir():
+          sub_folders.append(entry.name)
+        elif entry.is_file():
+          files.append(entry.name)
+
+    if any(name.endswith('.json') for name in files):
+      blueprints[path] = sorted(files)
+    else:
+      prefix = '' if path == '.' else path + '/'
+      pending.extend(prefix + name for name in sub_folders)
+  return DataManifest(root, directories, blueprints)
+
+
+def read_manifest(
+  file_path: pathlib.Path, root: pathlib.Path
+) -> DataManifest | None:
+  """Return the saved manifest of root, or None if there is none"""
+  try:
+    data = io.load_json(file_path)
+  except Exception:
+    return None
+  if (
+    not isinstance(data, dict)
+    or data.get('version') != VERSION
+    or data.get('root') != str(root)
+  ):
+    return None
+  return DataManifest(root, data['directories'], data['blueprints'])
+
+
+def write_manifest(file_path: pathlib.Path, manifest: DataManifest) -> None:
+  file_path.parent.mkdir(parents=True, exist_ok=True)
+  with io.atomic_write(file_path) as temp_path:
+    io.write_json(temp_path, manifest.export(), compact=True)
+
+
+def load_manifest(
+  folders: Iterable[pathlib.Path],
+  file_path: pathlib.Path | None = None,
+  root: pathlib.Path | None = None,
+) -> DataManifest:
+  """Return the manifest of the folders under data/, walking them again and
+  saving the new manifest only if they changed"""
+  folders = list(folders)
+  file_path = file_path or GameFiles.get_data_manifest()
+  root = root or EngineFiles.DATA_FOLDER
+  manifest = read_manifest(file_path, root)
+  if (
+    manifest is not None
+    and all(
+      manifest.get_key(folder) in manifest.directories for folder in folders
+    )
+    and manifest.is_current()
+  ):
+    return manifest
+
+  manifest = scan_folders(root, folders)
+  try:
+    write_manifest(file_path, manifest)
+  except OSError as error:
+    LOGGER.warning(f'Could not write the data manifest: {error!r}')
+  return manifest
@@ -1,13 +1,21 @@
 import dataclasses
+from typing import TYPE_CHECKING
 
 import pygame
 
 from src.PlatformerGame.main.configs.build_config import BuildConfig
 from src.PlatformerGame.scene.tile import Tile
 from src.PlatformerGame.scene.world_grid import WorldGrid
+from src.PyEng.components.render import PREVIEW_LAYER
+from src.PyEng.main.engine import Engine
 from src.shared import api
 from src.shared.hash_registry import Registrable
 
+if TYPE_CHECKING:
+  from src.PyEng.components.camera import Camera
+
+PREVIEW_ALPHA = 100
+
 
 @dataclasses.dataclass
 class Blueprint(Registrable):
@@ -16,25 +24,41 @@ class Blueprint(Registrable):
   Group: the group this blueprint belongs (eg. tile, entities, crop)
   Layer: the layer that is rendered in (crops are rendered on top of tiles)
   Images: tuple containing the loaded images
+  Atlas: the texture atlas the images were packed into, if any
+  Source rects: the area of each image (variant) in the atlas
   """
 
   name: str
   group: str
   layer: int
   images: list[pygame.Surface]
+  atlas: pygame.Surface | None = dataclasses.field(default=None, init=False)
+  source_rects: list[pygame.Rect] = dataclasses.field(
+    default_factory=list, init=False
+  )
 
   def __post_init__(self):
-    # Scale images to the correct tile size
+    # Scale images to the correct tile size, images from the asset bundle
+    # already are
+    tile_size = (BuildConfig.tile_width, BuildConfig.tile_height)
     self.images = [
-      pygame.transform.scale(
-        image, (BuildConfig.tile_width, BuildConfig.tile_height)
-      )
+      image
+      if image.get_size() == tile_size
+      else pygame.transform.scale(image, tile_size)
       for image in self.images
     ]
 
   def get_name(self) -> str:
     return self.name
 
+  def set_atlas(
+    self, atlas: pygame.Surface, source_rects: list[pygame.Rect]
+  ) -> None:
+    # The images become views into the atlas so they share its pixels
+    self.atlas = atlas
+    self.source_rects = source_rects
+    self.images = [atlas.subsurface(rect) for rect in source_rects]
+
 
 @dataclasses.dataclass
 class EntityBlueprint(Blueprint):
@@ -51,6 +75,10 @@ class ItemBlueprint(Blueprint):
 @dataclasses.dataclass
 class TileBlueprint(Blueprint):
   tile_type: api.TileType
+  # Translucent copies of the variants, by variant: (source image, preview)
+  preview_images: dict[int, tuple[pygame.Surface, pygame.Surface]] = (
+    dataclasses.field(default_factory=dict, init=False, repr=False)
+  )
 
   def create_instance(
     self,
@@ -68,19 +96,36 @@ class TileBlueprint(Blueprint):
       layer,
     )
 
+  def get_preview_image(self, variant: int) -> pygame.Surface:
+    """Return the translucent version of a variant, created the first time
+    it is needed and again only if the variant image was replaced"""
+    image = self.images[variant]
+    cached = self.preview_images.get(variant)
+    if cached is not None and cached[0] is image:
+      return cached[1]
+
+    preview = image.copy()
+    preview.set_alpha(PREVIEW_ALPHA)
+    self.preview_images[variant] = (image, preview)
+    return preview
+
   def render_preview(
     self,
     screen: pygame.Surface,
     position_x: int,
     position_y: int,
     variant: int,
+    camera: 'Camera | None' = None,
   ) -> None:
-    image = self.images[variant].copy()
-    image.set_alpha(100)
-    screen.blit(
-      image,
-      (
-        position_x * BuildConfig.tile_width,
-        position_y * BuildConfig.tile_height,
-      ),
+    image = self.get_preview_image(variant)
+    screen_x = position_x * BuildConfig.tile_width
+    screen_y = position_y * BuildConfig.tile_height
+    if camera is not None:
+      # Drawn with the tiles, so it is scaled with them while zoomed
+      screen = camera.get_world_surface(screen)
+      screen_x, screen_y = camera.world_to_view(screen_x, screen_y)
+    engine = Engine.get_instance()
+    engine.renderer.add_to_render_group(
+      image, (screen_x, screen_y), screen, PREVIEW_LAYER
     )
+    engine.window.add_dirty_rect(image.get_rect(topleft=(screen_x, screen_y)))
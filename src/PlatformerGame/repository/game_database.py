@@ -1,6 +1,5 @@
-from src.PlatformerGame.repository.blueprint_loader import EntityLoader
-from src.PlatformerGame.repository.blueprint_loader import ItemLoader
-from src.PlatformerGame.repository.blueprint_loader import TilesLoader
+from src.PlatformerGame.repository import asset_bundle
+from src.PlatformerGame.repository.texture_atlas import AtlasPacker
 
 
 # Game Repository
@@ -8,6 +7,19 @@ class BlueprintDatabase:
   def __init__(self) -> None:
     # self.entities = EntityBlueprint()
     # HashRegistry it implements a iterable containing instances of Blueprint
-    self.entities = EntityLoader.load()
-    self.tiles = TilesLoader.load()
-    self.items = ItemLoader.load()
+    # The registries are read from the asset bundle, which is rebuilt from
+    # data/ when it changes
+    registries = asset_bundle.load_blueprints()
+    self.entities = registries['entities']
+    self.tiles = registries['tiles']
+    self.items = registries['items']
+
+    # Blueprints are created on their first use, their images are packed into
+    # shared atlases then
+    self.atlas_packer = AtlasPacker()
+    for registry in registries.values():
+      registry.add_load_hook(self.atlas_packer.add)
+      # Blueprints that were just built from data/ are already created
+      for name in registry.get_names():
+        if registry.is_loaded(name):
+          self.atlas_packer.add(registry.get(name))
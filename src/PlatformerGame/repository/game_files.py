@@ -7,6 +7,8 @@ class GameFiles:
   ITEMS_FOLDER = 'items'
   ENTITIES_FOLDER = 'entities'
   TILES_FOLDER = 'tiles'
+  BLUEPRINT_BUNDLE = 'blueprints.bundle'
+  DATA_MANIFEST = 'data_manifest.json'
 
   @staticmethod
   def get_items_folder() -> pathlib.Path:
@@ -19,3 +21,11 @@ class GameFiles:
   @staticmethod
   def get_tiles_folder() -> pathlib.Path:
     return EngineFiles.DATA_FOLDER / GameFiles.TILES_FOLDER
+
+  @staticmethod
+  def get_blueprint_bundle() -> pathlib.Path:
+    return EngineFiles.CACHE_FOLDER / GameFiles.BLUEPRINT_BUNDLE
+
+  @staticmethod
+  def get_data_manifest() -> pathlib.Path:
+    return EngineFiles.CACHE_FOLDER / GameFiles.DATA_MANIFEST
@@ -0,0 +1,106 @@
+from typing import TYPE_CHECKING
+
+import pygame
+
+from src.shared import exceptions
+
+if TYPE_CHECKING:
+  from src.PlatformerGame.repository.game_components import Blueprint
+
+ATLAS_SIZE = 1024
+
+
+class TextureAtlas:
+  """TextureAtlas
+
+  A single surface holding many images. Images are packed in rows (shelves)
+  from the top left corner, and each image is referenced by its source rect.
+  """
+
+  def __init__(self, width: int = ATLAS_SIZE, height: int = ATLAS_SIZE):
+    self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    # Converting needs a display, atlases built before it is set stay as is
+    if pygame.display.get_surface() is not None:
+      self.surface = self.surface.convert_alpha()
+    self.surface.fill((0, 0, 0, 0))
+    self.width = width
+    self.height = height
+    self.shelf_x = 0
+    self.shelf_y = 0
+    self.shelf_height = 0
+
+  def find_space(self, width: int, height: int) -> pygame.Rect | None:
+    if width > self.width:
+      return None
+
+    # Start a new shelf when the image does not fit in the current one
+    if self.shelf_x + width > self.width:
+      self.shelf_x = 0
+      self.shelf_y += self.shelf_height
+      self.shelf_height = 0
+
+    if self.shelf_y + height > self.height:
+      return None
+
+    rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+    self.shelf_x += width
+    self.shelf_height = max(self.shelf_height, height)
+    return rect
+
+
+class AtlasPacker:
+  """AtlasPacker
+
+  Packs blueprints into atlases one at a time, starting a new atlas when
+  the images of a blueprint do not fit in the last one.
+  """
+
+  def __init__(self, width: int = ATLAS_SIZE, height: int = ATLAS_SIZE):
+    self.width = width
+    self.height = height
+    self.atlases: list[TextureAtlas] = []
+
+  def add(self, blueprint: 'Blueprint') -> None:
+    images = blueprint.images
+    for image in images:
+      image_width, image_height = image.get_size()
+      if image_width > self.width or image_height > self.height:
+        raise exceptions.InvalidParameters(
+          f'Image of {blueprint.get_name()} is larger than the atlas',
+          {
+            'image_size': (image_width, image_height),
+            'atlas': (self.width, self.height),
+          },
+        )
+
+    # All the variants of a blueprint share the same atlas
+    atlas = self.atlases[-1] if self.atlases else None
+    rects = try_add_all(atlas, images) if atlas is not None else None
+    if rects is None:
+      atlas = TextureAtlas(self.width, self.height)
+      self.atlases.append(atlas)
+      rects = try_add_all(atlas, images)
+      if rects is None:
+        raise exceptions.InvalidParameters(
+          f'Images of {blueprint.get_name()} do not fit in a single atlas'
+        )
+
+    blueprint.set_atlas(atlas.surface, rects)
+
+
+def try_add_all(
+  atlas: TextureAtlas, images: list[pygame.Surface]
+) -> list[pygame.Rect] | None:
+  shelf = (atlas.shelf_x, atlas.shelf_y, atlas.shelf_height)
+  rects = []
+  for image in images:
+    rect = atlas.find_space(*image.get_size())
+    if rect is None:
+      # Roll back, the blueprint will go in a new atlas
+      atlas.shelf_x, atlas.shelf_y, atlas.shelf_height = shelf
+      return None
+    rects.append(rect)
+
+  for image, rect in zip(images, rects):
+    atlas.surface.blit(image, rect)
+  return rects
@@ -0,0 +1,112 @@
+import array
+from collections.abc import Iterator
+
+# Chunks are square and their size must be a power of two so world
+# coordinates can be split into chunk and local coordinates with bit operations
+CHUNK_SHIFT = 5
+CHUNK_SIZE = 1 << CHUNK_SHIFT
+CHUNK_MASK = CHUNK_SIZE - 1
+CHUNK_AREA = CHUNK_SIZE * CHUNK_SIZE
+
+# Blueprint id used for cells that do not hold a tile
+EMPTY_ID = 0
+
+
+def get_chunk_position(x: int, y: int) -> tuple[int, int]:
+  """Return the chunk coordinates containing the world cell (x, y)"""
+  return x >> CHUNK_SHIFT, y >> CHUNK_SHIFT
+
+
+def get_cell_index(x: int, y: int) -> int:
+  """Return the index of the world cell (x, y) inside its chunk arrays"""
+  return ((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)
+
+
+def iter_cells(
+  chunk_x: int, chunk_y: int, blueprint_ids: array.array, variants: array.array
+) -> Iterator[tuple[int, int, int, int]]:
+  """Yield (x, y, blueprint_id, variant) in world coordinates for every
+  non empty cell of the arrays of a chunk"""
+  origin_x = chunk_x << CHUNK_SHIFT
+  origin_y = chunk_y << CHUNK_SHIFT
+  for index, blueprint_id in enumerate(blueprint_ids):
+    if blueprint_id != EMPTY_ID:
+      yield (
+        origin_x + (index & CHUNK_MASK),
+        origin_y + (index >> CHUNK_SHIFT),
+        blueprint_id,
+        variants[index],
+      )
+
+
+class Chunk:
+  """Chunk
+
+  A CHUNK_SIZE x CHUNK_SIZE block of cells on a single layer. Instead of
+  holding Tile objects, every cell is two entries in flat arrays: the id of
+  the tile blueprint (EMPTY_ID when the cell is empty) and its image variant.
+  """
+
+  __slots__ = (
+    'chunk_x',
+    'chunk_y',
+    'layer',
+    'blueprint_ids',
+    'variants',
+    'tile_count',
+    'revision',
+  )
+
+  def __init__(self, chunk_x: int, chunk_y: int, layer: int) -> None:
+    self.chunk_x = chunk_x
+    self.chunk_y = chunk_y
+    self.layer = layer
+    self.blueprint_ids = array.array('H', bytes(2 * CHUNK_AREA))
+    self.variants = array.array('B', bytes(CHUNK_AREA))
+    self.tile_count = 0
+    # Incremented on every change, used to know if a chunk was edited
+    self.revision = 0
+
+  def load_cells(
+    self, blueprint_ids: array.array, variants: array.array
+  ) -> None:
+    """Replace every cell of the chunk with the given arrays"""
+    self.blueprint_ids = blueprint_ids
+    self.variants = variants
+    self.tile_count = CHUNK_AREA - blueprint_ids.count(EMPTY_ID)
+    self.revision += 1
+
+  def get_cell(self, index: int) -> tuple[int, int]:
+    return self.blueprint_ids[index], self.variants[index]
+
+  def set_cell(self, index: int, blueprint_id: int, variant: int) -> None:
+    if self.blueprint_ids[index] == EMPTY_ID:
+      self.tile_count += 1
+    self.blueprint_ids[index] = blueprint_id
+    self.variants[index] = variant
+    self.revision += 1
+
+  def clear_cell(self, index: int) -> tuple[int, int]:
+    """Empty the cell and return the (blueprint_id, variant) it held"""
+    blueprint_id = self.blueprint_ids[index]
+    variant = self.variants[index]
+    if blueprint_id != EMPTY_ID:
+      self.blueprint_ids[index] = EMPTY_ID
+      self.variants[index] = 0
+      self.tile_count -= 1
+      self.revision += 1
+    return blueprint_id, variant
+
+  def is_empty(self) -> bool:
+    return self.tile_count == 0
+
+  def get_origin(self) -> tuple[int, int]:
+    """Return the world coordinates of the top left cell of the chunk"""
+    return self.chunk_x << CHUNK_SHIFT, self.chunk_y << CHUNK_SHIFT
+
+  def iter_cells(self) -> Iterator[tuple[int, int, int, int]]:
+    """Yield (x, y, blueprint_id, variant) in world coordinates for every
+    non empty cell of the chunk"""
+    return iter_cells(
+      self.chunk_x, self.chunk_y, self.blueprint_ids, self.variants
+    )
@@ -0,0 +1,148 @@
+"""Append only journal of the edits made to a WorldGrid
+
+The journal lives next to the map it belongs to and holds every tile set
+or cleared since the map was last saved, so the edits can be replayed after
+a crash. It is little endian:
+
+  header    magic (4s), version (u16), reserved (u16)
+  records   op (u8) followed by
+              NAME   journal blueprint id (u16), name length (u16) + utf-8
+              SET    x (i32), y (i32), layer (i32), blueprint id (u16),
+                     variant (u8)
+              CLEAR  x (i32), y (i32), layer (i32)
+
+A blueprint id is declared with a NAME record before it is first used, so
+the journal does not depend on the ids of the grid that wrote it.
+"""
+
+from collections.abc import Callable
+from collections.abc import Iterator
+import pathlib
+import struct
+from typing import BinaryIO
+
+from src.shared import exceptions
+from src.shared.debug import LOGGER
+
+MAGIC = b'PJNL'
+VERSION = 1
+EXTENSION = '.journal'
+
+OP_NAME = 0
+OP_SET = 1
+OP_CLEAR = 2
+
+HEADER = struct.Struct('<4sHH')
+NAME_RECORD = struct.Struct('<BHH')
+SET_RECORD = struct.Struct('<BiiiHB')
+CLEAR_RECORD = struct.Struct('<Biii')
+
+# (op, x, y, layer, blueprint name, variant), the name and variant are only
+# set for OP_SET
+JournalEntry = tuple[int, int, int, int, str | None, int]
+
+
+def get_journal_path(map_path: pathlib.Path) -> pathlib.Path:
+  return map_path.with_name(map_path.name + EXTENSION)
+
+
+class EditJournal:
+  """EditJournal
+
+  Records are buffered in memory and appended to the file by flush, so the
+  cost of journaling only depends on the number of edits.
+  """
+
+  def __init__(
+    self, file_path: pathlib.Path, get_blueprint_name: Callable[[int], str]
+  ) -> None:
+    self.file_path = file_path
+    self.get_blueprint_name = get_blueprint_name
+    self.buffer = bytearray()
+    self.declared_ids: set[int] = set()
+    self.file: BinaryIO | None = None
+    # Number of edits since the journal was started
+    self.edit_count = 0
+
+  def open(self) -> None:
+    """Start a new, empty journal"""
+    self.close()
+    self.file = open(self.file_path, 'wb')
+    self.file.write(HEADER.pack(MAGIC, VERSION, 0))
+    self.file.flush()
+    self.buffer.clear()
+    self.declared_ids.clear()
+    self.edit_count = 0
+
+  def record_set(
+    self, x: int, y: int, layer: int, blueprint_id: int, variant: int
+  ) -> None:
+    if blueprint_id not in self.declared_ids:
+      encoded = self.get_blueprint_name(blueprint_id).encode('utf-8')
+      self.buffer += NAME_RECORD.pack(OP_NAME, blueprint_id, len(encoded))
+      self.buffer += encoded
+      self.declared_ids.add(blueprint_id)
+
+    self.buffer += SET_RECORD.pack(OP_SET, x, y, layer, blueprint_id, variant)
+    self.edit_count += 1
+
+  def record_clear(self, x: int, y: int, layer: int) -> None:
+    self.buffer += CLEAR_RECORD.pack(OP_CLEAR, x, y, layer)
+    self.edit_count += 1
+
+  def flush(self) -> None:
+    """Append the buffered records to the file. They only reach the
+    operating system, which is enough to survive a crash of the game"""
+    if self.buffer and self.file is not None:
+      self.file.write(self.buffer)
+      self.file.flush()
+      self.buffer.clear()
+
+  def close(self) -> None:
+    if self.file is not None:
+      self.flush()
+      self.file.close()
+      self.file = None
+
+
+def read_journal(file_path: pathlib.Path) -> Iterator[JournalEntry]:
+  """Yield the edits of a journal in the order they were made. A record cut
+  short by a crash ends the journal"""
+  data = file_path.read_bytes()
+  if len(data) < HEADER.size:
+    return
+
+  magic, version, _ = HEADER.unpack_from(data, 0)
+  if magic != MAGIC or version != VERSION:
+    raise exceptions.InvalidParameters(
+      'Unsupported journal file',
+      {'file': file_path, 'magic': magic, 'version': version},
+    )
+
+  names: dict[int, str] = {}
+  offset = HEADER.size
+  size = len(data)
+  while offset < size:
+    op = data[offset]
+    if op == OP_NAME and offset + NAME_RECORD.size <= size:
+      _, blueprint_id, length = NAME_RECORD.unpack_from(data, offset)
+      offset += NAME_RECORD.size
+      if offset + length > size:
+        break
+      names[blueprint_id] = data[offset : offset + length].decode('utf-8')
+      offset += length
+    elif op == OP_SET and offset + SET_RECORD.size <= size:
+      _, x, y, layer, blueprint_id, variant = SET_RECORD.unpack_from(
+        data, offset
+      )
+      offset += SET_RECORD.size
+      yield OP_SET, x, y, layer, names[blueprint_id], variant
+    elif op == OP_CLEAR and offset + CLEAR_RECORD.size <= size:
+      _, x, y, layer = CLEAR_RECORD.unpack_from(data, offset)
+      offset += CLEAR_RECORD.size
+      yield OP_CLEAR, x, y, layer, None, 0
+    else:
+      break
+
+  if offset < size:
+    LOGGER.warning(f'Ignoring the end of the damaged journal {file_path}')
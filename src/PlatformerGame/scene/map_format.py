@@ -0,0 +1,362 @@
+"""Binary map formats
+
+Both formats are little endian and every section starts on a 4 byte
+boundary, so the arrays can be used straight from a mmap with
+memoryview.cast or numpy.frombuffer.
+
+Version 1 (.bmap) stores the tiles of each layer as packed columns:
+
+  header        magic (4s), version (u16), reserved (u16),
+                blueprint count (u32)
+  blueprints    per blueprint: name length (u16) + utf-8 name, then padding
+  layer count   (u32)
+  layers        per layer: layer (i32), tile count (u32) followed by the
+                columns x (i32[n]), y (i32[n]), blueprint id (u16[n]) and
+                variant (u8[n]), each padded to 4 bytes
+
+Version 2 (.cmap) stores whole chunks behind an index, so single chunks can
+be read without parsing the rest of the file:
+
+  header        magic (4s), version (u16), chunk size (u16),
+                blueprint count (u32)
+  blueprints    same as version 1
+  chunk count   (u32)
+  index         per chunk: chunk x (i32), chunk y (i32), layer (i32) and the
+                offset of its data in the file (u64)
+  chunks        per chunk: blueprint ids (u16[size * size]) and variants
+                (u8[size * size])
+
+Blueprint ids are 1 based indexes into the blueprint table, 0 is an empty
+cell.
+"""
+
+import array
+import dataclasses
+import mmap
+import pathlib
+import struct
+import sys
+from typing import BinaryIO
+
+from src.PlatformerGame.scene.chunk import CHUNK_AREA
+from src.PlatformerGame.scene.chunk import CHUNK_SIZE
+from src.shared import exceptions
+
+MAGIC = b'PMAP'
+VERSION = 1
+CHUNKED_VERSION = 2
+BINARY_EXTENSIONS = ('.bmap',)
+CHUNKED_EXTENSIONS = ('.cmap',)
+
+HEADER = struct.Struct('<4sHHI')
+NAME_LENGTH = struct.Struct('<H')
+COUNT = struct.Struct('<I')
+LAYER_HEADER = struct.Struct('<iI')
+INDEX_ENTRY = struct.Struct('<iiiQ')
+CHUNK_DATA_SIZE = 3 * CHUNK_AREA
+
+
+@dataclasses.dataclass
+class LayerData:
+  layer: int
+  xs: array.array
+  ys: array.array
+  blueprint_ids: array.array
+  variants: array.array
+
+  @classmethod
+  def create(cls, layer: int) -> 'LayerData':
+    return cls(
+      layer,
+      array.array('i'),
+      array.array('i'),
+      array.array('H'),
+      array.array('B'),
+    )
+
+  def __len__(self) -> int:
+    return len(self.xs)
+
+
+@dataclasses.dataclass
+class MapData:
+  blueprint_names: list[str]
+  layers: list[LayerData]
+
+
+def is_binary_map(file_path: pathlib.Path) -> bool:
+  return file_path.suffix in BINARY_EXTENSIONS
+
+
+def is_chunked_map(file_path: pathlib.Path) -> bool:
+  return file_path.suffix in CHUNKED_EXTENSIONS
+
+
+def get_padding(size: int) -> bytes:
+  return bytes(-size % 4)
+
+
+def to_little_endian(column: array.array) -> bytes:
+  if sys.byteorder == 'big' and column.itemsize > 1:
+    column = array.array(column.typecode, column)
+    column.byteswap()
+  return column.tobytes()
+
+
+def write_blueprint_names(f: BinaryIO, blueprint_names: list[str]) -> int:
+  """Write the blueprint table and return its size in bytes"""
+  names_size = 0
+  for name in blueprint_names:
+    encoded = name.encode('utf-8')
+    f.write(NAME_LENGTH.pack(len(encoded)))
+    f.write(encoded)
+    names_size += NAME_LENGTH.size + len(encoded)
+
+  padding = get_padding(names_size)
+  f.write(padding)
+  return names_size + len(padding)
+
+
+def write_binary_map(file_path: pathlib.Path, map_data: MapData) -> None:
+  with open(file_path, 'wb') as f:
+    f.write(HEADER.pack(MAGIC, VERSION, 0, len(map_data.blueprint_names)))
+    write_blueprint_names(f, map_data.blueprint_names)
+
+    f.write(COUNT.pack(len(map_data.layers)))
+    for layer_data in map_data.layers:
+      f.write(LAYER_HEADER.pack(layer_data.layer, len(layer_data)))
+      for column in (
+        layer_data.xs,
+        layer_data.ys,
+        layer_data.blueprint_ids,
+        layer_data.variants,
+      ):
+        data = to_little_endian(column)
+        f.write(data)
+        f.write(get_padding(len(data)))
+
+
+def check_size(
+  buffer: mmap.mmap, offset: int, size: int, file_path: pathlib.Path
+) -> None:
+  if offset + size > len(buffer):
+    raise exceptions.InvalidParameters(
+      'Map file is truncated',
+      {'file': file_path, 'offset': offset, 'size': len(buffer)},
+    )
+
+
+def unpack(
+  section: struct.Struct,
+  buffer: mmap.mmap,
+  offset: int,
+  file_path: pathlib.Path,
+) -> tuple:
+  check_size(buffer, offset, section.size, file_path)
+  return section.unpack_from(buffer, offset)
+
+
+def check_blueprint_ids(
+  blueprint_ids: array.array, blueprint_count: int, file_path: pathlib.Path
+) -> None:
+  """Make sure every id points into the blueprint table"""
+  highest_id = max(blueprint_ids, default=0)
+  if highest_id > blueprint_count:
+    raise exceptions.InvalidParameters(
+      'Map file uses a blueprint missing from its blueprint table',
+      {
+        'file': file_path,
+        'blueprint_id': highest_id,
+        'blueprint_count': blueprint_count,
+      },
+    )
+
+
+def read_column(
+  buffer: mmap.mmap,
+  offset: int,
+  typecode: str,
+  count: int,
+  file_path: pathlib.Path,
+) -> tuple[array.array, int]:
+  """Copy a column out of the buffer and return it with the offset of the
+  next section"""
+  column = array.array(typecode)
+  size = column.itemsize * count
+  check_size(buffer, offset, size, file_path)
+
+  column.frombytes(buffer[offset : offset + size])
+  if sys.byteorder == 'big' and column.itemsize > 1:
+    column.byteswap()
+  return column, offset + size + len(get_padding(size))
+
+
+def open_map_buffer(file_path: pathlib.Path) -> tuple[BinaryIO, mmap.mmap]:
+  if not file_path.exists():
+    raise exceptions.FilePathNotFound(
+      f'The following file path was not found: {file_path}'
+    )
+
+  # Empty files can not be mapped
+  if file_path.stat().st_size < HEADER.size:
+    raise exceptions.InvalidParameters(
+      'Map file is truncated', {'file': file_path}
+    )
+
+  f = open(file_path, 'rb')
+  try:
+    return f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+  except (OSError, ValueError):
+    f.close()
+    raise
+
+
+def read_header(
+  buffer: mmap.mmap, file_path: pathlib.Path, expected_version: int
+) -> tuple[int, list[str], int]:
+  """Check the header and read the blueprint table. Returns the reserved
+  header field, the blueprint names and the offset of the next section"""
+  magic, version, reserved, blueprint_count = HEADER.unpack_from(buffer, 0)
+  if magic != MAGIC or version != expected_version:
+    raise exceptions.InvalidParameters(
+      'Unsupported map file',
+      {'file': file_path, 'magic': magic, 'version': version},
+    )
+
+  offset = HEADER.size
+  names_start = offset
+  blueprint_names = []
+  for _ in range(blueprint_count):
+    (length,) = unpack(NAME_LENGTH, buffer, offset, file_path)
+    offset += NAME_LENGTH.size
+    check_size(buffer, offset, length, file_path)
+    try:
+      name = buffer[offset : offset + length].decode('utf-8')
+    except UnicodeDecodeError as error:
+      raise exceptions.InvalidParameters(
+        'Map file has an invalid blueprint name',
+        {'file': file_path, 'offset': offset},
+      ) from error
+    blueprint_names.append(name)
+    offset += length
+  offset += len(get_padding(offset - names_start))
+  return reserved, blueprint_names, offset
+
+
+def read_binary_map(file_path: pathlib.Path) -> MapData:
+  f, buffer = open_map_buffer(file_path)
+  with f, buffer:
+    _, blueprint_names, offset = read_header(buffer, file_path, VERSION)
+
+    (layer_count,) = unpack(COUNT, buffer, offset, file_path)
+    offset += COUNT.size
+    layers = []
+    for _ in range(layer_count):
+      layer, tile_count = unpack(LAYER_HEADER, buffer, offset, file_path)
+      offset += LAYER_HEADER.size
+      xs, offset = read_column(buffer, offset, 'i', tile_count, file_path)
+      ys, offset = read_column(buffer, offset, 'i', tile_count, file_path)
+      blueprint_ids, offset = read_column(
+        buffer, offset, 'H', tile_count, file_path
+      )
+      check_blueprint_ids(blueprint_ids, len(blueprint_names), file_path)
+      variants, offset = read_column(
+        buffer, offset, 'B', tile_count, file_path
+      )
+      layers.append(LayerData(layer, xs, ys, blueprint_ids, variants))
+
+  return MapData(blueprint_names, layers)
+
+
+@dataclasses.dataclass
+class ChunkData:
+  chunk_x: int
+  chunk_y: int
+  layer: int
+  blueprint_ids: array.array
+  variants: array.array
+
+
+def write_chunked_map(
+  file_path: pathlib.Path,
+  blueprint_names: list[str],
+  chunks: list[ChunkData],
+) -> None:
+  with open(file_path, 'wb') as f:
+    f.write(
+      HEADER.pack(MAGIC, CHUNKED_VERSION, CHUNK_SIZE, len(blueprint_names))
+    )
+    names_size = write_blueprint_names(f, blueprint_names)
+    f.write(COUNT.pack(len(chunks)))
+
+    index_size = len(chunks) * INDEX_ENTRY.size
+    index_padding = get_padding(index_size)
+    offset = HEADER.size + names_size + COUNT.size
+    offset += index_size + len(index_padding)
+    for chunk_data in chunks:
+      f.write(
+        INDEX_ENTRY.pack(
+          chunk_data.chunk_x, chunk_data.chunk_y, chunk_data.layer, offset
+        )
+      )
+      offset += CHUNK_DATA_SIZE
+    f.write(index_padding)
+
+    for chunk_data in chunks:
+      f.write(to_little_endian(chunk_data.blueprint_ids))
+      f.write(chunk_data.variants.tobytes())
+
+
+class ChunkedMapReader:
+  """ChunkedMapReader
+
+  Keeps a chunked map file mapped in memory and reads single chunks from it
+  through the index.
+  """
+
+  def __init__(self, file_path: pathlib.Path) -> None:
+    self.file_path = file_path
+    self.file, self.buffer = open_map_buffer(file_path)
+    try:
+      chunk_size, self.blueprint_names, offset = read_header(
+        self.buffer, file_path, CHUNKED_VERSION
+      )
+      if chunk_size != CHUNK_SIZE:
+        raise exceptions.InvalidParameters(
+          'Map file was saved with a different chunk size',
+          {'file': file_path, 'chunk_size': chunk_size},
+        )
+
+      (chunk_count,) = unpack(COUNT, self.buffer, offset, file_path)
+      offset += COUNT.size
+      self.index: dict[tuple[int, int, int], int] = {}
+      for _ in range(chunk_count):
+        chunk_x, chunk_y, layer, data_offset = unpack(
+          INDEX_ENTRY, self.buffer, offset, file_path
+        )
+        check_size(self.buffer, data_offset, CHUNK_DATA_SIZE, file_path)
+        self.index[(chunk_x, chunk_y, layer)] = data_offset
+        offset += INDEX_ENTRY.size
+    except Exception:
+      self.close()
+      raise
+
+    self.layers = sorted({layer for _, _, layer in self.index})
+
+  def read_chunk(self, key: tuple[int, int, int]) -> ChunkData:
+    offset = self.index[key]
+    blueprint_ids, offset = read_column(
+      self.buffer, offset, 'H', CHUNK_AREA, self.file_path
+    )
+    check_blueprint_ids(
+      blueprint_ids, len(self.blueprint_names), self.file_path
+    )
+    variants, _ = read_column(
+      self.buffer, offset, 'B', CHUNK_AREA, self.file_path
+    )
+    chunk_x, chunk_y, layer = key
+    return ChunkData(chunk_x, chunk_y, layer, blueprint_ids, variants)
+
+  def close(self) -> None:
+    self.buffer.close()
+    self.file.close()
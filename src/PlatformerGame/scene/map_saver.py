@@ -0,0 +1,180 @@
+from concurrent import futures
+import pathlib
+import time
+from typing import TYPE_CHECKING
+
+from src.PlatformerGame.scene import edit_journal
+from src.shared.debug import LOGGER
+
+if TYPE_CHECKING:
+  from src.PlatformerGame.scene.world_grid import WorldGrid
+
+
+class MapSaver:
+  """MapSaver
+
+  Saves a WorldGrid to its map file on a worker thread. With autosave, every
+  edit is also appended to a journal next to the map, and the journal is
+  compacted into a new map file once the editor is idle for idle_time
+  seconds or every compact_interval seconds while editing.
+
+  Compacting starts a new journal right away and keeps the previous one (as
+  .old) until the map file is written, so edits are never only in memory.
+  """
+
+  def __init__(
+    self,
+    grid: 'WorldGrid',
+    file_path: pathlib.Path,
+    autosave: bool = False,
+    idle_time: float = 5.0,
+    compact_interval: float = 60.0,
+  ) -> None:
+    self.grid = grid
+    self.file_path = file_path
+    self.idle_time = idle_time
+    self.compact_interval = compact_interval
+    self.executor = futures.ThreadPoolExecutor(max_workers=1)
+    self.pending_save: futures.Future[None] | None = None
+
+    self.journal: edit_journal.EditJournal | None = None
+    journal_path = edit_journal.get_journal_path(file_path)
+    self.old_journal_path = journal_path.with_name(journal_path.name + '.old')
+    if autosave:
+      self.journal = edit_journal.EditJournal(
+        journal_path, grid.get_blueprint_name
+      )
+
+    self.last_edit_count = 0
+    self.last_edit_time = time.monotonic()
+    self.last_compact_time = self.last_edit_time
+
+  def start(self) -> None:
+    """Start journaling. The grid is replaced by the map file and the edits
+    left in the journal by a crash, as autosave would overwrite the map with
+    the grid otherwise"""
+    if self.journal is None:
+      return
+
+    if self.has_journal_edits() or self.file_path.exists():
+      if self.has_journal_edits():
+        LOGGER.warning(f'Recovering unsaved edits of {self.file_path}')
+      try:
+        self.load()
+      except Exception as error:
+        # Saving the grid now would replace a map that could not be read
+        LOGGER.error(f'Autosave disabled, failed to load the map: {error!r}')
+        self.grid.journal = None
+        self.journal.close()
+        # Only the new, empty journal, the edits are kept in the old one
+        self.journal.file_path.unlink(missing_ok=True)
+        self.journal = None
+    else:
+      self.old_journal_path.unlink(missing_ok=True)
+      self.journal.open()
+      self.grid.journal = self.journal
+
+  def has_journal_edits(self) -> bool:
+    return any(
+      path.exists() and path.stat().st_size > edit_journal.HEADER.size
+      for path in (self.old_journal_path, self.journal.file_path)
+    )
+
+  def save(self) -> None:
+    if self.pending_save is not None:
+      LOGGER.warning(f'Still saving {self.file_path}')
+      return
+
+    # Copying the chunks is cheap, serialising and writing them is done by
+    # the worker
+    snapshot = self.grid.snapshot()
+    if self.journal is not None:
+      self.rotate_journal()
+    self.pending_save = self.executor.submit(snapshot.save, self.file_path)
+    self.last_compact_time = time.monotonic()
+
+  def rotate_journal(self) -> None:
+    """Keep the edits of the current journal in the old journal until the
+    map file holds them, and start a new journal"""
+    self.journal.close()
+    journal_path = self.journal.file_path
+    if self.old_journal_path.exists() and journal_path.exists():
+      # The last save failed, the old journal still holds edits
+      with open(self.old_journal_path, 'ab') as f:
+        f.write(journal_path.read_bytes()[edit_journal.HEADER.size :])
+    elif journal_path.exists():
+      journal_path.replace(self.old_journal_path)
+    self.journal.open()
+    self.last_edit_count = 0
+
+  def load(self) -> None:
+    """Load the map file and replay the journals on top of it. Without a map
+    file the journals are replayed on top of the current grid"""
+    self.wait()
+    # Loading and replaying are not edits
+    self.grid.journal = None
+    try:
+      if self.file_path.exists():
+        self.grid.load(self.file_path)
+      else:
+        LOGGER.warning(f'{self.file_path} does not exist, keeping the grid')
+
+      if self.journal is not None:
+        self.journal.close()
+        for path in (self.old_journal_path, self.journal.file_path):
+          if path.exists():
+            self.grid.replay_journal(edit_journal.read_journal(path))
+    finally:
+      if self.journal is not None:
+        # Everything replayed is kept in the old journal until the next save
+        self.rotate_journal()
+        self.grid.journal = self.journal
+
+  def wait(self) -> None:
+    if self.pending_save is not None:
+      futures.wait([self.pending_save])
+      self.check_save()
+
+  def check_save(self) -> None:
+    if self.pending_save is None or not self.pending_save.done():
+      return
+
+    error = self.pending_save.exception()
+    self.pending_save = None
+    if error is not None:
+      LOGGER.error(f'Failed to save the map: {error!r}')
+      return
+
+    if self.journal is not None:
+      self.old_journal_path.unlink(missing_ok=True)
+    LOGGER.info(f'Saved {self.file_path}')
+
+  def update(self) -> None:
+    self.check_save()
+    if self.journal is None:
+      return
+
+    self.journal.flush()
+    now = time.monotonic()
+    edit_count = self.journal.edit_count
+    if edit_count != self.last_edit_count:
+      self.last_edit_count = edit_count
+      self.last_edit_time = now
+
+    if not edit_count or self.pending_save is not None:
+      return
+
+    if (
+      now - self.last_edit_time >= self.idle_time
+      or now - self.last_compact_time >= self.compact_interval
+    ):
+      self.save()
+
+  def close(self) -> None:
+    """Wait for the pending save and flush the journal, edits made after
+    closing are not recorded"""
+    self.wait()
+    if self.journal is not None:
+      self.grid.journal = None
+      self.journal.close()
+    self.executor.shutdown()
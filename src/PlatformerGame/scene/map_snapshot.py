@@ -0,0 +1,77 @@
+from collections.abc import Iterator
+import dataclasses
+import pathlib
+from typing import Any
+
+from src.PlatformerGame.scene import chunk
+from src.PlatformerGame.scene import map_format
+from src.shared import io
+
+
+@dataclasses.dataclass
+class MapSnapshot:
+  """MapSnapshot
+
+  The tiles of a WorldGrid at one point in time, as the blueprint table and
+  the arrays of every chunk. A snapshot does not reference the grid, so it can
+  be saved from another thread while the grid keeps changing.
+  """
+
+  blueprint_names: list[str]
+  chunks: list[map_format.ChunkData]
+
+  def iter_cells(self) -> Iterator[tuple[int, int, int, int, int]]:
+    """Yield (x, y, layer, blueprint_id, variant) for every tile"""
+    for chunk_data in self.chunks:
+      layer = chunk_data.layer
+      for x, y, blueprint_id, variant in chunk.iter_cells(
+        chunk_data.chunk_x,
+        chunk_data.chunk_y,
+        chunk_data.blueprint_ids,
+        chunk_data.variants,
+      ):
+        yield x, y, layer, blueprint_id, variant
+
+  def export_map_data(self) -> map_format.MapData:
+    layers: dict[int, map_format.LayerData] = {}
+    for x, y, layer, blueprint_id, variant in self.iter_cells():
+      layer_data = layers.get(layer)
+      if layer_data is None:
+        layer_data = layers[layer] = map_format.LayerData.create(layer)
+      layer_data.xs.append(x)
+      layer_data.ys.append(y)
+      layer_data.blueprint_ids.append(blueprint_id)
+      layer_data.variants.append(variant)
+    return map_format.MapData(self.blueprint_names, list(layers.values()))
+
+  def export_tiles(self) -> Iterator[dict[str, Any]]:
+    """Yield the same data as Tile.export for every tile"""
+    # Blueprint ids are 1 based
+    names = [''] + self.blueprint_names
+    for x, y, layer, blueprint_id, variant in self.iter_cells():
+      yield {
+        'position': {'x': x, 'y': y},
+        'variant': variant,
+        'layer': layer,
+        'tile_type': names[blueprint_id],
+      }
+
+  def export(self) -> dict[str, Any]:
+    return {'tile_map': self.export_tiles()}
+
+  def save(self, file_path: pathlib.Path, compact: bool = False) -> None:
+    """Save the tiles, as a binary or chunked map if the file has one of their
+    extensions or as json otherwise (without indentation if compact).
+
+    The file is replaced in one step once it is fully written, so a failed
+    save never leaves a partial map behind.
+    """
+    with io.atomic_write(file_path) as temp_path:
+      if map_format.is_chunked_map(file_path):
+        map_format.write_chunked_map(
+          temp_path, self.blueprint_names, self.chunks
+        )
+      elif map_format.is_binary_map(file_path):
+        map_format.write_binary_map(temp_path, self.export_map_data())
+      else:
+        io.stream_json(temp_path, self.export(), compact)
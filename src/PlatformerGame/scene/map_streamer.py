@@ -0,0 +1,145 @@
+from collections import OrderedDict
+import pathlib
+from typing import TYPE_CHECKING
+
+import pygame
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PlatformerGame.scene import chunk
+from src.PlatformerGame.scene import map_format
+
+if TYPE_CHECKING:
+  from src.PlatformerGame.scene.world_grid import WorldGrid
+
+# Revision stored for chunks that must never be evicted
+PINNED = -1
+
+
+class MapStreamer:
+  """MapStreamer
+
+  Loads the chunks of a chunked map file into a WorldGrid as the camera
+  gets close to them. Chunks in the view and a margin of prefetch_distance
+  chunks around it are kept resident. Once more than max_resident_chunks
+  are loaded, the least recently visible ones are evicted, unless they
+  were edited since they were loaded.
+  """
+
+  def __init__(
+    self,
+    grid: 'WorldGrid',
+    file_path: pathlib.Path,
+    prefetch_distance: int = 1,
+    max_resident_chunks: int = 256,
+  ) -> None:
+    self.grid = grid
+    self.reader = map_format.ChunkedMapReader(file_path)
+    self.prefetch_distance = prefetch_distance
+    self.max_resident_chunks = max_resident_chunks
+    # Chunks read from the file, oldest use first, with their revision
+    # right after loading
+    self.resident: OrderedDict[tuple[int, int, int], int] = OrderedDict()
+    # Blueprint ids of the file mapped to the ids of the grid
+    self.grid_ids = [chunk.EMPTY_ID] + [
+      grid.get_blueprint_id(grid.tile_blueprints.get(name))
+      for name in self.reader.blueprint_names
+    ]
+    self.identity_ids = self.grid_ids == list(range(len(self.grid_ids)))
+
+  def get_chunk_range(self, view: pygame.Rect) -> tuple[int, int, int, int]:
+    chunk_width = chunk.CHUNK_SIZE * BuildConfig.tile_width
+    chunk_height = chunk.CHUNK_SIZE * BuildConfig.tile_height
+    distance = self.prefetch_distance
+    return (
+      view.left // chunk_width - distance,
+      (view.right - 1) // chunk_width + distance,
+      view.top // chunk_height - distance,
+      (view.bottom - 1) // chunk_height + distance,
+    )
+
+  def update(self, view: pygame.Rect) -> None:
+    """Load the chunks around the view and evict the ones not used lately"""
+    first_x, last_x, first_y, last_y = self.get_chunk_range(view)
+    index = self.reader.index
+    in_range = 0
+    for layer in self.reader.layers:
+      for chunk_y in range(first_y, last_y + 1):
+        for chunk_x in range(first_x, last_x + 1):
+          key = (chunk_x, chunk_y, layer)
+          if key in self.resident:
+            self.resident.move_to_end(key)
+            in_range += 1
+          elif key in index:
+            self.load_chunk(key)
+            in_range += 1
+
+    # Chunks around the view are never evicted, even above the budget
+    self.evict(self.max_resident_chunks, in_range)
+
+  def ensure_loaded(self, key: tuple[int, int, int]) -> None:
+    """Load a chunk of the file before it is edited, so the edit does not
+    replace the tiles that were not streamed in yet"""
+    if key not in self.resident and key in self.reader.index:
+      self.load_chunk(key)
+
+  def load_chunk(self, key: tuple[int, int, int]) -> None:
+    chunk_x, chunk_y, layer = key
+    if self.grid.get_chunk(chunk_x, chunk_y, layer) is not None:
+      # Tiles were placed there before the chunk was streamed in, keep them
+      self.resident[key] = PINNED
+      return
+
+    chunk_data = self.read_chunk(key)
+    new_chunk = self.grid.add_chunk(chunk_x, chunk_y, layer)
+    new_chunk.load_cells(chunk_data.blueprint_ids, chunk_data.variants)
+    self.grid.dirty_chunks.add(key)
+    self.resident[key] = new_chunk.revision
+
+  def read_chunk(self, key: tuple[int, int, int]) -> map_format.ChunkData:
+    """Read a chunk of the file with the blueprint ids of the grid"""
+    chunk_data = self.reader.read_chunk(key)
+    if not self.identity_ids:
+      blueprint_ids = chunk_data.blueprint_ids
+      grid_ids = self.grid_ids
+      for index, blueprint_id in enumerate(blueprint_ids):
+        if blueprint_id != chunk.EMPTY_ID:
+          blueprint_ids[index] = grid_ids[blueprint_id]
+    return chunk_data
+
+  def read_unloaded_chunks(self) -> list[map_format.ChunkData]:
+    """Read the chunks that are only in the file, without loading them into
+    the grid"""
+    return [
+      self.read_chunk(key)
+      for key in self.reader.index
+      if key not in self.resident
+    ]
+
+  def evict(self, max_resident_chunks: int, in_use: int = 0) -> None:
+    """Evict the oldest chunks until at most max_resident_chunks are loaded.
+    The last in_use chunks are the ones around the view and always stay"""
+    excess = len(self.resident) - max_resident_chunks
+    if excess <= 0:
+      return
+
+    for key in list(self.resident)[: len(self.resident) - in_use]:
+      if excess <= 0:
+        break
+
+      revision = self.resident[key]
+      if revision == PINNED:
+        continue
+
+      # Edited chunks (including ones that were emptied and removed from the
+      # grid) stay, otherwise the edits would be lost
+      chunk_data = self.grid.get_chunk(*key)
+      if chunk_data is None or chunk_data.revision != revision:
+        self.resident[key] = PINNED
+        continue
+
+      self.grid.remove_chunk(*key)
+      del self.resident[key]
+      excess -= 1
+
+  def close(self) -> None:
+    self.reader.close()
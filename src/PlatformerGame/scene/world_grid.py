@@ -1,65 +1,314 @@
+import bisect
+from collections import OrderedDict
+from collections.abc import Iterable
+from collections.abc import Iterator
 import pathlib
+from typing import TYPE_CHECKING
 
 import pygame
 
 from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PlatformerGame.scene import chunk
+from src.PlatformerGame.scene import edit_journal
+from src.PlatformerGame.scene import map_format
+from src.PlatformerGame.scene.map_snapshot import MapSnapshot
+from src.PlatformerGame.scene.map_streamer import MapStreamer
 from src.PlatformerGame.scene.tile import Tile
 from src.PyEng.components.components import GameComponent
+from src.PyEng.components.physics import PhysicsEntity
+from src.PyEng.components.render import BACKGROUND_LAYER
 from src.PyEng.main.engine import Engine
 from src.shared import api
 from src.shared import io
 from src.shared import serialisers
 
+if TYPE_CHECKING:
+  from src.PlatformerGame.repository.game_components import TileBlueprint
+  from src.PyEng.components.camera import Camera
+
 
 class Scene(GameComponent):
   WORLD_SIZE = 10
 
   def __init__(self) -> None:
     GameComponent.__init__(self)
-    self.window = Engine.get_instance().window
+    self.engine = Engine.get_instance()
+    self.window = self.engine.window
+    self.renderer = self.engine.renderer
+    self.camera = self.components_manager.get_camera()
+    self.last_view: tuple[int, int, float] | None = None
+    # Zoomed view scaled to the size of the display
+    self.scaled_view: pygame.Surface | None = None
     self.world_grid = WorldGrid(self, Scene.WORLD_SIZE)
 
   def update(self):
     pass
 
   def render(self):
-    self.world_grid.render(self.window.display)
+    # Everything on screen changes when the camera moves or zooms
+    view = (*self.camera.get_offset(), self.camera.zoom)
+    if view != self.last_view or self.camera.zoom != 1:
+      self.window.mark_all_dirty()
+      self.last_view = view
+
+    if self.camera.zoom == 1:
+      self.world_grid.render(self.window.display, self.camera)
+      self.render_entities()
+      return
+
+    # Render the visible part of the world at its original size and scale it
+    # up (or down) to fill the display. The view has to be complete before it
+    # is scaled, so its queue is rendered straight away
+    view_surface = self.camera.get_view_surface()
+    view_surface.fill(self.window.background_colour)
+    self.world_grid.render(view_surface, self.camera)
+    self.render_entities()
+    self.renderer.render_surface(view_surface)
+    scaled_view = self.get_scaled_view()
+    pygame.transform.scale(view_surface, scaled_view.get_size(), scaled_view)
+    # Queued like the tiles at zoom 1, so it is drawn after the window cleared
+    # the regions redrawn this frame
+    self.renderer.add_to_render_group(
+      scaled_view, (0, 0), self.window.display, BACKGROUND_LAYER
+    )
+
+  def render_entities(self) -> None:
+    # Entities are drawn between their last two simulation steps
+    alpha = self.engine.get_alpha()
+    for entity in self.components_manager.get_game_components(PhysicsEntity):
+      entity.render(self.window.display, alpha)
+
+  def get_scaled_view(self) -> pygame.Surface:
+    display_size = self.window.display.get_size()
+    if self.scaled_view is None or self.scaled_view.get_size() != display_size:
+      self.scaled_view = pygame.Surface(display_size).convert()
+    return self.scaled_view
 
 
 class WorldGrid(GameComponent, serialisers.Serialiser):
+  """WorldGrid
+
+  Tiles are not stored as objects. The grid is split into chunks (one per
+  chunk position and layer) holding compact arrays of blueprint ids and
+  variants, and Tile objects are created on demand as views over a cell.
+
+  Each chunk is pre-rendered into a cached surface, which is only rebuilt
+  after a tile inside it was added or removed. Rendering only visits the
+  chunks that intersect the camera view, and the surfaces of chunks that
+  have not been drawn for a while are freed once there are more than
+  MAX_CHUNK_SURFACES of them.
+
+  Chunks are bucketed per layer and the list of layers is kept sorted as
+  chunks are added and removed, so rendering never has to sort.
+  """
+
+  # Chunk surfaces kept around once their chunks left the view
+  MAX_CHUNK_SURFACES = 64
+
   def __init__(self, scene: Scene, world_size: int) -> None:
     GameComponent.__init__(self)
-    self.tile_map: dict[tuple[int, int, int], Tile] = {}
+    self.layers: dict[int, dict[tuple[int, int], chunk.Chunk]] = {}
+    self.layer_order: list[int] = []
+    # Least recently drawn first, the oldest are evicted past the budget
+    self.chunk_surfaces: OrderedDict[
+      tuple[int, int, int], pygame.Surface
+    ] = OrderedDict()
+    self.dirty_chunks: set[tuple[int, int, int]] = set()
+    # Grid overlay, pre-rendered for the (screen size, tile size) in the key
+    self.show_grid = Engine.get_instance().configs.show_grid
+    self.grid_surface: pygame.Surface | None = None
+    self.grid_surface_key: tuple[int, int, int, int] | None = None
+    # Cells changed since the last render, in world pixels, reported to the
+    # window when it only redraws dirty rects
+    self.track_changes = scene.window.dirty_rects
+    self.changed_regions: list[pygame.Rect] = []
+    # Set while the chunks are streamed from a chunked map file
+    self.streamer: MapStreamer | None = None
+    # Set when autosave is on, every edit is recorded in it
+    self.journal: edit_journal.EditJournal | None = None
+    # Blueprint ids are local to the grid, id 0 is reserved for empty cells
+    self.blueprint_ids: dict[str, int] = {}
+    self.blueprints_by_id: list['TileBlueprint | None'] = [None]
     self.scene = scene
+    self.renderer = scene.renderer
     self.world_size = world_size
     game_manager_component = self.components_manager.get_game_manager()
     self.tile_blueprints = game_manager_component.get_blueprint_database().tiles
     self.setup_grid()
 
   def reset(self):
-    self.tile_map.clear()
+    self.stop_streaming()
+    self.layers.clear()
+    self.layer_order.clear()
+    self.chunk_surfaces.clear()
+    self.dirty_chunks.clear()
+    self.changed_regions.clear()
+    self.scene.window.mark_all_dirty()
 
-  def save(self, file_path: pathlib.Path) -> None:
-    output = io.export_data(self.export())
-    io.write_json(file_path, output)
+  def save(self, file_path: pathlib.Path, compact: bool = False) -> None:
+    """Save the grid, see MapSnapshot.save"""
+    self.snapshot(copy=False).save(file_path, compact)
 
   def load(self, file_path: pathlib.Path) -> None:
-    self.reset()
+    """Replace the grid with a map file. Chunked maps are streamed, their
+    chunks are loaded as the camera gets close to them"""
+    if map_format.is_chunked_map(file_path):
+      self.stream(file_path)
+      return
+
+    if map_format.is_binary_map(file_path):
+      self.import_map_data(map_format.read_binary_map(file_path))
+      return
+
     world_grid_data = io.load_model_from_json(file_path, api.WorldGridImport)
-    for tile_data in world_grid_data.tile_map:
-      self.create_tile(
+    self.reset()
+    self.create_tiles(
+      (
         tile_data.position.x,
         tile_data.position.y,
         tile_data.tile_type,
         tile_data.variant,
         tile_data.layer,
       )
+      for tile_data in world_grid_data.tile_map
+    )
+
+  def stream(
+    self,
+    file_path: pathlib.Path,
+    prefetch_distance: int = 1,
+    max_resident_chunks: int = 256,
+  ) -> None:
+    """Replace the grid with a chunked map whose chunks are only loaded when
+    the camera gets close to them"""
+    self.reset()
+    self.streamer = MapStreamer(
+      self, file_path, prefetch_distance, max_resident_chunks
+    )
+
+  def stop_streaming(self) -> None:
+    if self.streamer is not None:
+      self.streamer.close()
+      self.streamer = None
+
+  def get_blueprint_names(self) -> list[str]:
+    # The ids of the grid are used as they are, so the blueprint table is
+    # the list of blueprints by id without the empty id
+    return [blueprint.name for blueprint in self.blueprints_by_id[1:]]
+
+  def snapshot(self, copy: bool = True) -> MapSnapshot:
+    """Capture the tiles of the grid. The chunk arrays are copied unless copy
+    is False, in which case the snapshot is only valid until the next edit"""
+    chunks = [
+      map_format.ChunkData(
+        chunk_data.chunk_x,
+        chunk_data.chunk_y,
+        layer,
+        chunk_data.blueprint_ids[:] if copy else chunk_data.blueprint_ids,
+        chunk_data.variants[:] if copy else chunk_data.variants,
+      )
+      for layer in self.layer_order
+      for chunk_data in self.layers[layer].values()
+    ]
+    if self.streamer is not None:
+      # Chunks that were never streamed in are part of the map as well, they
+      # are copied from the file without being loaded into the grid
+      chunks.extend(self.streamer.read_unloaded_chunks())
+    return MapSnapshot(self.get_blueprint_names(), chunks)
+
+  def import_map_data(self, map_data: map_format.MapData) -> None:
+    self.reset()
+    # Resolve every blueprint of the file once
+    grid_ids = [chunk.EMPTY_ID] + [
+      self.get_blueprint_id(self.tile_blueprints.get(name))
+      for name in map_data.blueprint_names
+    ]
+    for layer_data in map_data.layers:
+      layer = layer_data.layer
+      self.set_cells(
+        (x, y, layer, grid_ids[blueprint_id], variant)
+        for x, y, blueprint_id, variant in zip(
+          layer_data.xs,
+          layer_data.ys,
+          layer_data.blueprint_ids,
+          layer_data.variants,
+        )
+      )
 
   def setup_grid(self):
-    for i in range(10):
-      # Create example tiles
-      self.create_tile(3 + i, 10, api.TileType.GRASS, 0, 0)
-      self.create_tile(10, 5 + i, api.TileType.DIRT, 0, 0)
+    # Create example tiles
+    self.create_tiles(
+      [(3 + i, 10, api.TileType.GRASS, 0, 0) for i in range(10)]
+      + [(10, 5 + i, api.TileType.DIRT, 0, 0) for i in range(10)]
+    )
+
+  def get_blueprint_id(self, blueprint: 'TileBlueprint') -> int:
+    blueprint_id = self.blueprint_ids.get(blueprint.name)
+    if blueprint_id is None:
+      blueprint_id = len(self.blueprints_by_id)
+      self.blueprint_ids[blueprint.name] = blueprint_id
+      self.blueprints_by_id.append(blueprint)
+    return blueprint_id
+
+  def get_blueprint_name(self, blueprint_id: int) -> str:
+    return self.blueprints_by_id[blueprint_id].name
+
+  def replay_journal(
+    self, entries: Iterable[edit_journal.JournalEntry]
+  ) -> None:
+    """Apply the edits read from a journal"""
+    for op, x, y, layer, name, variant in entries:
+      if op == edit_journal.OP_SET:
+        blueprint_id = self.get_blueprint_id(self.tile_blueprints.get(name))
+        self.set_cell(x, y, layer, blueprint_id, variant)
+      else:
+        self.remove_tile(x, y, layer)
+
+  def get_tile_count(self) -> int:
+    return sum(
+      chunk_data.tile_count
+      for layer_chunks in self.layers.values()
+      for chunk_data in layer_chunks.values()
+    )
+
+  def get_chunk(
+    self, chunk_x: int, chunk_y: int, layer: int
+  ) -> chunk.Chunk | None:
+    layer_chunks = self.layers.get(layer)
+    if layer_chunks is None:
+      return None
+    return layer_chunks.get((chunk_x, chunk_y))
+
+  def get_edited_chunk(
+    self, chunk_x: int, chunk_y: int, layer: int
+  ) -> chunk.Chunk | None:
+    """Same as get_chunk, but streams the chunk in first if it is only in
+    the map file"""
+    if self.streamer is not None:
+      self.streamer.ensure_loaded((chunk_x, chunk_y, layer))
+    return self.get_chunk(chunk_x, chunk_y, layer)
+
+  def add_chunk(self, chunk_x: int, chunk_y: int, layer: int) -> chunk.Chunk:
+    layer_chunks = self.layers.get(layer)
+    if layer_chunks is None:
+      layer_chunks = self.layers[layer] = {}
+      bisect.insort(self.layer_order, layer)
+
+    chunk_data = layer_chunks[(chunk_x, chunk_y)] = chunk.Chunk(
+      chunk_x, chunk_y, layer
+    )
+    return chunk_data
+
+  def remove_chunk(self, chunk_x: int, chunk_y: int, layer: int) -> None:
+    layer_chunks = self.layers[layer]
+    del layer_chunks[(chunk_x, chunk_y)]
+    if not layer_chunks:
+      del self.layers[layer]
+      self.layer_order.remove(layer)
+
+    key = (chunk_x, chunk_y, layer)
+    self.chunk_surfaces.pop(key, None)
+    self.dirty_chunks.discard(key)
 
   def create_tile(
     self,
@@ -76,13 +325,120 @@ class WorldGrid(GameComponent, serialisers.Serialiser):
     self.add_tile(tile)
     return tile
 
+  def create_tiles(
+    self, tiles: Iterable[tuple[int, int, api.TileType, int, int]]
+  ) -> int:
+    """Create many tiles at once, from (x, y, tile_type, variant, layer)
+    tuples (the arguments of create_tile). Returns the number of tiles
+    created.
+
+    Blueprints are resolved once per tile type and no Tile objects are
+    built, so this is much faster than calling create_tile in a loop.
+    """
+    blueprint_ids: dict[api.TileType, int] = {}
+
+    def resolve(tile_type: api.TileType) -> int:
+      blueprint_id = blueprint_ids[tile_type] = self.get_blueprint_id(
+        self.tile_blueprints.get(tile_type.value)
+      )
+      return blueprint_id
+
+    # Blueprint ids are never EMPTY_ID, so resolve only runs once per type
+    return self.set_cells(
+      (x, y, layer, blueprint_ids.get(tile_type) or resolve(tile_type), variant)
+      for x, y, tile_type, variant, layer in tiles
+    )
+
   def remove_tile(self, x: int, y: int, layer: int) -> Tile | None:
-    if (x, y, layer) in self.tile_map:
-      return self.tile_map.pop((x, y, layer))
-    return None
+    chunk_x, chunk_y = chunk.get_chunk_position(x, y)
+    chunk_data = self.get_edited_chunk(chunk_x, chunk_y, layer)
+    if chunk_data is None:
+      return None
+
+    blueprint_id, variant = chunk_data.clear_cell(chunk.get_cell_index(x, y))
+    if blueprint_id == chunk.EMPTY_ID:
+      return None
+
+    if self.track_changes:
+      self.add_changed_cell(x, y)
+    if self.journal is not None:
+      self.journal.record_clear(x, y, layer)
+
+    if chunk_data.is_empty():
+      self.remove_chunk(chunk_x, chunk_y, layer)
+    else:
+      self.dirty_chunks.add((chunk_x, chunk_y, layer))
+    return self.create_view(x, y, layer, blueprint_id, variant)
 
   def add_tile(self, tile: Tile) -> None:
-    self.tile_map.update({(tile.position.x, tile.position.y, tile.layer): tile})
+    x, y = tile.position
+    self.set_cell(
+      x, y, tile.layer, self.get_blueprint_id(tile.components), tile.variant
+    )
+
+  def set_cell(
+    self, x: int, y: int, layer: int, blueprint_id: int, variant: int
+  ) -> None:
+    """Store a tile by the id of its blueprint in this grid"""
+    chunk_x, chunk_y = chunk.get_chunk_position(x, y)
+    chunk_data = self.get_edited_chunk(chunk_x, chunk_y, layer)
+    if chunk_data is None:
+      chunk_data = self.add_chunk(chunk_x, chunk_y, layer)
+
+    chunk_data.set_cell(chunk.get_cell_index(x, y), blueprint_id, variant)
+    self.dirty_chunks.add((chunk_x, chunk_y, layer))
+    if self.track_changes:
+      self.add_changed_cell(x, y)
+    if self.journal is not None:
+      self.journal.record_set(x, y, layer, blueprint_id, variant)
+
+  def set_cells(self, cells: Iterable[tuple[int, int, int, int, int]]) -> int:
+    """Store many tiles from (x, y, layer, blueprint_id, variant) tuples in
+    one pass and return how many were stored"""
+    shift = chunk.CHUNK_SHIFT
+    mask = chunk.CHUNK_MASK
+    touched_chunks = set()
+    last_key = None
+    chunk_data = None
+    count = 0
+    journal = self.journal
+    for x, y, layer, blueprint_id, variant in cells:
+      # Tiles usually come in runs on the same chunk
+      key = (x >> shift, y >> shift, layer)
+      if key != last_key:
+        chunk_data = self.get_edited_chunk(*key)
+        if chunk_data is None:
+          chunk_data = self.add_chunk(*key)
+        touched_chunks.add(key)
+        last_key = key
+      index = ((y & mask) << shift) | (x & mask)
+      chunk_data.set_cell(index, blueprint_id, variant)
+      if journal is not None:
+        journal.record_set(x, y, layer, blueprint_id, variant)
+      count += 1
+
+    self.dirty_chunks.update(touched_chunks)
+    if self.track_changes:
+      for chunk_x, chunk_y, _ in touched_chunks:
+        self.changed_regions.append(
+          pygame.Rect(
+            chunk_x * chunk.CHUNK_SIZE * BuildConfig.tile_width,
+            chunk_y * chunk.CHUNK_SIZE * BuildConfig.tile_height,
+            chunk.CHUNK_SIZE * BuildConfig.tile_width,
+            chunk.CHUNK_SIZE * BuildConfig.tile_height,
+          )
+        )
+    return count
+
+  def add_changed_cell(self, x: int, y: int) -> None:
+    self.changed_regions.append(
+      pygame.Rect(
+        x * BuildConfig.tile_width,
+        y * BuildConfig.tile_height,
+        BuildConfig.tile_width,
+        BuildConfig.tile_height,
+      )
+    )
 
   def get_tile_at(self, x: float, y: float, layer: int) -> Tile | None:
     if x > 0 and y > 0:
@@ -91,25 +447,170 @@ class WorldGrid(GameComponent, serialisers.Serialiser):
       return None
 
   def get_tile(self, x: int, y: int, layer: int) -> Tile | None:
-    return self.tile_map.get((x, y, layer))
+    chunk_x, chunk_y = chunk.get_chunk_position(x, y)
+    chunk_data = self.get_chunk(chunk_x, chunk_y, layer)
+    if chunk_data is None:
+      return None
+
+    blueprint_id, variant = chunk_data.get_cell(chunk.get_cell_index(x, y))
+    if blueprint_id == chunk.EMPTY_ID:
+      return None
+    return self.create_view(x, y, layer, blueprint_id, variant)
 
-  def draw_grid(self, screen: pygame.Surface):
-    for x in range(0, BuildConfig.window_width, BuildConfig.tile_width):
-      pygame.draw.line(
-        screen, (150, 150, 150), (x, 0), (x, BuildConfig.window_height)
+  def create_view(
+    self, x: int, y: int, layer: int, blueprint_id: int, variant: int
+  ) -> Tile:
+    """Create a Tile object for a cell of the grid.
+
+    The tile is a snapshot of the cell, changing it does not update the grid.
+    """
+    return Tile(
+      api.Position(x, y),
+      self,
+      self.blueprints_by_id[blueprint_id],
+      variant,
+      layer,
+    )
+
+  def iter_tiles(self) -> Iterator[Tile]:
+    for layer in self.layer_order:
+      for chunk_data in self.layers[layer].values():
+        for x, y, blueprint_id, variant in chunk_data.iter_cells():
+          yield self.create_view(x, y, layer, blueprint_id, variant)
+
+  def set_grid_visible(self, visible: bool) -> None:
+    self.show_grid = visible
+    self.scene.window.mark_all_dirty()
+
+  def toggle_grid(self) -> None:
+    self.set_grid_visible(not self.show_grid)
+
+  def build_grid_surface(self, width: int, height: int) -> pygame.Surface:
+    """Pre-render the grid lines on a transparent surface one tile larger
+    than the screen, so it can be shifted to follow the camera"""
+    tile_width = BuildConfig.tile_width
+    tile_height = BuildConfig.tile_height
+    surface_width = width + tile_width
+    surface_height = height + tile_height
+    surface = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
+    for x in range(0, surface_width, tile_width):
+      pygame.draw.line(surface, (150, 150, 150), (x, 0), (x, surface_height))
+
+    for y in range(0, surface_height, tile_height):
+      pygame.draw.line(surface, (150, 150, 150), (0, y), (surface_width, y))
+    return surface
+
+  def draw_grid(
+    self, screen: pygame.Surface, offset_x: int = 0, offset_y: int = 0
+  ):
+    if not self.show_grid:
+      return
+
+    width, height = screen.get_size()
+    key = (width, height, BuildConfig.tile_width, BuildConfig.tile_height)
+    if self.grid_surface is None or self.grid_surface_key != key:
+      self.grid_surface = self.build_grid_surface(width, height)
+      self.grid_surface_key = key
+
+    # Shift the lines so they stay aligned with the tiles when the view moves
+    self.renderer.add_to_render_group(
+      self.grid_surface,
+      (
+        -(offset_x % BuildConfig.tile_width),
+        -(offset_y % BuildConfig.tile_height),
+      ),
+      screen,
+      BACKGROUND_LAYER,
+    )
+
+  def build_chunk_surface(self, chunk_data: chunk.Chunk) -> pygame.Surface:
+    """Pre-render every tile of a chunk into its cached surface"""
+    key = (chunk_data.chunk_x, chunk_data.chunk_y, chunk_data.layer)
+    surface = self.chunk_surfaces.get(key)
+    if surface is None:
+      surface = pygame.Surface(
+        (
+          chunk.CHUNK_SIZE * BuildConfig.tile_width,
+          chunk.CHUNK_SIZE * BuildConfig.tile_height,
+        ),
+        pygame.SRCALPHA,
       )
+      self.chunk_surfaces[key] = surface
+    else:
+      surface.fill((0, 0, 0, 0))
 
-    for y in range(0, BuildConfig.window_height, BuildConfig.tile_height):
-      pygame.draw.line(
-        screen, (150, 150, 150), (0, y), (BuildConfig.window_width, y)
+    origin_x, origin_y = chunk_data.get_origin()
+    blueprints = self.blueprints_by_id
+    blit_sequence = []
+    for x, y, blueprint_id, variant in chunk_data.iter_cells():
+      blueprint = blueprints[blueprint_id]
+      position = (
+        (x - origin_x) * BuildConfig.tile_width,
+        (y - origin_y) * BuildConfig.tile_height,
       )
+      # Blit from the shared atlas when the blueprint was packed into one
+      if blueprint.atlas is not None:
+        blit_sequence.append(
+          (blueprint.atlas, position, blueprint.source_rects[variant])
+        )
+      else:
+        blit_sequence.append((blueprint.images[variant], position))
+
+    surface.blits(blit_sequence, doreturn=False)
+    return surface
+
+  def get_chunk_surface(self, chunk_data: chunk.Chunk) -> pygame.Surface:
+    key = (chunk_data.chunk_x, chunk_data.chunk_y, chunk_data.layer)
+    if key in self.dirty_chunks:
+      self.dirty_chunks.discard(key)
+      return self.build_chunk_surface(chunk_data)
+
+    surface = self.chunk_surfaces.get(key)
+    if surface is None:
+      return self.build_chunk_surface(chunk_data)
+    self.chunk_surfaces.move_to_end(key)
+    return surface
+
+  def evict_chunk_surfaces(self, in_view: int) -> None:
+    """Free the least recently drawn surfaces past MAX_CHUNK_SURFACES, the
+    last in_view surfaces were drawn this frame and always stay"""
+    excess = len(self.chunk_surfaces) - max(self.MAX_CHUNK_SURFACES, in_view)
+    for _ in range(excess):
+      self.chunk_surfaces.popitem(last=False)
+
+  def render(self, screen: pygame.Surface, camera: 'Camera') -> None:
+    view = camera.get_view_rect()
+    if self.streamer is not None:
+      self.streamer.update(view)
+    self.draw_grid(screen, view.x, view.y)
+
+    for region in self.changed_regions:
+      self.scene.window.add_dirty_rect(region.move(-view.x, -view.y))
+    self.changed_regions.clear()
+
+    # Range of chunks that intersect the view
+    chunk_width = chunk.CHUNK_SIZE * BuildConfig.tile_width
+    chunk_height = chunk.CHUNK_SIZE * BuildConfig.tile_height
+    first_chunk_x = view.left // chunk_width
+    last_chunk_x = (view.right - 1) // chunk_width
+    first_chunk_y = view.top // chunk_height
+    last_chunk_y = (view.bottom - 1) // chunk_height
 
-  def render(self, screen: pygame.Surface) -> None:
-    self.draw_grid(screen)
-    positions = sorted(self.tile_map.keys(), key=lambda position: position[2])
-    for position in positions:
-      if tile := self.tile_map.get(position):
-        tile.render_tile(screen)
+    in_view = 0
+    for layer in self.layer_order:
+      layer_chunks = self.layers[layer]
+      for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+        for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+          chunk_data = layer_chunks.get((chunk_x, chunk_y))
+          if chunk_data is not None:
+            in_view += 1
+            self.renderer.add_to_render_group(
+              self.get_chunk_surface(chunk_data),
+              (chunk_x * chunk_width - view.x, chunk_y * chunk_height - view.y),
+              screen,
+              layer,
+            )
+    self.evict_chunk_surfaces(in_view)
 
   def export(self):
-    return {'tile_map': [tile for tile in self.tile_map.values()]}
+    return self.snapshot(copy=False).export()
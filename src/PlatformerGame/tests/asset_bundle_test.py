@@ -0,0 +1,72 @@
+import pathlib
+
+import pygame
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PlatformerGame.repository import asset_bundle
+from src.PlatformerGame.repository.game_components import TileBlueprint
+from src.shared import api
+from src.shared.hash_registry import HashRegistry
+
+
+def make_registries() -> asset_bundle.Registries:
+  image = pygame.Surface((4, 4), pygame.SRCALPHA)
+  image.fill((10, 20, 30, 40))
+  tiles: HashRegistry[TileBlueprint] = HashRegistry(registry_name='tiles')
+  tiles.register(
+    TileBlueprint('dirt', 'tile', 0, [image, image], api.TileType.DIRT)
+  )
+  return {'tiles': tiles}
+
+
+class TestAssetBundle:
+  def test_bundle_round_trip(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'blueprints.bundle'
+    asset_bundle.write_bundle(file_path, bytes(32), make_registries())
+
+    registries = asset_bundle.read_bundle(file_path, bytes(32))
+
+    assert registries is not None
+    assert not registries['entities'].get_all()
+    dirt = registries['tiles'].get('dirt')
+    assert isinstance(dirt, TileBlueprint)
+    assert dirt.tile_type is api.TileType.DIRT
+    assert len(dirt.images) == 2
+    assert dirt.images[1].get_size() == (
+      BuildConfig.tile_width,
+      BuildConfig.tile_height,
+    )
+    assert dirt.images[1].get_at((0, 0)) == (10, 20, 30, 40)
+
+  def test_stale_bundle_is_ignored(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'blueprints.bundle'
+    asset_bundle.write_bundle(file_path, bytes(32), make_registries())
+
+    assert asset_bundle.read_bundle(file_path, b'\x01' * 32) is None
+    assert asset_bundle.read_bundle(tmp_path / 'missing', bytes(32)) is None
+
+  def test_blueprints_are_created_on_first_use(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'blueprints.bundle'
+    asset_bundle.write_bundle(file_path, bytes(32), make_registries())
+    registries = asset_bundle.read_bundle(file_path, bytes(32))
+    assert registries is not None
+    tiles = registries['tiles']
+    loaded = []
+    tiles.add_load_hook(loaded.append)
+
+    assert tiles.get_names() == ['dirt']
+    assert not tiles.is_loaded('dirt')
+
+    tiles.preload(['dirt'])
+    assert tiles.is_loaded('dirt')
+    assert loaded == [tiles.get('dirt')]
+
+  def test_corrupt_bundle_is_ignored(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'blueprints.bundle'
+    asset_bundle.write_bundle(file_path, bytes(32), make_registries())
+    data = file_path.read_bytes()
+
+    # Cut inside the metadata and inside the pixels
+    for size in (asset_bundle.HEADER.size + 10, len(data) - 1):
+      file_path.write_bytes(data[:size])
+      assert asset_bundle.read_bundle(file_path, bytes(32)) is None
@@ -0,0 +1,33 @@
+from concurrent import futures
+import time
+
+import pygame
+
+from src.PlatformerGame.repository.blueprint_loader import BlueprintLoader
+from src.PlatformerGame.repository.blueprint_loader import TilesLoader
+
+
+class TestBlueprintLoader:
+  def test_executor_matches_sequential_load(self, scene, monkeypatch):
+    sequential = TilesLoader.load().get_all()
+    folder_names = sorted(
+      path.name for path in TilesLoader.folder.iterdir() if path.is_dir()
+    )
+    decode_folder = BlueprintLoader.decode_folder
+
+    def decode_in_reverse(loader, folder):
+      # The first folders finish last
+      time.sleep(0.02 * (len(folder_names) - folder_names.index(folder.name)))
+      return decode_folder(loader, folder)
+
+    monkeypatch.setattr(BlueprintLoader, 'decode_folder', decode_in_reverse)
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+      threaded = TilesLoader.load(executor).get_all()
+
+    assert len(sequential) > 1
+    assert list(threaded) == list(sequential)
+    for name, blueprint in sequential.items():
+      assert threaded[name].tile_type is blueprint.tile_type
+      assert [
+        pygame.image.tobytes(image, 'RGBA') for image in threaded[name].images
+      ] == [pygame.image.tobytes(image, 'RGBA') for image in blueprint.images]
@@ -0,0 +1,32 @@
+from src.PlatformerGame.scene import chunk
+
+
+class TestChunk:
+  def test_chunk_position_handles_negative_cells(self):
+    assert chunk.get_chunk_position(0, 0) == (0, 0)
+    assert chunk.get_chunk_position(chunk.CHUNK_SIZE, 5) == (1, 0)
+    assert chunk.get_chunk_position(-1, -chunk.CHUNK_SIZE) == (-1, -1)
+    assert chunk.get_chunk_position(-chunk.CHUNK_SIZE - 1, 0) == (-2, 0)
+
+  def test_set_and_clear_cell(self):
+    chunk_data = chunk.Chunk(0, 0, 0)
+    index = chunk.get_cell_index(3, 4)
+
+    chunk_data.set_cell(index, 2, 1)
+    assert chunk_data.get_cell(index) == (2, 1)
+    assert chunk_data.tile_count == 1
+
+    # Overwriting a cell does not count as a new tile
+    chunk_data.set_cell(index, 3, 0)
+    assert chunk_data.tile_count == 1
+
+    assert chunk_data.clear_cell(index) == (3, 0)
+    assert chunk_data.get_cell(index) == (chunk.EMPTY_ID, 0)
+    assert chunk_data.is_empty()
+
+  def test_iter_cells_returns_world_coordinates(self):
+    chunk_data = chunk.Chunk(-1, 2, 1)
+    x, y = -3, 2 * chunk.CHUNK_SIZE + 7
+    chunk_data.set_cell(chunk.get_cell_index(x, y), 5, 2)
+
+    assert list(chunk_data.iter_cells()) == [(x, y, 5, 2)]
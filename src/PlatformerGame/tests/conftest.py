@@ -0,0 +1,28 @@
+import os
+import sys
+
+# Add the root of the project to sys.path
+sys.path.insert(
+  0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+)
+
+import pytest  # noqa: E402
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig  # noqa: E402
+from src.PlatformerGame.main.game_manager import GameManager  # noqa: E402
+from src.PyEng.main.engine import Engine  # noqa: E402
+
+
+class TestConfig(BuildConfig):
+  """Runs the game without a window"""
+
+  headless = True
+  fps = 0
+
+
+@pytest.fixture(scope='module')
+def scene():
+  Engine._Engine__instance = None
+  game_manager = GameManager(Engine.create(TestConfig))
+  yield game_manager.current_session.get_scene()
+  Engine._Engine__instance = None
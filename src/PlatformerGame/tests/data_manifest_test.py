@@ -0,0 +1,48 @@
+import pathlib
+
+from src.PlatformerGame.repository import data_manifest
+
+
+def make_data(root: pathlib.Path) -> pathlib.Path:
+  tiles = root / 'tiles'
+  for name in ('grass', 'dirt'):
+    (tiles / name).mkdir(parents=True)
+    (tiles / name / f'tile_info_{name}.json').write_text('{}')
+    (tiles / name / f'{name}.png').write_bytes(b'')
+  (tiles / 'empty').mkdir()
+  return tiles
+
+
+class TestDataManifest:
+  def test_scan_finds_blueprint_folders(self, tmp_path: pathlib.Path):
+    tiles = make_data(tmp_path)
+
+    manifest = data_manifest.scan_folders(tmp_path, [tiles])
+
+    assert manifest.get_blueprint_folders(tiles) == [
+      tiles / 'dirt',
+      tiles / 'grass',
+    ]
+    assert manifest.get_files(tiles / 'dirt') == [
+      tiles / 'dirt' / 'dirt.png',
+      tiles / 'dirt' / 'tile_info_dirt.json',
+    ]
+    assert manifest.has_folder(tiles)
+    assert not manifest.has_folder(tmp_path / 'items')
+
+  def test_saved_manifest_is_reused_until_a_file_is_added(
+    self, tmp_path: pathlib.Path
+  ):
+    tiles = make_data(tmp_path / 'data')
+    file_path = tmp_path / 'manifest.json'
+    root = tmp_path / 'data'
+    data_manifest.load_manifest([tiles], file_path, root)
+
+    saved = data_manifest.read_manifest(file_path, root)
+    assert saved is not None and saved.is_current()
+
+    (tiles / 'stone').mkdir()
+    (tiles / 'stone' / 'tile_info_stone.json').write_text('{}')
+    assert not saved.is_current()
+    manifest = data_manifest.load_manifest([tiles], file_path, root)
+    assert tiles / 'stone' in manifest.get_blueprint_folders(tiles)
@@ -0,0 +1,43 @@
+import pathlib
+
+from src.PlatformerGame.scene import edit_journal
+
+
+def make_journal(file_path: pathlib.Path) -> edit_journal.EditJournal:
+  names = {1: 'grass', 7: 'dirt'}
+  journal = edit_journal.EditJournal(file_path, names.__getitem__)
+  journal.open()
+  return journal
+
+
+class TestEditJournal:
+  def test_edits_are_read_back_in_order(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'map.map.journal'
+    journal = make_journal(file_path)
+    journal.record_set(-4, 3, 1, 7, 2)
+    journal.record_clear(-4, 3, 1)
+    journal.record_set(0, 0, 0, 1, 0)
+    journal.record_set(1, 0, 0, 7, 0)
+    journal.close()
+
+    assert list(edit_journal.read_journal(file_path)) == [
+      (edit_journal.OP_SET, -4, 3, 1, 'dirt', 2),
+      (edit_journal.OP_CLEAR, -4, 3, 1, None, 0),
+      (edit_journal.OP_SET, 0, 0, 0, 'grass', 0),
+      (edit_journal.OP_SET, 1, 0, 0, 'dirt', 0),
+    ]
+
+  def test_records_cut_by_a_crash_are_ignored(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'map.map.journal'
+    journal = make_journal(file_path)
+    journal.record_set(5, 6, 0, 1, 0)
+    journal.flush()
+    journal.record_set(7, 8, 0, 1, 0)
+    journal.flush()
+    journal.close()
+    data = file_path.read_bytes()
+    file_path.write_bytes(data[:-3])
+
+    assert list(edit_journal.read_journal(file_path)) == [
+      (edit_journal.OP_SET, 5, 6, 0, 'grass', 0),
+    ]
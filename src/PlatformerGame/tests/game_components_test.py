@@ -0,0 +1,47 @@
+import pygame
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PlatformerGame.repository import game_components
+from src.PlatformerGame.repository.game_components import TileBlueprint
+from src.shared import api
+
+TILE_SIZE = (BuildConfig.tile_width, BuildConfig.tile_height)
+
+
+def make_image(colour: tuple[int, int, int]) -> pygame.Surface:
+  image = pygame.Surface(TILE_SIZE, pygame.SRCALPHA)
+  image.fill(colour)
+  return image
+
+
+class TestTileBlueprint:
+  def test_preview_is_cached_per_variant(self):
+    blueprint = TileBlueprint(
+      'grass',
+      'tile',
+      0,
+      [make_image((0, 255, 0)), make_image((0, 0, 255))],
+      api.TileType.GRASS,
+    )
+
+    preview = blueprint.get_preview_image(0)
+
+    assert blueprint.get_preview_image(0) is preview
+    assert preview.get_alpha() == game_components.PREVIEW_ALPHA
+    assert preview.get_at((0, 0))[:3] == (0, 255, 0)
+    assert blueprint.get_preview_image(1) is not preview
+
+  def test_preview_is_rebuilt_after_set_atlas(self):
+    blueprint = TileBlueprint(
+      'grass', 'tile', 0, [make_image((0, 255, 0))], api.TileType.GRASS
+    )
+    preview = blueprint.get_preview_image(0)
+    atlas = pygame.Surface((64, 64), pygame.SRCALPHA)
+    atlas.fill((255, 0, 0))
+
+    blueprint.set_atlas(atlas, [pygame.Rect((16, 16), TILE_SIZE)])
+
+    rebuilt = blueprint.get_preview_image(0)
+    assert rebuilt is not preview
+    assert rebuilt.get_at((0, 0))[:3] == (255, 0, 0)
+    assert blueprint.get_preview_image(0) is rebuilt
@@ -0,0 +1,125 @@
+import array
+import pathlib
+
+import pytest
+
+from src.PlatformerGame.scene import chunk
+from src.PlatformerGame.scene import map_format
+from src.shared import exceptions
+
+
+class TestMapFormat:
+  def test_binary_map_round_trip(self, tmp_path: pathlib.Path):
+    layer = map_format.LayerData(
+      -1,
+      array.array('i', [0, -40, 1000000]),
+      array.array('i', [5, 3, -7]),
+      array.array('H', [1, 2, 1]),
+      array.array('B', [0, 3, 255]),
+    )
+    empty_layer = map_format.LayerData.create(2)
+    map_data = map_format.MapData(['grass', 'dirt'], [layer, empty_layer])
+    file_path = tmp_path / 'level.bmap'
+
+    map_format.write_binary_map(file_path, map_data)
+
+    assert map_format.read_binary_map(file_path) == map_data
+
+  def test_sections_are_aligned(self, tmp_path: pathlib.Path):
+    layer = map_format.LayerData(
+      0,
+      array.array('i', [1]),
+      array.array('i', [1]),
+      array.array('H', [1]),
+      array.array('B', [0]),
+    )
+    file_path = tmp_path / 'level.bmap'
+    map_data = map_format.MapData(['bush'], [layer])
+    map_format.write_binary_map(file_path, map_data)
+
+    assert file_path.stat().st_size % 4 == 0
+
+  def test_extension_selects_format(self):
+    assert map_format.is_binary_map(pathlib.Path('level.bmap'))
+    assert not map_format.is_binary_map(pathlib.Path('level.map'))
+
+  def test_invalid_file(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'level.bmap'
+    file_path.write_bytes(b'NOPE' + bytes(16))
+
+    with pytest.raises(exceptions.InvalidParameters):
+      map_format.read_binary_map(file_path)
+
+  def test_chunked_map_reads_single_chunks(self, tmp_path: pathlib.Path):
+    chunks = []
+    for chunk_x, layer in ((0, 0), (-3, 0), (0, 2)):
+      blueprint_ids = array.array('H', bytes(2 * chunk.CHUNK_AREA))
+      variants = array.array('B', bytes(chunk.CHUNK_AREA))
+      blueprint_ids[chunk_x + 10] = 2
+      variants[chunk_x + 10] = layer
+      chunks.append(
+        map_format.ChunkData(chunk_x, 1, layer, blueprint_ids, variants)
+      )
+    file_path = tmp_path / 'level.cmap'
+
+    map_format.write_chunked_map(file_path, ['grass', 'dirt'], chunks)
+
+    reader = map_format.ChunkedMapReader(file_path)
+    try:
+      assert reader.blueprint_names == ['grass', 'dirt']
+      assert reader.layers == [0, 2]
+      assert reader.read_chunk((-3, 1, 0)) == chunks[1]
+      assert reader.read_chunk((0, 1, 2)) == chunks[2]
+    finally:
+      reader.close()
+
+  def test_truncated_binary_map(self, tmp_path: pathlib.Path):
+    layer = map_format.LayerData(
+      0,
+      array.array('i', [1, 2]),
+      array.array('i', [1, 2]),
+      array.array('H', [1, 1]),
+      array.array('B', [0, 0]),
+    )
+    file_path = tmp_path / 'level.bmap'
+    map_data = map_format.MapData(['bush'], [layer])
+    map_format.write_binary_map(file_path, map_data)
+    data = file_path.read_bytes()
+
+    # Cut inside the blueprint table, the layer header and the columns
+    for size in (map_format.HEADER.size + 1, len(data) - 30, len(data) - 4):
+      file_path.write_bytes(data[:size])
+      with pytest.raises(exceptions.InvalidParameters, match='truncated'):
+        map_format.read_binary_map(file_path)
+
+  def test_unknown_blueprint_id(self, tmp_path: pathlib.Path):
+    layer = map_format.LayerData(
+      0,
+      array.array('i', [1]),
+      array.array('i', [1]),
+      array.array('H', [2]),
+      array.array('B', [0]),
+    )
+    file_path = tmp_path / 'level.bmap'
+    map_data = map_format.MapData(['bush'], [layer])
+    map_format.write_binary_map(file_path, map_data)
+
+    with pytest.raises(exceptions.InvalidParameters, match='blueprint'):
+      map_format.read_binary_map(file_path)
+
+  def test_truncated_chunked_map(self, tmp_path: pathlib.Path):
+    chunks = [
+      map_format.ChunkData(
+        0,
+        0,
+        0,
+        array.array('H', bytes(2 * chunk.CHUNK_AREA)),
+        array.array('B', bytes(chunk.CHUNK_AREA)),
+      )
+    ]
+    file_path = tmp_path / 'level.cmap'
+    map_format.write_chunked_map(file_path, ['grass'], chunks)
+    file_path.write_bytes(file_path.read_bytes()[:-1])
+
+    with pytest.raises(exceptions.InvalidParameters, match='truncated'):
+      map_format.ChunkedMapReader(file_path)
@@ -0,0 +1,111 @@
+import pathlib
+import threading
+from unittest import mock
+
+import pytest
+
+from src.PlatformerGame.scene import edit_journal
+from src.PlatformerGame.scene.map_saver import MapSaver
+from src.PlatformerGame.scene.map_snapshot import MapSnapshot
+from src.PlatformerGame.scene.world_grid import WorldGrid
+from src.shared import api
+from src.shared import io
+
+
+@pytest.fixture
+def grid(scene) -> WorldGrid:
+  grid = WorldGrid(scene, scene.WORLD_SIZE)
+  grid.reset()
+  grid.create_tile(1, 2, api.TileType.GRASS, 0, 0)
+  return grid
+
+
+def read_tiles(file_path: pathlib.Path) -> list[tuple[int, int, str]]:
+  return sorted(
+    (tile['position']['x'], tile['position']['y'], tile['tile_type'])
+    for tile in io.load_json(file_path)['tile_map']
+  )
+
+
+class TestMapSaver:
+  def test_saves_on_the_worker_thread(self, grid, tmp_path):
+    file_path = tmp_path / 'map.map'
+    saver = MapSaver(grid, file_path)
+    save_threads = []
+    save = MapSnapshot.save
+
+    def record_thread(snapshot, *args):
+      save_threads.append(threading.current_thread())
+      save(snapshot, *args)
+
+    with mock.patch.object(MapSnapshot, 'save', record_thread):
+      saver.save()
+      # The grid can keep changing while the snapshot is written
+      grid.create_tile(5, 5, api.TileType.DIRT, 0, 0)
+      saver.close()
+
+    assert save_threads and save_threads[0] is not threading.main_thread()
+    assert read_tiles(file_path) == [(1, 2, 'grass')]
+
+  def test_failed_save_keeps_the_map(self, grid, tmp_path):
+    file_path = tmp_path / 'map.map'
+    file_path.write_text('{"tile_map": []}')
+
+    def write_half(file_path, data, compact):
+      file_path.write_text('{"tile_map": [')
+      raise OSError('Disk full')
+
+    saver = MapSaver(grid, file_path)
+    with mock.patch(
+      'src.PlatformerGame.scene.map_snapshot.io.stream_json', write_half
+    ):
+      saver.save()
+      saver.wait()
+    saver.close()
+
+    assert saver.pending_save is None
+    assert file_path.read_text() == '{"tile_map": []}'
+    # The temporary file is removed as well
+    assert list(tmp_path.iterdir()) == [file_path]
+
+  def test_close_flushes_the_journal(self, grid, tmp_path):
+    file_path = tmp_path / 'map.map'
+    saver = MapSaver(grid, file_path, autosave=True)
+    saver.start()
+    grid.create_tile(3, 4, api.TileType.DIRT, 1, 0)
+
+    saver.close()
+
+    assert grid.journal is None
+    assert list(edit_journal.read_journal(saver.journal.file_path)) == [
+      (edit_journal.OP_SET, 3, 4, 0, 'dirt', 1)
+    ]
+
+  def test_legacy_map_is_loaded(self, grid, tmp_path):
+    # Maps saved before variants store the position as a list
+    file_path = tmp_path / 'map.map'
+    file_path.write_text(
+      '{"tile_map": [{"position": [7, 8], "layer": 0, "tile_type": "bush"}]}'
+    )
+    saver = MapSaver(grid, file_path, autosave=True)
+    saver.start()
+    saver.close()
+
+    assert saver.journal is not None
+    assert [
+      (tile.position.x, tile.position.y, tile.variant)
+      for tile in grid.iter_tiles()
+    ] == [(7, 8, 0)]
+
+  def test_missing_map_keeps_the_grid(self, grid, tmp_path):
+    file_path = tmp_path / 'map.map'
+    saver = MapSaver(grid, file_path)
+
+    with mock.patch('src.PlatformerGame.scene.map_saver.LOGGER') as logger:
+      saver.load()
+    saver.close()
+
+    logger.warning.assert_called_once()
+    assert [
+      (tile.position.x, tile.position.y) for tile in grid.iter_tiles()
+    ] == [(1, 2)]
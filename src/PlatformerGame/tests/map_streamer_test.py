@@ -0,0 +1,123 @@
+import array
+import pathlib
+
+import pygame
+import pytest
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PlatformerGame.scene import chunk
+from src.PlatformerGame.scene import map_format
+from src.PlatformerGame.scene.map_streamer import MapStreamer
+
+CHUNK_WIDTH = chunk.CHUNK_SIZE * BuildConfig.tile_width
+CHUNK_HEIGHT = chunk.CHUNK_SIZE * BuildConfig.tile_height
+
+
+class FakeBlueprint:
+  def __init__(self, name: str) -> None:
+    self.name = name
+
+
+class FakeGrid:
+  """The parts of WorldGrid used by the streamer"""
+
+  def __init__(self) -> None:
+    self.chunks: dict[tuple[int, int, int], chunk.Chunk] = {}
+    self.dirty_chunks: set[tuple[int, int, int]] = set()
+    self.tile_blueprints = {'grass': FakeBlueprint('grass')}
+    # Taken by a blueprint used before the map was streamed
+    self.blueprint_ids = {'dirt': 1}
+
+  def get_blueprint_id(self, blueprint: FakeBlueprint) -> int:
+    return self.blueprint_ids.setdefault(
+      blueprint.name, len(self.blueprint_ids) + 1
+    )
+
+  def get_chunk(
+    self, chunk_x: int, chunk_y: int, layer: int
+  ) -> chunk.Chunk | None:
+    return self.chunks.get((chunk_x, chunk_y, layer))
+
+  def add_chunk(self, chunk_x: int, chunk_y: int, layer: int) -> chunk.Chunk:
+    chunk_data = self.chunks[(chunk_x, chunk_y, layer)] = chunk.Chunk(
+      chunk_x, chunk_y, layer
+    )
+    return chunk_data
+
+  def remove_chunk(self, chunk_x: int, chunk_y: int, layer: int) -> None:
+    del self.chunks[(chunk_x, chunk_y, layer)]
+
+
+@pytest.fixture
+def map_path(tmp_path: pathlib.Path) -> pathlib.Path:
+  # A row of 10 chunks, each with a single grass tile in its first cell
+  chunks = []
+  for chunk_x in range(10):
+    blueprint_ids = array.array('H', bytes(2 * chunk.CHUNK_AREA))
+    blueprint_ids[0] = 1
+    variants = array.array('B', bytes(chunk.CHUNK_AREA))
+    chunks.append(map_format.ChunkData(chunk_x, 0, 0, blueprint_ids, variants))
+  file_path = tmp_path / 'level.cmap'
+  map_format.write_chunked_map(file_path, ['grass'], chunks)
+  return file_path
+
+
+def get_view(chunk_x: int) -> pygame.Rect:
+  return pygame.Rect(chunk_x * CHUNK_WIDTH, 0, CHUNK_WIDTH, CHUNK_HEIGHT)
+
+
+class TestMapStreamer:
+  def test_chunks_around_the_view_are_prefetched(self, map_path):
+    grid = FakeGrid()
+    streamer = MapStreamer(grid, map_path, prefetch_distance=1)
+    try:
+      streamer.update(get_view(0))
+
+      assert set(grid.chunks) == {(0, 0, 0), (1, 0, 0)}
+      # Blueprint ids of the file are mapped to the ids of the grid
+      assert grid.chunks[(1, 0, 0)].get_cell(0) == (2, 0)
+    finally:
+      streamer.close()
+
+  def test_clean_chunks_are_evicted(self, map_path):
+    grid = FakeGrid()
+    streamer = MapStreamer(
+      grid, map_path, prefetch_distance=1, max_resident_chunks=3
+    )
+    try:
+      streamer.update(get_view(0))
+      streamer.update(get_view(5))
+
+      assert set(grid.chunks) == {(4, 0, 0), (5, 0, 0), (6, 0, 0)}
+    finally:
+      streamer.close()
+
+  def test_edited_chunks_are_kept(self, map_path):
+    grid = FakeGrid()
+    streamer = MapStreamer(
+      grid, map_path, prefetch_distance=1, max_resident_chunks=3
+    )
+    try:
+      streamer.update(get_view(0))
+      grid.chunks[(0, 0, 0)].set_cell(5, 2, 0)
+      streamer.update(get_view(5))
+
+      assert set(grid.chunks) == {(0, 0, 0), (4, 0, 0), (5, 0, 0), (6, 0, 0)}
+      assert grid.chunks[(0, 0, 0)].get_cell(5) == (2, 0)
+    finally:
+      streamer.close()
+
+  def test_unloaded_chunks_are_read_without_loading(self, map_path):
+    grid = FakeGrid()
+    streamer = MapStreamer(grid, map_path, prefetch_distance=0)
+    try:
+      streamer.update(get_view(0))
+      unloaded = streamer.read_unloaded_chunks()
+
+      assert sorted(chunk_data.chunk_x for chunk_data in unloaded) == list(
+        range(1, 10)
+      )
+      assert all(chunk_data.blueprint_ids[0] == 2 for chunk_data in unloaded)
+      assert set(grid.chunks) == {(0, 0, 0)}
+    finally:
+      streamer.close()
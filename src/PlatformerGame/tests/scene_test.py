@@ -0,0 +1,68 @@
+import pygame
+import pytest
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PyEng.components.components import Phase
+from src.PyEng.components.physics import PhysicsEntity
+from src.shared import api
+
+
+def render_frame(scene) -> None:
+  scene.components_manager.update_phase(Phase.RENDER)
+
+
+@pytest.fixture(autouse=True)
+def reset_camera(scene):
+  yield
+  scene.camera.set_zoom(1)
+  scene.camera.set_position(0, 0)
+
+
+class TestScene:
+  @pytest.mark.parametrize('dirty_rects', [False, True])
+  def test_zoomed_world_is_drawn(self, scene, monkeypatch, dirty_rects):
+    # The editor redraws only the dirty rects, which clears the display
+    # right before the queue is rendered
+    window = scene.window
+    monkeypatch.setattr(window, 'dirty_rects', dirty_rects)
+    # Middle of the first grass tile of the example grid
+    world_x = 3 * BuildConfig.tile_width + BuildConfig.tile_width // 2
+    world_y = 10 * BuildConfig.tile_height + BuildConfig.tile_height // 2
+    window.mark_all_dirty()
+    render_frame(scene)
+    colour = window.display.get_at((world_x, world_y))
+    assert colour[:3] != window.background_colour
+
+    scene.camera.set_zoom(2)
+    render_frame(scene)
+
+    assert window.display.get_at((world_x * 2, world_y * 2)) == colour
+
+  def test_entities_and_previews_follow_the_zoom(self, scene):
+    window = scene.window
+    # Away from the tiles of the example grid
+    image = pygame.Surface((4, 4))
+    image.fill((255, 0, 0))
+    PhysicsEntity(200, 40, 'box', image)
+    blueprint = scene.world_grid.tile_blueprints.get(api.TileType.BUSH.value)
+    preview = blueprint.get_preview_image(0)
+    scene.camera.set_zoom(2)
+    scene.camera.set_position(10, 10)
+
+    blueprint.render_preview(window.display, 2, 5, 0, scene.camera)
+    render_frame(scene)
+
+    # Both are scaled with the tiles, at twice their distance to the camera
+    assert window.display.get_at((2 * 190 + 7, 2 * 30 + 7))[:3] == (255, 0, 0)
+    preview_x = 2 * (2 * BuildConfig.tile_width - 10)
+    preview_y = 2 * (5 * BuildConfig.tile_height - 10)
+    opaque = [
+      (x, y)
+      for x in range(preview.get_width())
+      for y in range(preview.get_height())
+      if preview.get_at((x, y)).a
+    ]
+    x, y = opaque[len(opaque) // 2]
+    assert window.display.get_at(
+      (preview_x + 2 * x, preview_y + 2 * y)
+    )[:3] != window.background_colour
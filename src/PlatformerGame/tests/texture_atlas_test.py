@@ -0,0 +1,58 @@
+import pygame
+import pytest
+
+from src.PlatformerGame.repository import texture_atlas
+from src.shared import exceptions
+
+
+class FakeBlueprint:
+  def __init__(self, name: str, *sizes: tuple[int, int]) -> None:
+    self.name = name
+    self.images = [pygame.Surface(size, pygame.SRCALPHA) for size in sizes]
+    self.atlas = None
+    self.source_rects: list[pygame.Rect] = []
+
+  def get_name(self) -> str:
+    return self.name
+
+  def set_atlas(self, atlas, source_rects) -> None:
+    self.atlas = atlas
+    self.source_rects = source_rects
+
+
+def pack(*blueprints: FakeBlueprint) -> list[texture_atlas.TextureAtlas]:
+  packer = texture_atlas.AtlasPacker(64, 64)
+  for blueprint in blueprints:
+    packer.add(blueprint)
+  return packer.atlases
+
+
+class TestTextureAtlas:
+  def test_blueprints_share_an_atlas(self):
+    grass = FakeBlueprint('grass', (16, 16), (16, 16))
+    dirt = FakeBlueprint('dirt', (16, 16))
+
+    atlases = pack(grass, dirt)
+
+    assert len(atlases) == 1
+    assert grass.atlas is dirt.atlas is atlases[0].surface
+    rects = grass.source_rects + dirt.source_rects
+    assert not any(
+      rect.colliderect(other)
+      for i, rect in enumerate(rects)
+      for other in rects[i + 1 :]
+    )
+
+  def test_new_atlas_when_full(self):
+    first = FakeBlueprint('first', (32, 32), (32, 32))
+    second = FakeBlueprint('second', (32, 32), (32, 32), (32, 32))
+
+    atlases = pack(first, second)
+
+    # The variants of a blueprint are never split across atlases
+    assert len(atlases) == 2
+    assert first.atlas is not second.atlas
+
+  def test_image_larger_than_atlas(self):
+    with pytest.raises(exceptions.InvalidParameters):
+      pack(FakeBlueprint('big', (128, 16)))
@@ -0,0 +1,232 @@
+import pathlib
+from unittest import mock
+
+import pygame
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PlatformerGame.scene import chunk
+from src.PlatformerGame.scene import edit_journal
+from src.PlatformerGame.scene.world_grid import WorldGrid
+from src.PyEng.components.render import BACKGROUND_LAYER
+from src.shared import api
+
+
+def make_grid(scene, journal_path: pathlib.Path) -> WorldGrid:
+  grid = WorldGrid(scene, scene.WORLD_SIZE)
+  grid.reset()
+  grid.track_changes = True
+  grid.journal = edit_journal.EditJournal(
+    journal_path, grid.get_blueprint_name
+  )
+  grid.journal.open()
+  return grid
+
+
+# Crosses chunk borders, negative coordinates, layers and overwrites a tile
+TILES = [
+  (
+    x,
+    y,
+    api.TileType.DIRT if (x + y) % 3 else api.TileType.GRASS,
+    x % 2,
+    layer,
+  )
+  for layer in (0, 1)
+  for x in range(-chunk.CHUNK_SIZE - 2, chunk.CHUNK_SIZE + 3, 3)
+  for y in (-1, 0, chunk.CHUNK_SIZE)
+] + [(0, 0, api.TileType.BUSH, 0, 0)]
+
+
+CHUNK_WIDTH = chunk.CHUNK_SIZE * BuildConfig.tile_width
+CHUNK_HEIGHT = chunk.CHUNK_SIZE * BuildConfig.tile_height
+
+
+def get_drawn_chunks(grid: WorldGrid, view: pygame.Rect) -> set[tuple]:
+  """Render the grid and return the chunks queued for drawing"""
+  camera = mock.Mock(get_view_rect=mock.Mock(return_value=view))
+  with mock.patch.object(grid.renderer, 'add_to_render_group') as add:
+    grid.render(pygame.Surface(view.size), camera)
+  return {
+    (
+      (position[0] + view.x) // CHUNK_WIDTH,
+      (position[1] + view.y) // CHUNK_HEIGHT,
+      layer,
+    )
+    for _, position, _, layer in (call.args for call in add.call_args_list)
+    if layer != BACKGROUND_LAYER
+  }
+
+
+class TestWorldGrid:
+  def test_create_tiles_matches_create_tile(self, scene, tmp_path):
+    single = make_grid(scene, tmp_path / 'single.journal')
+    for tile in TILES:
+      single.create_tile(*tile)
+    bulk = make_grid(scene, tmp_path / 'bulk.journal')
+
+    assert bulk.create_tiles(TILES) == len(TILES)
+
+    assert bulk.get_tile_count() == single.get_tile_count()
+    assert bulk.dirty_chunks == single.dirty_chunks
+    assert sorted(bulk.snapshot().export_tiles(), key=str) == sorted(
+      single.snapshot().export_tiles(), key=str
+    )
+    single.journal.close()
+    bulk.journal.close()
+    assert list(edit_journal.read_journal(bulk.journal.file_path)) == list(
+      edit_journal.read_journal(single.journal.file_path)
+    )
+    # The bulk path marks whole chunks, which cover every changed cell
+    assert all(
+      any(region.contains(cell) for region in bulk.changed_regions)
+      for cell in single.changed_regions
+    )
+    assert len(bulk.changed_regions) == len(bulk.dirty_chunks)
+
+  def test_set_cells_matches_set_cell(self, scene, tmp_path):
+    single = make_grid(scene, tmp_path / 'single.journal')
+    bulk = make_grid(scene, tmp_path / 'bulk.journal')
+    cells = [
+      (
+        x,
+        y,
+        layer,
+        single.get_blueprint_id(single.tile_blueprints.get(tile_type.value)),
+        variant,
+      )
+      for x, y, tile_type, variant, layer in TILES
+    ]
+    # Both grids share the blueprint ids
+    for blueprint in single.blueprints_by_id[1:]:
+      bulk.get_blueprint_id(blueprint)
+    for cell in cells:
+      single.set_cell(*cell)
+
+    assert bulk.set_cells(cells) == len(cells)
+
+    assert bulk.get_tile_count() == single.get_tile_count()
+    assert bulk.dirty_chunks == single.dirty_chunks
+    assert bulk.snapshot().chunks == single.snapshot().chunks
+
+  def test_only_chunks_in_the_view_are_drawn(self, scene, tmp_path):
+    grid = make_grid(scene, tmp_path / 'map.journal')
+    # One tile in every chunk around the origin
+    grid.create_tiles(
+      (
+        chunk_x * chunk.CHUNK_SIZE,
+        chunk_y * chunk.CHUNK_SIZE,
+        api.TileType.GRASS,
+        0,
+        0,
+      )
+      for chunk_x in range(-1, 3)
+      for chunk_y in range(-1, 3)
+    )
+
+    # A view ending on a chunk border does not reach the next chunk
+    view = pygame.Rect(0, 0, CHUNK_WIDTH, CHUNK_HEIGHT)
+    assert get_drawn_chunks(grid, view) == {(0, 0, 0)}
+
+    # A single pixel of a chunk is enough to draw it
+    view = pygame.Rect(-1, CHUNK_HEIGHT - 1, CHUNK_WIDTH, 2)
+    assert get_drawn_chunks(grid, view) == {
+      (-1, 0, 0),
+      (0, 0, 0),
+      (-1, 1, 0),
+      (0, 1, 0),
+    }
+
+  def test_edit_rebuilds_only_its_chunk(self, scene, tmp_path):
+    grid = make_grid(scene, tmp_path / 'map.journal')
+    grid.create_tile(0, 0, api.TileType.GRASS, 0, 0)
+    grid.create_tile(chunk.CHUNK_SIZE, 0, api.TileType.GRASS, 0, 0)
+    view = pygame.Rect(0, 0, 2 * CHUNK_WIDTH, CHUNK_HEIGHT)
+    get_drawn_chunks(grid, view)
+    assert not grid.dirty_chunks
+
+    grid.create_tile(chunk.CHUNK_SIZE + 1, 0, api.TileType.DIRT, 0, 0)
+
+    assert grid.dirty_chunks == {(1, 0, 0)}
+    surface = grid.chunk_surfaces[(1, 0, 0)]
+    assert surface.get_at((BuildConfig.tile_width, 0)).a == 0
+    with mock.patch.object(
+      grid, 'build_chunk_surface', wraps=grid.build_chunk_surface
+    ) as build:
+      get_drawn_chunks(grid, view)
+    assert [call.args[0].chunk_x for call in build.call_args_list] == [1]
+    assert grid.chunk_surfaces[(1, 0, 0)] is surface
+    assert surface.get_at((BuildConfig.tile_width, 0)).a != 0
+    assert not grid.dirty_chunks
+
+  def test_surfaces_out_of_the_view_are_evicted(
+    self, scene, tmp_path, monkeypatch
+  ):
+    monkeypatch.setattr(WorldGrid, 'MAX_CHUNK_SURFACES', 2)
+    grid = make_grid(scene, tmp_path / 'map.journal')
+    grid.create_tiles(
+      (chunk_x * chunk.CHUNK_SIZE, 0, api.TileType.GRASS, 0, 0)
+      for chunk_x in range(4)
+    )
+
+    # Panning along the row, the least recently drawn surfaces are freed
+    for chunk_x in range(4):
+      get_drawn_chunks(
+        grid, pygame.Rect(chunk_x * CHUNK_WIDTH, 0, CHUNK_WIDTH, CHUNK_HEIGHT)
+      )
+    assert list(grid.chunk_surfaces) == [(2, 0, 0), (3, 0, 0)]
+
+    # Chunks in the view are kept even past the budget
+    get_drawn_chunks(grid, pygame.Rect(0, 0, 3 * CHUNK_WIDTH, CHUNK_HEIGHT))
+    assert set(grid.chunk_surfaces) == {(0, 0, 0), (1, 0, 0), (2, 0, 0)}
+    # An evicted chunk keeps its tiles and is drawn again
+    assert grid.get_tile_count() == 4
+
+  def test_grid_overlay_is_cached(self, scene, tmp_path, monkeypatch):
+    grid = make_grid(scene, tmp_path / 'map.journal')
+    grid.set_grid_visible(True)
+    monkeypatch.setattr(grid.renderer, 'add_to_render_group', mock.Mock())
+    screen = pygame.Surface((100, 50))
+
+    grid.draw_grid(screen, 3, 4)
+    grid_surface = grid.grid_surface
+    grid.draw_grid(screen, 20, 30)
+
+    assert grid.grid_surface is grid_surface
+    assert grid_surface.get_size() == (
+      100 + BuildConfig.tile_width,
+      50 + BuildConfig.tile_height,
+    )
+
+    # Rebuilt when the view is resized
+    grid.draw_grid(pygame.Surface((200, 50)))
+    assert grid.grid_surface is not grid_surface
+    assert grid.grid_surface.get_width() == 200 + BuildConfig.tile_width
+
+    # Rebuilt when the tile size changes
+    grid_surface = grid.grid_surface
+    monkeypatch.setattr(BuildConfig, 'tile_width', 8)
+    grid.draw_grid(pygame.Surface((200, 50)))
+    assert grid.grid_surface is not grid_surface
+    assert grid.grid_surface.get_width() == 208
+
+  def test_layer_order_is_sorted(self, scene, tmp_path):
+    grid = make_grid(scene, tmp_path / 'map.journal')
+    for layer in (2, 0, 5, 1):
+      grid.create_tile(0, 0, api.TileType.GRASS, 0, layer)
+    grid.create_tile(chunk.CHUNK_SIZE, 0, api.TileType.DIRT, 0, 1)
+    assert grid.layer_order == [0, 1, 2, 5]
+
+    # Layers are dropped once their last chunk is removed
+    grid.remove_tile(0, 0, 5)
+    grid.remove_tile(0, 0, 1)
+    assert grid.layer_order == [0, 1, 2]
+    grid.remove_tile(chunk.CHUNK_SIZE, 0, 1)
+    assert grid.layer_order == [0, 2]
+
+    file_path = tmp_path / 'map.map'
+    grid.save(file_path)
+    loaded = make_grid(scene, tmp_path / 'loaded.journal')
+    loaded.create_tile(0, 0, api.TileType.GRASS, 0, 7)
+    loaded.load(file_path)
+    assert loaded.layer_order == [0, 2]
+    assert set(loaded.layers) == {0, 2}
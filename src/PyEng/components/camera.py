@@ -1,6 +1,109 @@
+import math
+from typing import Protocol
+
+import pygame
+
 from src.PyEng.components.components import SystemComponent
+from src.shared import api
+from src.shared import exceptions
+
+
+class CameraTarget(Protocol):
+  position: api.Position
 
 
 class Camera(SystemComponent):
-  def __init__(self):
+  """Camera
+
+  Keeps track of the part of the world that is visible on the display.
+  The position is the world pixel at the top left corner of the viewport,
+  a zoom above 1 shows a smaller part of the world scaled up.
+  """
+
+  def __init__(
+    self,
+    viewport_width: int,
+    viewport_height: int,
+    zoom: float = 1.0,
+    follow_speed: float = 1.0,
+  ):
     SystemComponent.__init__(self)
+    self.x = 0.0
+    self.y = 0.0
+    self.viewport_width = viewport_width
+    self.viewport_height = viewport_height
+    self.zoom = zoom
+    # Fraction of the distance to the target covered every frame (1 = snap)
+    self.follow_speed = follow_speed
+    self.target: CameraTarget | None = None
+    self.view_surface: pygame.Surface | None = None
+
+  def set_position(self, x: float, y: float) -> None:
+    self.x = x
+    self.y = y
+
+  def move(self, dx: float, dy: float) -> None:
+    self.x += dx
+    self.y += dy
+
+  def set_zoom(self, zoom: float) -> None:
+    if zoom <= 0:
+      raise exceptions.InvalidParameters(
+        f'Camera zoom must be positive, got: {zoom}'
+      )
+    self.zoom = zoom
+
+  def follow(self, target: CameraTarget | None) -> None:
+    self.target = target
+
+  def get_view_size(self) -> tuple[int, int]:
+    """Size of the visible part of the world in world pixels"""
+    return (
+      math.ceil(self.viewport_width / self.zoom),
+      math.ceil(self.viewport_height / self.zoom),
+    )
+
+  def get_offset(self) -> tuple[int, int]:
+    return int(self.x), int(self.y)
+
+  def get_view_rect(self) -> pygame.Rect:
+    return pygame.Rect(self.get_offset(), self.get_view_size())
+
+  def get_view_surface(self) -> pygame.Surface:
+    """Surface the size of the view that zoomed scenes are rendered into
+    before being scaled to the viewport. It is reused while the zoom does
+    not change."""
+    view_size = self.get_view_size()
+    if self.view_surface is None or self.view_surface.get_size() != view_size:
+      self.view_surface = pygame.Surface(view_size).convert_alpha()
+    return self.view_surface
+
+  def get_world_surface(self, display: pygame.Surface) -> pygame.Surface:
+    """Return the surface world positions are drawn on: the display, or the
+    view surface while zoomed, which is scaled to the display afterwards"""
+    if self.zoom == 1:
+      return display
+    return self.get_view_surface()
+
+  def world_to_view(self, x: float, y: float) -> tuple[float, float]:
+    """Position of a world point on the surface of get_world_surface"""
+    offset_x, offset_y = self.get_offset()
+    return x - offset_x, y - offset_y
+
+  def world_to_screen(self, x: float, y: float) -> tuple[float, float]:
+    offset_x, offset_y = self.get_offset()
+    return (x - offset_x) * self.zoom, (y - offset_y) * self.zoom
+
+  def screen_to_world(self, x: float, y: float) -> tuple[float, float]:
+    offset_x, offset_y = self.get_offset()
+    return x / self.zoom + offset_x, y / self.zoom + offset_y
+
+  def update(self):
+    if self.target is None:
+      return
+
+    view_width, view_height = self.get_view_size()
+    target_x = self.target.position.x - view_width / 2
+    target_y = self.target.position.y - view_height / 2
+    self.x += (target_x - self.x) * self.follow_speed
+    self.y += (target_y - self.y) * self.follow_speed
@@ -1,19 +1,42 @@
+import bisect
 from collections import defaultdict
-from typing import Any, TYPE_CHECKING
+from collections.abc import Iterator
+import enum
+import time
+from typing import Any, Self, TYPE_CHECKING, TypeVar
 
+from src.PyEng.utils.profiler import ComponentProfiler
 from src.shared import exceptions
 from src.shared.debug import LOGGER
 
 if TYPE_CHECKING:
   from src.PlatformerGame.main.game_manager import GameManager
+  from src.PyEng.components.camera import Camera
   from src.PyEng.components.input import Input
+  from src.PyEng.components.render import Render
   from src.PyEng.components.window import Window
 
+ComponentType = TypeVar('ComponentType')
+
+
+class Phase(enum.IntEnum):
+  """Parts of a frame, updated in this order"""
+
+  INPUT = 0
+  SIMULATE = 1
+  LATE_UPDATE = 2
+  RENDER = 3
+  PRESENT = 4
+
 
 class ComponentManager:  # Singleton
   """ComponentsManager
 
   This is a singleton component that handles all the system and game components
+
+  System components are updated in the phase they belong to, by increasing
+  priority and then in the order they were added. Game components are
+  updated in the simulate phase, one batch per type.
   """
 
   __instance: 'ComponentManager | None' = None
@@ -26,6 +49,20 @@ class ComponentManager:  # Singleton
   def __init__(self):
     self.system_components_by_name = {}
     self.game_components_by_name = defaultdict(list)
+    self.system_components_by_phase: dict[Phase, list[SystemComponent]] = {
+      phase: [] for phase in Phase
+    }
+    # Only set while profiling, so updates are not timed otherwise
+    self.profiler: ComponentProfiler | None = None
+
+  def enable_profiling(self, size: int = 120) -> ComponentProfiler:
+    """Time the update of every system component over the last size frames"""
+    if self.profiler is None:
+      self.profiler = ComponentProfiler(size)
+    return self.profiler
+
+  def disable_profiling(self) -> None:
+    self.profiler = None
 
   def add_element(self, component: 'Component') -> None:
     # Prevent duplicates of the system elements
@@ -33,6 +70,11 @@ class ComponentManager:  # Singleton
       if component.class_name not in self.system_components_by_name.keys():
         LOGGER.info(f'Adding component: {component}')
         self.system_components_by_name[component.class_name] = component
+        scheduled = self.system_components_by_phase[component.phase]
+        index = bisect.bisect_right(
+          scheduled, component.priority, key=lambda other: other.priority
+        )
+        scheduled.insert(index, component)
       else:
         raise exceptions.ComponentDuplicateError(
           f'Duplicate system component: {component.class_name}'
@@ -46,12 +88,48 @@ class ComponentManager:  # Singleton
       )
 
   def update(self) -> None:
-    for component in self.system_components_by_name.values():
+    """Update every phase of a frame once"""
+    for phase in Phase:
+      self.update_phase(phase)
+
+  def update_phase(self, phase: Phase) -> None:
+    if self.profiler is not None:
+      self.update_phase_profiled(phase, self.profiler)
+      return
+
+    for component in self.system_components_by_phase[phase]:
       component.update()
 
+    if phase is Phase.SIMULATE:
+      for components in self.game_components_by_name.values():
+        type(components[0]).update_batch(components)
+
+  def update_phase_profiled(
+    self, phase: Phase, profiler: ComponentProfiler
+  ) -> None:
+    clock = time.perf_counter
+    for component in self.system_components_by_phase[phase]:
+      start = clock()
+      component.update()
+      profiler.record(component.class_name, clock() - start)
+
+    if phase is Phase.SIMULATE:
+      for name, components in self.game_components_by_name.items():
+        start = clock()
+        type(components[0]).update_batch(components)
+        profiler.record(name, clock() - start)
+
   def get_system_components(self):
     return self.system_components_by_name.values()
 
+  def get_game_components(
+    self, component_type: type[ComponentType]
+  ) -> Iterator[ComponentType]:
+    """Yield every game component of a type, including its subclasses"""
+    for components in self.game_components_by_name.values():
+      if isinstance(components[0], component_type):
+        yield from components
+
   # TODO find a way to return correct type
   def get_by_class(self, class_name: str) -> Any:
     if class_name.lower() not in self.system_components_by_name.keys():
@@ -78,6 +156,22 @@ class ComponentManager:  # Singleton
     component = self.system_components_by_name[name.lower()]
     return component
 
+  def get_camera(self) -> 'Camera':
+    name = 'Camera'
+    if name.lower() not in self.system_components_by_name.keys():
+      raise exceptions.ComponentNotFoundError(f'Class name not found: {name}')
+
+    component = self.system_components_by_name[name.lower()]
+    return component
+
+  def get_render(self) -> 'Render':
+    name = 'Render'
+    if name.lower() not in self.system_components_by_name.keys():
+      raise exceptions.ComponentNotFoundError(f'Class name not found: {name}')
+
+    component = self.system_components_by_name[name.lower()]
+    return component
+
   def get_input(self) -> 'Input':
     name = 'Input'
     if name.lower() not in self.system_components_by_name.keys():
@@ -109,6 +203,9 @@ class SystemComponent(Component):  # Singleton
   """
 
   __instance = None
+  # When the component is updated in a frame, lower priorities first
+  phase = Phase.LATE_UPDATE
+  priority = 0
 
   def __new__(cls, *args, **kwargs):
     if cls.__instance is None:
@@ -126,5 +223,12 @@ class GameComponent(Component):
   def __init__(self, add=True):
     Component.__init__(self)
 
+  @classmethod
+  def update_batch(cls, components: list[Self]) -> None:
+    """Update every component of this type for one simulation step. Types
+    with many components can override it to avoid a call per component"""
+    for component in components:
+      component.update()
+
   def __repr__(self) -> str:
     return f"Game Component: '{self.__class__.__name__}()'"
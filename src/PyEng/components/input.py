@@ -1,10 +1,11 @@
+from collections.abc import Callable
 import pathlib
-import sys
 import time
 
 import pygame
 
 from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PyEng.components.components import Phase
 from src.PyEng.components.components import SystemComponent
 from src.shared import api
 from src.shared import io
@@ -44,6 +45,9 @@ class InputState:
 
 
 class Input(SystemComponent):
+  # Events are read before anything else uses them in the frame
+  phase = Phase.INPUT
+
   def __init__(
     self,
     key_mappings_path: pathlib.Path,
@@ -59,10 +63,15 @@ class Input(SystemComponent):
     }
     self.mapping_type = mapping_type
     self.modifier_keys = []
+    # Called when the window is closed or escape is pressed
+    self.quit_hooks: list[Callable[[], None]] = []
 
     self.keyboard = Keyboard(self.input)
     self.mouse = Mouse(self.input)
 
+  def add_quit_hook(self, hook: Callable[[], None]) -> None:
+    self.quit_hooks.append(hook)
+
   def pressed(
     self,
     key: key_mappings.MappingBase,
@@ -94,9 +103,12 @@ class Input(SystemComponent):
     ]
 
     for event in pygame.event.get():
-      if event.type == pygame.QUIT:
-        pygame.quit()
-        sys.exit()
+      if event.type == pygame.QUIT or (
+        event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+      ):
+        for hook in self.quit_hooks:
+          hook()
+        continue
 
       self.keyboard.update(event)
       self.mouse.update(event)
@@ -108,10 +120,6 @@ class Keyboard:
 
   def update(self, event: pygame.event.Event):
     if event.type == pygame.KEYDOWN:
-      if event.key == pygame.K_ESCAPE:
-        pygame.quit()
-        sys.exit()
-
       for state in self.input.values():
         if state.type == api.InputType.BUTTON and event.key == state.input_id:
           state.press()
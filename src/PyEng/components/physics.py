@@ -1,21 +1,72 @@
+from typing import Self
+
 import pygame
 
 from src.PyEng.components.components import GameComponent
+from src.PyEng.components.render import ENTITY_LAYER
 from src.shared.api import Position
 from src.shared.api import Velocity
 
 
 class PhysicsEntity(GameComponent):
-  def __init__(self, x: int, y: int, entity_type: str) -> None:
+  def __init__(
+    self,
+    x: int,
+    y: int,
+    entity_type: str,
+    image: pygame.Surface | None = None,
+  ) -> None:
     GameComponent.__init__(self)
     self.position = Position(x, y)
+    # Position before the last simulation step, to interpolate rendering
+    self.previous_position = Position(x, y)
     self.velocity = Velocity(0, 0)
     self.acceleration = Velocity(0, 0)
     self.entity_type = entity_type
+    self.image = image
 
   def update(self) -> None:
+    """Advance the entity by one fixed simulation step"""
+    self.previous_position = self.position
     self.acceleration += self.velocity
     self.position += self.acceleration
 
-  def render(self, screen: pygame.Surface) -> None:
-    pass
+  @classmethod
+  def update_batch(cls, components: list[Self]) -> None:
+    if cls.update is not PhysicsEntity.update:
+      # Subclasses with their own update are updated one at a time
+      super().update_batch(components)
+      return
+
+    # Same as update, without a method call per entity
+    for entity in components:
+      entity.previous_position = position = entity.position
+      entity.acceleration = acceleration = entity.acceleration + entity.velocity
+      entity.position = position + acceleration
+
+  def get_render_position(self, alpha: float) -> tuple[float, float]:
+    """Return the position between the last two simulation steps, alpha
+    being how far the frame is into the next step"""
+    previous = self.previous_position
+    return (
+      previous.x + (self.position.x - previous.x) * alpha,
+      previous.y + (self.position.y - previous.y) * alpha,
+    )
+
+  def render(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+    if self.image is None:
+      return
+
+    camera = self.components_manager.get_camera()
+    renderer = self.components_manager.get_render()
+    # Drawn with the tiles, so it is scaled with them while zoomed
+    screen_position = camera.world_to_view(*self.get_render_position(alpha))
+    renderer.add_to_render_group(
+      self.image,
+      screen_position,
+      camera.get_world_surface(screen),
+      ENTITY_LAYER,
+    )
+    self.components_manager.get_window().add_dirty_rect(
+      self.image.get_rect(topleft=screen_position)
+    )
@@ -1,18 +1,53 @@
+from collections.abc import Callable
+
 import pygame
 
+from src.PyEng.components.components import Phase
 from src.PyEng.components.components import SystemComponent
-from src.shared import api
 from src.shared.types import Coordinate
 
+# Layers used by the engine. Tiles are rendered on their own layer, which sits
+# between the background and the previews
+BACKGROUND_LAYER = -1000
+ENTITY_LAYER = 500
+PREVIEW_LAYER = 1000
+UI_LAYER = 2000
+
+# A draw command is the same tuple Surface.blits expects:
+# (image, position) or (image, position, area)
+BlitCommand = (
+  tuple[pygame.Surface, Coordinate]
+  | tuple[pygame.Surface, Coordinate, pygame.Rect | None]
+)
+
 
 class Render(SystemComponent):
-  """CURRENTLY NOT IN USE"""
+  """Render all the elements in the Window
+
+  Draw commands are queued during the frame, grouped by destination surface
+  and then by layer. When the queue is rendered every group is drawn with a
+  single Surface.blits call, lowest layer first, and the queue is reset.
+  """
 
-  """Render all the elements in the Window"""
+  # After the components of the render phase queued their draw commands
+  phase = Phase.RENDER
+  priority = 10
 
   def __init__(self) -> None:
     SystemComponent.__init__(self)
-    self.render_group: list[api.RenderObjects] = []
+    self.render_groups: dict[pygame.Surface, dict[int, list[BlitCommand]]] = {}
+    # Called every frame before the queue is rendered (eg. to prepare the
+    # destination surfaces)
+    self.pre_render_hooks: list[Callable[[], None]] = []
+
+    # Counters of the frame being rendered and totals of the last frame
+    self.draw_calls = 0
+    self.blit_count = 0
+    self.last_draw_calls = 0
+    self.last_blit_count = 0
+
+  def add_pre_render_hook(self, hook: Callable[[], None]) -> None:
+    self.pre_render_hooks.append(hook)
 
   def add_to_render_group(
     self,
@@ -20,29 +55,65 @@ class Render(SystemComponent):
     pos: Coordinate,
     dest_surf: pygame.Surface,
     layer: int,
+    area: pygame.Rect | None = None,
   ) -> None:
     """Function to add elements to be rendered into a queue
 
     Args:
         img (pygame.Surface): The image/Surface that will be rendered
         pos (Coordinate): The position to render (x, y)
-        dest_surf (pygame.Surface): The destination surface to render to (display, ui...)
-        layer (int, optional): The layer (order) to render to.
+        dest_surf (pygame.Surface): The destination surface to render to
+            (display, ui...)
+        layer (int): The layer (order) to render to.
+        area (pygame.Rect, optional): The part of the image to render
     """
-    self.render_group.append(
-      api.RenderObjects(
-        image=img,
-        position=pos,
-        destination_surface=dest_surf,
-        layer=layer,
-      )
-    )
+    layers = self.render_groups.get(dest_surf)
+    if layers is None:
+      layers = self.render_groups[dest_surf] = {}
+
+    commands = layers.get(layer)
+    if commands is None:
+      commands = layers[layer] = []
+
+    if area is None:
+      commands.append((img, pos))
+    else:
+      commands.append((img, pos, area))
+
+  def draw_layers(
+    self,
+    dest_surf: pygame.Surface,
+    layers: dict[int, list[BlitCommand]],
+  ) -> None:
+    for layer in sorted(layers):
+      commands = layers[layer]
+      dest_surf.blits(commands, doreturn=False)
+      self.draw_calls += 1
+      self.blit_count += len(commands)
+
+  def render_surface(self, dest_surf: pygame.Surface) -> None:
+    """Render and remove the queued commands of a single destination surface,
+    used when a surface has to be complete before the end of the frame"""
+    layers = self.render_groups.pop(dest_surf, None)
+    if layers is not None:
+      self.draw_layers(dest_surf, layers)
 
   def render(self):
-    """Render every element in the render group to its respective destination surface"""
-    for group in self.render_group:
-      dest_surf = group.destination_surface
-      dest_surf.blit(group.image, group.position)
+    """Render every element in the render group to its respective destination
+    surface and reset the queue"""
+    for hook in self.pre_render_hooks:
+      hook()
+
+    for dest_surf, layers in self.render_groups.items():
+      self.draw_layers(dest_surf, layers)
+    self.render_groups.clear()
+
+  def end_frame(self) -> None:
+    self.last_draw_calls = self.draw_calls
+    self.last_blit_count = self.blit_count
+    self.draw_calls = 0
+    self.blit_count = 0
 
   def update(self):
     self.render()
+    self.end_frame()
@@ -1,8 +1,10 @@
+import os
 import time
 
 import pygame
 
 from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PyEng.components.components import Phase
 from src.PyEng.components.components import SystemComponent
 
 
@@ -12,8 +14,23 @@ class Window(SystemComponent):
 
   Create a pygame window and it has the windows methods such as get_dt, update,
   clear, swap_buffers, etc...
+
+  The display is scaled to the screen without allocating a new surface every
+  frame. When the screen is an exact integer multiple of the display it is
+  scaled straight into the screen, otherwise into a preallocated buffer.
+
+  In dirty rect mode the display is not cleared every frame. Components
+  report the regions they changed (in display coordinates), and only the
+  bounding box of this frame's and last frame's regions is cleared, redrawn
+  and presented.
+
+  A headless window uses the SDL dummy video driver: nothing is shown, but
+  the display is still scaled into an offscreen screen every frame, so
+  rendering can be run and measured on machines without a display.
   """
 
+  phase = Phase.PRESENT
+
   def __init__(
     self,
     window_width: int,
@@ -23,14 +40,25 @@ class Window(SystemComponent):
     fps: int,
     vsync: bool,
     background_colour: tuple[int, int, int],
+    skip_empty_debug_display: bool = True,
+    dirty_rects: bool = False,
+    headless: bool = False,
   ):
     SystemComponent.__init__(self)
+    self.headless = headless
+    if headless:
+      # The driver is picked when the display is initialised
+      if pygame.display.get_init() and pygame.display.get_driver() != 'dummy':
+        pygame.display.quit()
+      os.environ['SDL_VIDEODRIVER'] = 'dummy'
+      fullscreen = 0
+      vsync = False
     pygame.init()
     self.fps = fps
     self.background_colour = background_colour
     self.window_width = window_width
     self.window_height = window_height
-    self.start_time = time.time()
+    self.start_time = time.perf_counter()
 
     self.screen = pygame.display.set_mode(
       size=(window_width, window_height), flags=fullscreen, vsync=vsync
@@ -45,10 +73,83 @@ class Window(SystemComponent):
       (window_width, window_height)
     ).convert_alpha()
 
+    self.skip_empty_debug_display = skip_empty_debug_display
+    # Set when something was drawn to the debug display during this frame
+    self.debug_display_drawn = True
+    self.setup_scaling()
+
+    self.dirty_rects = dirty_rects
+    self.display_rect = self.display.get_rect()
+    # Regions changed this frame and last frame, in display coordinates
+    self.changed_rects: list[pygame.Rect] = [self.display_rect.copy()]
+    self.previous_changed_rects: list[pygame.Rect] = []
+    # Bounding box of the regions being redrawn this frame
+    self.frame_region: pygame.Rect | None = None
+
     pygame.display.set_caption(caption)
     self.clock = pygame.time.Clock()
 
-    self.previous_frame = time.time()
+    self.previous_frame = time.perf_counter()
+
+  def setup_scaling(self) -> None:
+    screen_width, screen_height = self.screen.get_size()
+    display_width, display_height = self.display.get_size()
+    # Display regions map to whole screen regions only at an exact multiple
+    self.exact_scale = (
+      screen_width == display_width * BuildConfig.scale_factor
+      and screen_height == display_height * BuildConfig.scale_factor
+    )
+    self.integer_scale = (
+      self.exact_scale
+      and self.screen.get_bitsize() == self.display.get_bitsize()
+    )
+    # Only needed when the display cannot be scaled into the screen directly
+    self.scaled_display: pygame.Surface | None = None
+    if not self.integer_scale:
+      self.scaled_display = pygame.Surface(self.screen.get_size()).convert()
+
+  def mark_debug_display(self) -> None:
+    """Tell the window the debug display has to be shown this frame"""
+    self.debug_display_drawn = True
+
+  def add_dirty_rect(self, rect: pygame.Rect) -> None:
+    """Report a region of the display that changed this frame"""
+    if self.dirty_rects:
+      self.changed_rects.append(rect)
+
+  def add_screen_dirty_rect(self, rect: pygame.Rect) -> None:
+    """Report a region of the screen (or debug display) that changed"""
+    if self.dirty_rects:
+      scale = BuildConfig.scale_factor
+      self.changed_rects.append(
+        pygame.Rect(
+          rect.x // scale,
+          rect.y // scale,
+          -(-rect.width // scale) + 1,
+          -(-rect.height // scale) + 1,
+        )
+      )
+
+  def mark_all_dirty(self) -> None:
+    if self.dirty_rects:
+      self.changed_rects.append(self.display_rect.copy())
+
+  def begin_frame(self) -> None:
+    """Clear the regions that are redrawn this frame and clip the display
+    to them. Called right before the queued draw commands are rendered."""
+    if not self.dirty_rects:
+      return
+
+    rects = self.changed_rects + self.previous_changed_rects
+    if not rects:
+      self.frame_region = None
+      self.display.set_clip(pygame.Rect(0, 0, 0, 0))
+      return
+
+    region = rects[0].unionall(rects[1:]).clip(self.display_rect)
+    self.frame_region = region
+    self.display.set_clip(region)
+    self.display.fill(self.background_colour, region)
 
   def get_width(self) -> int:
     return self.window_width
@@ -57,8 +158,9 @@ class Window(SystemComponent):
     return self.window_height
 
   def get_dt(self):
-    dt = time.time() - self.previous_frame
-    self.previous_frame = time.time()
+    now = time.perf_counter()
+    dt = now - self.previous_frame
+    self.previous_frame = now
     return dt
 
   def update(self):
@@ -67,13 +169,88 @@ class Window(SystemComponent):
     self.clear()
 
   def clear(self):
-    self.display.fill(self.background_colour)
-    self.debug_display.fill((0, 0, 0, 0))
+    if self.dirty_rects:
+      self.display.set_clip(None)
+      self.previous_changed_rects = self.changed_rects
+      self.changed_rects = []
+      self.frame_region = None
+    else:
+      self.display.fill(self.background_colour)
+
+    if self.debug_display_drawn:
+      self.debug_display.fill((0, 0, 0, 0))
+    self.debug_display_drawn = not self.skip_empty_debug_display
 
   def swap_buffers(self):
-    scaled_display = pygame.transform.scale(
-      self.display, self.screen.get_size()
+    if self.dirty_rects:
+      self.swap_dirty_regions()
+      return
+    self.swap_whole_screen()
+
+  def swap_whole_screen(self):
+    if self.scaled_display is None:
+      pygame.transform.scale(self.display, self.screen.get_size(), self.screen)
+    else:
+      pygame.transform.scale(
+        self.display, self.screen.get_size(), self.scaled_display
+      )
+      self.screen.blit(self.scaled_display, (0, 0))
+
+    if self.debug_display_drawn:
+      self.screen.blit(self.debug_display, (0, 0))
+    self.present()
+
+  def swap_dirty_regions(self):
+    if self.frame_region is None:
+      return
+
+    if not self.exact_scale:
+      # The regions can not be mapped to whole screen pixels. The display
+      # outside the region still holds the last frame, so it is all scaled
+      self.swap_whole_screen()
+      return
+
+    region = self.frame_region
+    scale = BuildConfig.scale_factor
+    screen_region = pygame.Rect(
+      region.x * scale,
+      region.y * scale,
+      region.width * scale,
+      region.height * scale,
+    ).clip(self.screen.get_rect())
+
+    if self.scaled_display is None:
+      pygame.transform.scale(
+        self.display.subsurface(region),
+        screen_region.size,
+        self.screen.subsurface(screen_region),
+      )
+    else:
+      # Only the pixel format differs, the region is scaled on its own
+      pygame.transform.scale(
+        self.display.subsurface(region),
+        screen_region.size,
+        self.scaled_display.subsurface(screen_region),
+      )
+      self.screen.blit(self.scaled_display, screen_region, screen_region)
+
+    if self.debug_display_drawn:
+      self.screen.blit(self.debug_display, screen_region, screen_region)
+
+    self.present(
+      [
+        pygame.Rect(
+          rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale
+        )
+        for rect in self.changed_rects + self.previous_changed_rects
+      ]
     )
-    self.screen.blit(scaled_display, (0, 0))
-    self.screen.blit(self.debug_display, (0, 0))
-    pygame.display.flip()
+
+  def present(self, rects: list[pygame.Rect] | None = None) -> None:
+    """Show the screen, or only the given regions of it"""
+    if self.headless:
+      return
+    if rects is None:
+      pygame.display.flip()
+    else:
+      pygame.display.update(rects)
@@ -1,11 +1,20 @@
+from collections.abc import Callable
+
+import pygame
+
+from src.PlatformerGame.main.configs.build_config import BuildConfig
+from src.PyEng.components.camera import Camera
 from src.PyEng.components.components import ComponentManager
+from src.PyEng.components.components import Phase
 from src.PyEng.components.input import Input
+from src.PyEng.components.render import Render
 from src.PyEng.components.state_manager import StateManager
 from src.PyEng.components.window import Window
 from src.PyEng.main.engine_config import EngineConfigs
 from src.PyEng.main.engine_files import EngineFiles
 from src.PyEng.utils.debugger import Debugger
 from src.PyEng.utils.error_manager import ErrorManager
+from src.PyEng.utils.frame_timer import FrameTimer
 from src.shared import exceptions
 from src.shared import key_mappings
 
@@ -14,9 +23,14 @@ class Engine:
   __instance: 'Engine | None' = None
 
   def __init__(self, configs: type[EngineConfigs]):
+    self.renderer: Render
     self.window: Window
+    self.camera: Camera
     self.input: Input
+    self.configs = configs
     self.components_manager = ComponentManager()
+    if configs.profile_components:
+      self.components_manager.enable_profiling()
 
     self.check_assets_folder()
     self.create_engine_components(configs)
@@ -35,9 +49,36 @@ class Engine:
   def update(self) -> None:
     self.components_manager.update()
 
+  def run(
+    self,
+    simulate: Callable[[float], None] | None = None,
+    update: Callable[[], None] | None = None,
+  ) -> None:
+    """Run the main loop until the engine is closed.
+
+    Every frame the input phase is updated, then the simulate phase (and
+    simulate, with the fixed timestep) once for every step the elapsed time
+    allows. update is called next, followed by the late update, render and
+    present phases.
+    """
+    manager = self.components_manager
+    self.timer.reset()
+    while not self.close_flag:
+      self.timer.tick()
+      manager.update_phase(Phase.INPUT)
+      while self.timer.step():
+        if simulate is not None:
+          simulate(self.timer.timestep)
+        manager.update_phase(Phase.SIMULATE)
+      if update is not None:
+        update()
+      manager.update_phase(Phase.LATE_UPDATE)
+      manager.update_phase(Phase.RENDER)
+      manager.update_phase(Phase.PRESENT)
+    self.close_engine()
+
   def render(self) -> None:
-    raise NotImplementedError
-    # self.renderer.render()
+    self.renderer.render()
 
   def check_assets_folder(self):
     if not EngineFiles.DATA_FOLDER.exists():
@@ -53,6 +94,9 @@ class Engine:
 
   def create_engine_components(self, configs: type[EngineConfigs]):
     # Create engine components
+    # The components are updated by phase, so the queued draw commands are
+    # rendered before the window swaps its buffers
+    self.renderer = Render()
     self.window = Window(
       window_width=configs.window_width,
       window_height=configs.window_height,
@@ -61,6 +105,14 @@ class Engine:
       fps=configs.fps,
       vsync=configs.vsync,
       background_colour=configs.background_colour,
+      skip_empty_debug_display=configs.skip_empty_debug_display,
+      dirty_rects=configs.dirty_rects,
+      headless=configs.headless,
+    )
+    self.renderer.add_pre_render_hook(self.window.begin_frame)
+    self.camera = Camera(
+      configs.window_width // BuildConfig.scale_factor,
+      configs.window_height // BuildConfig.scale_factor,
     )
 
     # Set up keyboard and mouse inputs
@@ -70,10 +122,11 @@ class Engine:
       )
     else:
       self.input = Input(EngineFiles.GAME_MAPPINGS, key_mappings.GameMapping)
+    self.input.add_quit_hook(self.close)
     self.state_manager = StateManager(
       configs.default_state, configs.initial_state
     )
-    # self.timer = FrameTimer(configs.fps)
+    self.timer = FrameTimer(configs.simulation_rate, configs.max_frame_time)
 
     # Create UI
     # UserInterface(
@@ -84,18 +137,25 @@ class Engine:
     # )
 
   def get_delta(self) -> float:
-    raise NotImplementedError
-    # return self.timer.get_delta()
+    return self.timer.get_delta()
 
   def get_current_time(self) -> float:
-    raise NotImplementedError
-    # return self.timer.get_time()
+    return self.timer.get_time()
+
+  def get_alpha(self) -> float:
+    """Return how far the current frame is between the last simulation step
+    and the next one, to interpolate what is rendered"""
+    return self.timer.get_alpha()
+
+  def close(self) -> None:
+    """Stop the main loop once the current frame is done"""
+    self.close_flag = True
 
   def close_engine(self) -> None:
-    raise NotImplementedError
+    """Release the window once the main loop is over"""
     # BackgroundLoader.clean_up()
     # Ui.clean_up()
-    # self.window.destroy()
+    pygame.quit()
 
   @classmethod
   def create(
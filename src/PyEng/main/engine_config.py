@@ -8,8 +8,19 @@ class EngineConfigs:
   fullscreen = 0
   title = 'The Game'
   fps = 100
+  # Simulation steps per second, independent of the frame rate
+  simulation_rate = 60
+  # Longest frame simulated in full, in seconds. Longer frames slow the game
+  # down instead of queueing more steps than can be simulated
+  max_frame_time = 0.25
   vsync = False
   background_colour = (100, 100, 100)
+  # Skip compositing the debug display on frames nothing was drawn to it
+  skip_empty_debug_display = True
+  # Only redraw and present the regions components report as changed
+  dirty_rects = False
+  # Render offscreen without opening a window, for benchmarks and batch jobs
+  headless = False
 
   # ui_resources = UiResources()
   # ui_configs = ui_configs.UiConfigs()
@@ -20,6 +31,9 @@ class EngineConfigs:
   default_state = State()
 
   debug = True
+  # Time every system component update and show the timings in the debugger
+  profile_components = False
+  show_grid = False
   is_editor = False
 
   @staticmethod
@@ -9,6 +9,7 @@ class EngineFiles:
 
   DATA_FOLDER = ROOT_FOLDER / 'data'
   ERROR_FOLDER = ROOT_FOLDER / 'ErrorLogs'
+  CACHE_FOLDER = ROOT_FOLDER / '.cache'
 
   GUI_FOLDER = DATA_FOLDER / 'GUI'
   SOUNDS_FOLDER = DATA_FOLDER / 'sounds'
@@ -0,0 +1,29 @@
+import pygame
+import pytest
+
+from src.PyEng.components.camera import Camera
+from src.shared import exceptions
+
+
+class TestCamera:
+  def test_conversions_at_zoom(self):
+    camera = Camera(320, 180, zoom=2)
+    camera.set_position(100, -40)
+
+    assert camera.world_to_screen(110, -30) == (20, 20)
+    assert camera.screen_to_world(20, 20) == (110, -30)
+    # The view surface is drawn at 1x and scaled afterwards
+    assert camera.world_to_view(110, -30) == (10, 10)
+
+  def test_view_rect_shrinks_with_zoom(self):
+    camera = Camera(320, 180, zoom=2)
+    camera.set_position(10.7, 5.2)
+
+    assert camera.get_view_rect() == pygame.Rect(10, 5, 160, 90)
+    camera.set_zoom(3)
+    # Partially visible pixels are part of the view
+    assert camera.get_view_rect().size == (107, 60)
+
+  def test_zoom_must_be_positive(self):
+    with pytest.raises(exceptions.InvalidParameters):
+      Camera(320, 180).set_zoom(0)
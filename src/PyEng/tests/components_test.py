@@ -0,0 +1,81 @@
+import pytest
+
+from src.PyEng.components.components import ComponentManager
+from src.PyEng.components.components import GameComponent
+from src.PyEng.components.components import Phase
+from src.PyEng.components.components import SystemComponent
+
+updates: list[str] = []
+
+
+@pytest.fixture(autouse=True)
+def clear_updates():
+  updates.clear()
+
+
+class Recorder(SystemComponent):
+  def update(self) -> None:
+    updates.append(self.class_name)
+
+
+class Presenter(Recorder):
+  phase = Phase.PRESENT
+
+
+class LateRenderer(Recorder):
+  phase = Phase.RENDER
+  priority = 10
+
+
+class EarlyRenderer(Recorder):
+  phase = Phase.RENDER
+
+
+class Reader(Recorder):
+  phase = Phase.INPUT
+
+
+class Entity(GameComponent):
+  @classmethod
+  def update_batch(cls, components: list['Entity']) -> None:
+    updates.append(f'{len(components)} entities')
+
+
+class Player(Entity):
+  pass
+
+
+class TestComponentManager:
+  def test_components_are_updated_by_phase_and_priority(self):
+    manager = ComponentManager()
+    for component_type in (Presenter, LateRenderer, EarlyRenderer, Reader):
+      component_type()
+    Entity()
+    Entity()
+
+    manager.update()
+
+    assert updates == [
+      'reader',
+      '2 entities',
+      'earlyrenderer',
+      'laterenderer',
+      'presenter',
+    ]
+
+  def test_update_phase_only_updates_that_phase(self):
+    manager = ComponentManager()
+    Reader()
+    Entity()
+
+    manager.update_phase(Phase.SIMULATE)
+
+    assert updates == ['1 entities']
+
+  def test_game_components_include_subclasses(self):
+    manager = ComponentManager()
+    entity = Entity()
+    player = Player()
+
+    assert list(manager.get_game_components(Entity)) == [entity, player]
+    assert list(manager.get_game_components(Player)) == [player]
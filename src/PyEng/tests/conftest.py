@@ -5,3 +5,13 @@ import sys
 sys.path.insert(
   0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
 )
+
+import pytest  # noqa: E402
+
+from src.PyEng.components.components import ComponentManager  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_components():
+  # Creating the manager again clears the registered components
+  ComponentManager()
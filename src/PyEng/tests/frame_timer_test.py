@@ -0,0 +1,33 @@
+from unittest import mock
+
+from src.PyEng.utils.frame_timer import FrameTimer
+
+
+class TestFrameTimer:
+  @mock.patch('src.PyEng.utils.frame_timer.time.perf_counter')
+  def test_steps_and_alpha(self, mock_clock: mock.Mock):
+    mock_clock.return_value = 0.0
+    timer = FrameTimer(simulation_rate=10, max_frame_time=1.0)
+
+    mock_clock.return_value = 0.25
+    assert timer.tick() == 0.25
+    steps = 0
+    while timer.step():
+      steps += 1
+
+    assert steps == 2
+    assert round(timer.get_alpha(), 6) == 0.5
+
+  @mock.patch('src.PyEng.utils.frame_timer.time.perf_counter')
+  def test_long_frames_are_clamped(self, mock_clock: mock.Mock):
+    mock_clock.return_value = 0.0
+    timer = FrameTimer(simulation_rate=10, max_frame_time=0.35)
+
+    mock_clock.return_value = 5.0
+    timer.tick()
+    steps = 0
+    while timer.step():
+      steps += 1
+
+    assert timer.get_delta() == 5.0
+    assert steps == 3
@@ -0,0 +1,35 @@
+import dataclasses
+
+from src.shared.hash_registry import HashRegistry
+from src.shared.hash_registry import LazyEntry
+from src.shared.hash_registry import Registrable
+
+
+@dataclasses.dataclass
+class Item(Registrable):
+  name: str
+
+  def get_name(self) -> str:
+    return self.name
+
+
+class TestHashRegistry:
+  def test_get_all_creates_the_lazy_entries(self):
+    registry: HashRegistry[Item] = HashRegistry()
+    registry.register(Item('first'))
+    registry.register_lazy('second', lambda: Item('second'))
+    registry.register(Item('third'))
+
+    items = registry.get_all()
+
+    assert items == {
+      'first': Item('first'),
+      'second': Item('second'),
+      'third': Item('third'),
+    }
+    assert not any(
+      isinstance(item, LazyEntry) for item in registry.map.values()
+    )
+    # A copy, changing it does not change the registry
+    items.clear()
+    assert registry.get_names() == ['first', 'second', 'third']
@@ -0,0 +1,81 @@
+import json
+import pathlib
+
+import pytest
+
+from src.shared import api
+from src.shared import io
+
+
+def make_data():
+  return {
+    'name': 'level',
+    'empty': [],
+    'tile_map': (
+      {'position': api.Position(x, -x), 'layer': 0, 'nested': {'a': [1, 2]}}
+      for x in range(3)
+    ),
+  }
+
+
+class TestIo:
+  def test_stream_json_matches_json_dump(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'data.json'
+    io.stream_json(file_path, make_data())
+
+    expected = json.dumps(io.export_data(make_data()), indent=2)
+    assert file_path.read_text() == expected
+
+  def test_stream_json_compact(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'data.json'
+    io.stream_json(file_path, make_data(), compact=True)
+
+    text = file_path.read_text()
+    assert '\n' not in text and ' ' not in text
+    assert json.loads(text) == io.export_data(make_data())
+
+  @pytest.mark.parametrize('compact', [False, True])
+  def test_stream_json_converts_keys(self, tmp_path: pathlib.Path, compact):
+    file_path = tmp_path / 'data.json'
+    data = {
+      'name': 1,
+      None: 2,
+      True: 3,
+      False: 4,
+      7: {-3: [5]},
+      1.5: 6,
+      float('inf'): 7,
+    }
+    io.stream_json(file_path, data, compact=compact)
+
+    if compact:
+      expected = json.dumps(data, separators=(',', ':'))
+    else:
+      expected = json.dumps(data, indent=2)
+    assert file_path.read_text() == expected
+
+  def test_stream_json_rejects_other_keys(self, tmp_path: pathlib.Path):
+    with pytest.raises(TypeError):
+      io.stream_json(tmp_path / 'data.json', {(1, 2): 'position'})
+
+  def test_export_data_uses_serialisers(self):
+    assert io.export_data([api.Position(1, 2), object()]) == [
+      {'x': 1, 'y': 2},
+      None,
+    ]
+
+  def test_atomic_write_keeps_file_on_error(self, tmp_path: pathlib.Path):
+    file_path = tmp_path / 'map.map'
+    file_path.write_text('old')
+
+    with pytest.raises(RuntimeError):
+      with io.atomic_write(file_path) as temp_path:
+        temp_path.write_text('partial')
+        raise RuntimeError
+
+    assert file_path.read_text() == 'old'
+    assert list(tmp_path.iterdir()) == [file_path]
+
+    with io.atomic_write(file_path) as temp_path:
+      temp_path.write_text('new')
+    assert file_path.read_text() == 'new'
@@ -0,0 +1,33 @@
+from src.PyEng.components.components import ComponentManager
+from src.PyEng.components.components import Phase
+from src.PyEng.components.physics import PhysicsEntity
+from src.shared.api import Position
+
+
+class Jumper(PhysicsEntity):
+  def update(self) -> None:
+    PhysicsEntity.update(self)
+    self.position.y -= 5
+
+
+class TestPhysicsEntity:
+  def test_batch_matches_update(self):
+    manager = ComponentManager()
+    entity = PhysicsEntity(0, 0, 'box')
+    entity.velocity.x = 2
+    entity.velocity.y = 1
+
+    for _ in range(3):
+      manager.update_phase(Phase.SIMULATE)
+
+    # The velocity adds up in the acceleration every step
+    assert entity.previous_position == Position(6, 3)
+    assert entity.position == Position(12, 6)
+
+  def test_subclass_update_is_called(self):
+    manager = ComponentManager()
+    jumper = Jumper(0, 10, 'player')
+
+    manager.update_phase(Phase.SIMULATE)
+
+    assert jumper.position == Position(0, 5)
@@ -0,0 +1,51 @@
+import pytest
+
+from src.PyEng.components.components import ComponentManager
+from src.PyEng.components.components import SystemComponent
+from src.PyEng.utils.profiler import ComponentProfiler
+from src.PyEng.utils.profiler import RingBuffer
+
+
+class Counter(SystemComponent):
+  def __init__(self) -> None:
+    SystemComponent.__init__(self)
+    self.updates = 0
+
+  def update(self) -> None:
+    self.updates += 1
+
+
+class TestProfiler:
+  def test_ring_buffer_keeps_the_latest_samples(self):
+    buffer = RingBuffer(3)
+    for sample in range(5):
+      buffer.append(sample)
+
+    assert sorted(buffer.get_samples()) == [2, 3, 4]
+
+  def test_stats(self):
+    profiler = ComponentProfiler(size=100)
+    for sample in range(1, 101):
+      profiler.record('input', sample / 1000)
+
+    stats = profiler.get_stats('input')
+    assert stats is not None
+    assert stats.mean == pytest.approx(0.0505)
+    assert stats.p95 == pytest.approx(0.095)
+    assert stats.max == pytest.approx(0.1)
+    assert profiler.get_stats('window') is None
+
+  def test_manager_times_updates_only_while_profiling(self):
+    manager = ComponentManager()
+    counter = Counter()
+
+    manager.update()
+    assert manager.profiler is None
+
+    profiler = manager.enable_profiling(size=10)
+    manager.update()
+    manager.disable_profiling()
+    manager.update()
+
+    assert counter.updates == 3
+    assert profiler.timings['counter'].count == 1
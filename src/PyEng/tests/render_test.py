@@ -0,0 +1,49 @@
+import pygame
+
+from src.PyEng.components.render import Render
+
+
+def make_image(colour: tuple[int, int, int]) -> pygame.Surface:
+  image = pygame.Surface((2, 2))
+  image.fill(colour)
+  return image
+
+
+class TestRender:
+  def test_render_draws_lower_layers_first(self):
+    renderer = Render()
+    destination = pygame.Surface((2, 2))
+    blue = make_image((0, 0, 255))
+    red = make_image((255, 0, 0))
+    renderer.add_to_render_group(blue, (0, 0), destination, 5)
+    renderer.add_to_render_group(red, (0, 0), destination, 1)
+
+    renderer.update()
+
+    assert destination.get_at((0, 0))[:3] == (0, 0, 255)
+    assert renderer.last_draw_calls == 2
+    assert renderer.last_blit_count == 2
+
+  def test_render_resets_queue(self):
+    renderer = Render()
+    destination = pygame.Surface((2, 2))
+    red = make_image((255, 0, 0))
+    renderer.add_to_render_group(red, (0, 0), destination, 0)
+
+    renderer.update()
+    renderer.update()
+
+    assert not renderer.render_groups
+    assert renderer.last_blit_count == 0
+
+  def test_render_surface_only_flushes_that_surface(self):
+    renderer = Render()
+    first = pygame.Surface((2, 2))
+    second = pygame.Surface((2, 2))
+    renderer.add_to_render_group(make_image((255, 0, 0)), (0, 0), first, 0)
+    renderer.add_to_render_group(make_image((255, 0, 0)), (0, 0), second, 0)
+
+    renderer.render_surface(first)
+
+    assert first.get_at((0, 0))[:3] == (255, 0, 0)
+    assert list(renderer.render_groups) == [second]
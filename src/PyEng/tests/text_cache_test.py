@@ -0,0 +1,46 @@
+import pygame
+import pytest
+
+from src.PyEng.utils.text_cache import GlyphCache
+from src.PyEng.utils.text_cache import TextCache
+
+WHITE = (255, 255, 255)
+
+
+@pytest.fixture
+def font() -> pygame.font.Font:
+  pygame.font.init()
+  return pygame.font.Font(None, 20)
+
+
+class TestTextCache:
+  def test_text_is_rendered_once(self, font: pygame.font.Font):
+    cache = TextCache(font)
+
+    assert cache.render('FPS', WHITE) is cache.render('FPS', WHITE)
+    assert cache.render('FPS', WHITE) is not cache.render('FPS', (0, 0, 0))
+
+  def test_least_recently_used_text_is_dropped(self, font: pygame.font.Font):
+    cache = TextCache(font, max_size=2)
+    first = cache.render('first', WHITE)
+    cache.render('second', WHITE)
+    cache.render('first', WHITE)
+    cache.render('third', WHITE)
+
+    assert list(cache.surfaces) == [
+      ('first', WHITE, None),
+      ('third', WHITE, None),
+    ]
+    assert cache.render('first', WHITE) is first
+
+  def test_glyphs_are_drawn_side_by_side(self, font: pygame.font.Font):
+    cache = GlyphCache(font)
+    target = pygame.Surface((100, 30))
+
+    rect = cache.blit(target, '1.01', (5, 2), WHITE)
+
+    assert len(cache.glyphs) == 3
+    assert rect.topleft == (5, 2)
+    assert rect.width == sum(
+      cache.get_glyph(char, WHITE, None).get_width() for char in '1.01'
+    )
@@ -0,0 +1,126 @@
+from unittest import mock
+
+import pygame
+
+from src.PyEng.components.window import Window
+
+
+class TestWindow:
+  def test_headless_window_renders_offscreen(self):
+    window = Window(
+      window_width=64,
+      window_height=32,
+      fullscreen=0,
+      caption='Test',
+      fps=0,
+      vsync=True,
+      background_colour=(0, 0, 0),
+      headless=True,
+    )
+    assert pygame.display.get_driver() == 'dummy'
+
+    with mock.patch('pygame.display.flip') as mock_flip:
+      # The first frame clears the debug display
+      window.update()
+      window.display.fill((255, 0, 0))
+      window.update()
+
+    mock_flip.assert_not_called()
+    assert window.screen.get_size() == (64, 32)
+    assert window.screen.get_at((63, 31))[:3] == (255, 0, 0)
+
+  def test_dirty_rects_present_everything_at_inexact_scale(self):
+    # 65 pixels is not a multiple of the 32 pixel display
+    window = Window(
+      window_width=65,
+      window_height=32,
+      fullscreen=0,
+      caption='Test',
+      fps=0,
+      vsync=False,
+      background_colour=(0, 0, 0),
+      dirty_rects=True,
+      headless=True,
+    )
+    assert not window.exact_scale
+
+    window.debug_display.fill((0, 0, 0, 0))
+    window.begin_frame()
+    window.display.fill((255, 0, 0))
+    window.update()
+
+    assert window.screen.get_at((64, 31))[:3] == (255, 0, 0)
+
+  def test_integer_scale_draws_into_the_screen(self):
+    window = Window(
+      window_width=64,
+      window_height=32,
+      fullscreen=0,
+      caption='Test',
+      fps=0,
+      vsync=False,
+      background_colour=(0, 0, 0),
+      headless=True,
+    )
+    assert window.integer_scale
+    assert window.scaled_display is None
+
+    # The first frame clears the debug display
+    window.update()
+    window.display.fill((0, 0, 0))
+    window.display.set_at((31, 15), (255, 0, 0))
+    scale = pygame.transform.scale
+    with mock.patch('pygame.transform.scale', wraps=scale) as mock_scale:
+      window.swap_buffers()
+
+    # Scaled straight into the screen, at its whole size
+    mock_scale.assert_called_once_with(
+      window.display, (64, 32), window.screen
+    )
+    assert window.screen.get_at((62, 30))[:3] == (255, 0, 0)
+    assert window.screen.get_at((61, 29))[:3] == (0, 0, 0)
+
+  def test_empty_debug_display_is_skipped(self):
+    window = Window(
+      window_width=64,
+      window_height=32,
+      fullscreen=0,
+      caption='Test',
+      fps=0,
+      vsync=False,
+      background_colour=(0, 0, 0),
+      headless=True,
+    )
+    # The first frame clears the debug display
+    window.update()
+    assert not window.debug_display_drawn
+
+    # Not shown until a component marks it
+    window.debug_display.fill((0, 255, 0))
+    window.update()
+    assert window.screen.get_at((0, 0))[:3] == (0, 0, 0)
+
+    window.debug_display.fill((0, 255, 0))
+    window.mark_debug_display()
+    window.update()
+    assert window.screen.get_at((0, 0))[:3] == (0, 255, 0)
+    assert not window.debug_display_drawn
+
+  def test_debug_display_is_always_shown_without_skipping(self):
+    window = Window(
+      window_width=64,
+      window_height=32,
+      fullscreen=0,
+      caption='Test',
+      fps=0,
+      vsync=False,
+      background_colour=(0, 0, 0),
+      skip_empty_debug_display=False,
+      headless=True,
+    )
+    window.update()
+    assert window.debug_display_drawn
+
+    window.debug_display.fill((0, 255, 0))
+    window.update()
+    assert window.screen.get_at((0, 0))[:3] == (0, 255, 0)
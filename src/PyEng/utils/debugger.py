@@ -2,34 +2,76 @@ from typing import Any
 
 import pygame
 
+from src.PyEng.components.components import Phase
 from src.PyEng.components.components import SystemComponent
+from src.PyEng.utils.text_cache import GlyphCache
+from src.PyEng.utils.text_cache import TextCache
+
+TEXT_COLOUR = (255, 255, 255)
+BACKGROUND_COLOUR = (0, 0, 0)
+FONT_SIZE = 20
+LINE_HEIGHT = 20
 
 
 class Debugger(SystemComponent):
+  # Before the renderer, so the dirty regions of the text are redrawn
+  phase = Phase.RENDER
+  priority = 5
+
   def __init__(self, debug: bool = False) -> None:
     SystemComponent.__init__(self)
     self.debug: dict = {}
     self.debugging = debug
-    self.font = pygame.font.SysFont('Consolas', 20)
+    # The default font ships with pygame, looking up a system font is slow
+    self.font = pygame.font.Font(None, FONT_SIZE)
+    # Text that stays the same is rendered once, values that changed since
+    # the last frame are drawn from cached characters instead
+    self.text_cache = TextCache(self.font)
+    self.glyph_cache = GlyphCache(self.font)
+    self.last_values: dict[str, str] = {}
     self.window = self.components_manager.get_window()
+    self.renderer = self.components_manager.get_render()
 
   def render_info(self):
+    if not self.debugging:
+      return
+
+    self.window.mark_debug_display()
+    debug_display = self.window.debug_display
     for i, key in enumerate(self.debug):
-      text = self.font.render(
-        f'{key}:{self.debug[key]}', True, (255, 255, 255), (0, 0, 0)
-      )
-      text_rect = text.get_rect()
-      text_rect.x = 0
-      text_rect.y = 20 * i
-      self.window.debug_display.blit(text, text_rect)
+      label = self.text_cache.render(f'{key}:', TEXT_COLOUR, BACKGROUND_COLOUR)
+      text_rect = debug_display.blit(label, (0, LINE_HEIGHT * i))
+
+      value = str(self.debug[key])
+      position = (text_rect.right, text_rect.y)
+      if value == self.last_values.get(key):
+        text = self.text_cache.render(value, TEXT_COLOUR, BACKGROUND_COLOUR)
+        value_rect = debug_display.blit(text, position)
+      else:
+        value_rect = self.glyph_cache.blit(
+          debug_display, value, position, TEXT_COLOUR, BACKGROUND_COLOUR
+        )
+        self.last_values[key] = value
+      self.window.add_screen_dirty_rect(text_rect.union(value_rect))
 
   def add_info(self, key: str, info: Any):
     self.debug[key] = info
 
   def register_info(self):
     self.add_info('FPS', self.window.fps)
+    self.add_info('Draw calls', self.renderer.last_draw_calls)
+    self.add_info('Blits', self.renderer.last_blit_count)
     # self.add_info('DT', self.window.get_dt())
 
+    profiler = self.components_manager.profiler
+    if profiler is not None:
+      for name, stats in profiler.get_all_stats().items():
+        self.add_info(
+          name,
+          f'{stats.mean * 1000:.2f} p95 {stats.p95 * 1000:.2f} '
+          f'max {stats.max * 1000:.2f} ms',
+        )
+
   def update(self):
     self.register_info()
     self.render_info()
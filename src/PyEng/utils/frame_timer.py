@@ -0,0 +1,52 @@
+import time
+
+
+class FrameTimer:
+  """FrameTimer
+
+  Measures frames with a monotonic high resolution clock and splits the time
+  they take into fixed simulation steps. The time left over after the last
+  step is kept for the next frame, and alpha (how far it is into the next
+  step) is used to interpolate what is rendered between the last two steps.
+
+  Frames longer than max_frame_time are clamped, so a slow frame can not
+  queue more steps than the next frame has time to simulate.
+  """
+
+  def __init__(self, simulation_rate: int, max_frame_time: float) -> None:
+    self.timestep = 1 / simulation_rate
+    self.max_frame_time = max_frame_time
+    self.start_time = time.perf_counter()
+    self.reset()
+
+  def reset(self) -> None:
+    """Start measuring from now, without any pending steps"""
+    self.previous_time = time.perf_counter()
+    self.delta = 0.0
+    self.accumulator = 0.0
+
+  def tick(self) -> float:
+    """Start a new frame and return the time since the previous one"""
+    now = time.perf_counter()
+    self.delta = now - self.previous_time
+    self.previous_time = now
+    self.accumulator += min(self.delta, self.max_frame_time)
+    return self.delta
+
+  def step(self) -> bool:
+    """Consume a simulation step, return False once there is not enough time
+    left for one in this frame"""
+    if self.accumulator < self.timestep:
+      return False
+    self.accumulator -= self.timestep
+    return True
+
+  def get_alpha(self) -> float:
+    return self.accumulator / self.timestep
+
+  def get_delta(self) -> float:
+    return self.delta
+
+  def get_time(self) -> float:
+    """Return the seconds since the timer was created"""
+    return time.perf_counter() - self.start_time
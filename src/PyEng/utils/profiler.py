@@ -0,0 +1,66 @@
+import array
+import dataclasses
+import math
+
+
+@dataclasses.dataclass
+class TimingStats:
+  """Update times of a component over the recorded frames, in seconds"""
+
+  mean: float
+  p95: float
+  max: float
+
+
+class RingBuffer:
+  """Fixed size buffer of the latest samples, the oldest is overwritten"""
+
+  def __init__(self, size: int) -> None:
+    self.samples = array.array('d', bytes(8 * size))
+    self.size = size
+    self.count = 0
+    self.index = 0
+
+  def append(self, sample: float) -> None:
+    self.samples[self.index] = sample
+    self.index = (self.index + 1) % self.size
+    if self.count < self.size:
+      self.count += 1
+
+  def get_samples(self) -> array.array:
+    return self.samples[: self.count]
+
+
+class ComponentProfiler:
+  """ComponentProfiler
+
+  Keeps the wall time of the last `size` updates of every component and
+  computes their rolling statistics on request.
+  """
+
+  def __init__(self, size: int = 120) -> None:
+    self.size = size
+    self.timings: dict[str, RingBuffer] = {}
+
+  def record(self, name: str, seconds: float) -> None:
+    timings = self.timings.get(name)
+    if timings is None:
+      timings = self.timings[name] = RingBuffer(self.size)
+    timings.append(seconds)
+
+  def get_stats(self, name: str) -> TimingStats | None:
+    timings = self.timings.get(name)
+    if timings is None or not timings.count:
+      return None
+
+    samples = sorted(timings.get_samples())
+    # Nearest rank percentile
+    p95 = samples[math.ceil(0.95 * len(samples)) - 1]
+    return TimingStats(sum(samples) / len(samples), p95, samples[-1])
+
+  def get_all_stats(self) -> dict[str, TimingStats]:
+    return {
+      name: stats
+      for name in self.timings
+      if (stats := self.get_stats(name)) is not None
+    }
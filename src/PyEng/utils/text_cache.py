@@ -0,0 +1,77 @@
+from collections import OrderedDict
+
+import pygame
+
+Colour = tuple[int, int, int]
+
+
+class TextCache:
+  """TextCache
+
+  Keeps the surfaces of the last max_size texts rendered with a font, so
+  text that does not change is only rendered once. The least recently used
+  text is dropped first.
+  """
+
+  def __init__(self, font: pygame.font.Font, max_size: int = 128) -> None:
+    self.font = font
+    self.max_size = max_size
+    self.surfaces: OrderedDict[
+      tuple[str, Colour, Colour | None], pygame.Surface
+    ] = OrderedDict()
+
+  def render(
+    self, text: str, colour: Colour, background: Colour | None = None
+  ) -> pygame.Surface:
+    key = (text, colour, background)
+    surface = self.surfaces.get(key)
+    if surface is not None:
+      self.surfaces.move_to_end(key)
+      return surface
+
+    surface = self.font.render(text, True, colour, background)
+    self.surfaces[key] = surface
+    if len(self.surfaces) > self.max_size:
+      self.surfaces.popitem(last=False)
+    return surface
+
+
+class GlyphCache:
+  """GlyphCache
+
+  Draws text one cached character at a time. Meant for values that change
+  every frame, such as numbers, which would otherwise be rendered again (and
+  fill a TextCache) on every change. Characters are not kerned.
+  """
+
+  def __init__(self, font: pygame.font.Font) -> None:
+    self.font = font
+    self.glyphs: dict[tuple[str, Colour, Colour | None], pygame.Surface] = {}
+
+  def get_glyph(
+    self, char: str, colour: Colour, background: Colour | None
+  ) -> pygame.Surface:
+    key = (char, colour, background)
+    glyph = self.glyphs.get(key)
+    if glyph is None:
+      glyph = self.font.render(char, True, colour, background)
+      self.glyphs[key] = glyph
+    return glyph
+
+  def blit(
+    self,
+    target: pygame.Surface,
+    text: str,
+    position: tuple[int, int],
+    colour: Colour,
+    background: Colour | None = None,
+  ) -> pygame.Rect:
+    """Draw text on target and return the area drawn"""
+    x, y = position
+    blit_sequence = []
+    for char in text:
+      glyph = self.get_glyph(char, colour, background)
+      blit_sequence.append((glyph, (x, y)))
+      x += glyph.get_width()
+    target.blits(blit_sequence, doreturn=False)
+    return pygame.Rect(position[0], y, x - position[0], self.font.get_height())
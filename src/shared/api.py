@@ -1,23 +1,12 @@
 from collections.abc import Iterator
 import dataclasses
 import enum
+from typing import Any
 from typing import Self
 
 import pydantic
-import pygame
 
 from src.shared import serialisers
-from src.shared.types import Coordinate
-
-
-class RenderObjects(pydantic.BaseModel):
-  image: pygame.Surface
-  position: Coordinate
-  destination_surface: pygame.Surface
-  layer: int
-
-  # This is to allow pygame.Surface to be passed as a type
-  model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
 
 
 class InputType(enum.Enum):
@@ -67,10 +56,19 @@ class TileType(enum.Enum):
 
 class TileImport(pydantic.BaseModel):
   position: Position
-  variant: int
+  # Maps saved before variants were added only use the first image
+  variant: int = 0
   layer: int
   tile_type: TileType
 
+  @pydantic.field_validator('position', mode='before')
+  @classmethod
+  def read_legacy_position(cls, position: Any) -> Any:
+    # Older maps store the position as an [x, y] list
+    if isinstance(position, (list, tuple)) and len(position) == 2:
+      return {'x': position[0], 'y': position[1]}
+    return position
+
 
 class WorldGridImport(pydantic.BaseModel):
   tile_map: list[TileImport]
@@ -1,6 +1,6 @@
 import abc
-from collections.abc import Iterable, Iterator
-from typing import TypeVar
+from collections.abc import Callable, Iterable, Iterator
+from typing import Generic, TypeVar
 
 from src.shared import exceptions
 from src.shared.debug import LOGGER
@@ -15,33 +15,87 @@ class Registrable(abc.ABC):
     pass
 
 
+class LazyEntry(Generic[RegistrableType]):
+  """An entry of a registry that is only created the first time it is
+  needed"""
+
+  def __init__(self, create: Callable[[], RegistrableType]) -> None:
+    self.create = create
+
+
 class HashRegistry(Iterable[RegistrableType]):
+  """HashRegistry
+
+  Items by name, in registration order. Lazy entries are created by their
+  factory on the first get (or preload) and then stay registered like any
+  other item. Iterating the registry creates every lazy entry.
+  """
+
   def __init__(self, registry_name: str = 'hash'):
     self.registry_name = registry_name
-    self.map: dict[str, RegistrableType] = {}
+    self.map: dict[str, RegistrableType | LazyEntry[RegistrableType]] = {}
+    # Called with every lazy entry once it is created
+    self.load_hooks: list[Callable[[RegistrableType], None]] = []
 
-  def register(self, item: RegistrableType) -> None:
-    if item.get_name() in self.map:
+  def check_overwrite(self, name: str) -> None:
+    if name in self.map:
       raise exceptions.IllegalRegistryOverwrite(
         'Registry Overwrite',
         {
           'registry': self.registry_name,
-          'item': item.get_name(),
+          'item': name,
         },
       )
-    else:
-      self.map[item.get_name()] = item
+
+  def register(self, item: RegistrableType) -> None:
+    self.check_overwrite(item.get_name())
+    self.map[item.get_name()] = item
 
   def register_all(self, *items: RegistrableType) -> None:
     for item in items:
       self.register(item)
 
+  def register_lazy(
+    self, name: str, create: Callable[[], RegistrableType]
+  ) -> None:
+    """Register an item that is created by create the first time it is
+    needed. The created item must have the same name"""
+    self.check_overwrite(name)
+    self.map[name] = LazyEntry(create)
+
+  def add_load_hook(self, hook: Callable[[RegistrableType], None]) -> None:
+    self.load_hooks.append(hook)
+
+  def is_loaded(self, name: str) -> bool:
+    return name in self.map and not isinstance(self.map[name], LazyEntry)
+
+  def get_names(self) -> list[str]:
+    """Return the names of every item, without creating lazy entries"""
+    return list(self.map)
+
+  def preload(self, names: Iterable[str]) -> None:
+    """Create the lazy entries of names now (eg. during a loading screen)
+    instead of on their first get"""
+    for name in names:
+      self.get(name)
+
+  def load(
+    self, name: str, entry: LazyEntry[RegistrableType]
+  ) -> RegistrableType:
+    item = entry.create()
+    self.map[name] = item
+    for hook in self.load_hooks:
+      hook(item)
+    return item
+
   def get_null(self, name: str) -> RegistrableType | None:
     item = self.map.get(name)
     if item is None:
       LOGGER.warning(
         f'No entry found in {self.registry_name} registry with ID: {name}'
       )
+    elif isinstance(item, LazyEntry):
+      return self.load(name, item)
     return item
 
   def get(self, string_id: str) -> RegistrableType:
@@ -53,10 +107,14 @@ class HashRegistry(Iterable[RegistrableType]):
     return item
 
   def get_all(self) -> dict[str, RegistrableType]:
-    return self.map
+    """Return every item by name, creating the lazy entries first"""
+    return {name: self.get(name) for name in self.get_names()}
 
   def __getitem__(self, index: int) -> str:
     return list(self.map)[index]
 
   def __iter__(self) -> Iterator[RegistrableType]:
-    return iter(self.map.values())
+    for name, item in list(self.map.items()):
+      if isinstance(item, LazyEntry):
+        item = self.load(name, item)
+      yield item
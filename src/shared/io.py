@@ -1,7 +1,13 @@
+from collections.abc import Callable
+from collections.abc import Iterator
+import contextlib
 import dataclasses
 import enum
 import json
+import os
 import pathlib
+import stat
+import tempfile
 from typing import Any, cast, get_origin, TypeVar
 
 import pydantic
@@ -15,30 +21,189 @@ BlueprintType = TypeVar('BlueprintType')
 ModelType = TypeVar('ModelType', bound=pydantic.BaseModel)
 
 
-def export_data(data: Any) -> Any:
-  if isinstance(data, list):
-    return [export_data(item) for item in data]
+Exporter = Callable[[Any], Any]
+
+# Exporter of every type seen by export_data, so the type checks only run once
+# per type
+EXPORTERS: dict[type, Exporter] = {}
+
+JSON_INDENT = '  '
+
+
+def export_list(data: Any) -> list[Any]:
+  return [export_data(item) for item in data]
+
 
-  elif isinstance(data, dict):
-    return {key: export_data(value) for key, value in data.items()}
+def export_dict(data: dict[Any, Any]) -> dict[Any, Any]:
+  return {key: export_data(value) for key, value in data.items()}
 
-  elif isinstance(data, serialisers.Serialiser):
-    return export_data(data.export())
 
-  elif isinstance(data, (int, str, float, bool)):
-    return data
+def export_serialiser(data: serialisers.Serialiser) -> Any:
+  return export_data(data.export())
 
+
+def export_value(data: Any) -> Any:
+  return data
+
+
+def export_unsupported(data: Any) -> None:
   return None
 
 
+def get_exporter(data_type: type) -> Exporter:
+  exporter = EXPORTERS.get(data_type)
+  if exporter is not None:
+    return exporter
+
+  if issubclass(data_type, list):
+    exporter = export_list
+  elif issubclass(data_type, dict):
+    exporter = export_dict
+  elif issubclass(data_type, serialisers.Serialiser):
+    exporter = export_serialiser
+  elif issubclass(data_type, (int, str, float, bool)):
+    exporter = export_value
+  # Generators and other iterators are exported as lists
+  elif issubclass(data_type, Iterator):
+    exporter = export_list
+  else:
+    exporter = export_unsupported
+
+  EXPORTERS[data_type] = exporter
+  return exporter
+
+
+def export_data(data: Any) -> Any:
+  return get_exporter(type(data))(data)
+
+
+def iter_json(
+  data: Any, encoder: json.JSONEncoder, compact: bool, level: int = 0
+) -> Iterator[str]:
+  """Yield the json text of data piece by piece.
+
+  Dicts are walked and lists and iterators are written one item at a time,
+  each item being exported and encoded with a single encoder call. The
+  output is the same as json.dump with indent=2 (or compact separators).
+  """
+  exporter = get_exporter(type(data))
+  is_dict = exporter is export_dict
+  if is_dict:
+    opening, closing = '{', '}'
+  elif exporter is export_list:
+    opening, closing = '[', ']'
+  else:
+    yield encode_json(exporter(data), encoder, compact, level)
+    return
+
+  if compact:
+    separator = ','
+    key_separator = ':'
+    closing_prefix = ''
+  else:
+    separator = ',\n' + JSON_INDENT * (level + 1)
+    key_separator = ': '
+    closing_prefix = '\n' + JSON_INDENT * level
+
+  empty = True
+  for item in data.items() if is_dict else data:
+    if empty:
+      yield opening + separator[1:]
+      empty = False
+    else:
+      yield separator
+
+    if is_dict:
+      key, value = item
+      yield encode_key(key, encoder) + key_separator
+      yield from iter_json(value, encoder, compact, level + 1)
+    else:
+      yield encode_json(export_data(item), encoder, compact, level + 1)
+
+  yield opening + closing if empty else closing_prefix + closing
+
+
+def encode_key(key: Any, encoder: json.JSONEncoder) -> str:
+  """Encode a dict key the way json.dump does"""
+  if isinstance(key, str):
+    return encoder.encode(key)
+  # Checked before int, bool is a subclass of it
+  if key is True:
+    text = 'true'
+  elif key is False:
+    text = 'false'
+  elif key is None:
+    text = 'null'
+  elif isinstance(key, int):
+    text = int.__repr__(key)
+  elif isinstance(key, float):
+    # Same as the values, including NaN and Infinity
+    text = encoder.encode(float(key))
+  else:
+    raise TypeError(
+      'keys must be str, int, float, bool or None, '
+      f'not {key.__class__.__name__}'
+    )
+  return encoder.encode(text)
+
+
+def encode_json(
+  data: Any, encoder: json.JSONEncoder, compact: bool, level: int
+) -> str:
+  encoded = encoder.encode(data)
+  if not compact and level:
+    # Nested values are encoded from column 0
+    encoded = encoded.replace('\n', '\n' + JSON_INDENT * level)
+  return encoded
+
+
 def write_data(file_path: pathlib.Path, data: Any) -> None:
   with open(file_path, 'w') as f:
     f.write(str(data))
 
 
-def write_json(file_path: pathlib.Path, data: Any) -> None:
+def write_json(
+  file_path: pathlib.Path, data: Any, compact: bool = False
+) -> None:
   with open(file_path, 'w') as f:
-    json.dump(data, f, indent=2)
+    if compact:
+      json.dump(data, f, separators=(',', ':'))
+    else:
+      json.dump(data, f, indent=2)
+
+
+def stream_json(
+  file_path: pathlib.Path, data: Any, compact: bool = False
+) -> None:
+  """Export data and write it as json without building the exported tree
+  first, see iter_json"""
+  if compact:
+    encoder = json.JSONEncoder(separators=(',', ':'))
+  else:
+    encoder = json.JSONEncoder(indent=2)
+  with open(file_path, 'w') as f:
+    f.writelines(iter_json(data, encoder, compact))
+
+
+@contextlib.contextmanager
+def atomic_write(file_path: pathlib.Path) -> Iterator[pathlib.Path]:
+  """Yield a temporary path next to file_path to write to, and move it over
+  file_path once the block succeeds, so the file is never partially written"""
+  fd, temp_name = tempfile.mkstemp(
+    dir=file_path.parent, prefix=f'.{file_path.name}.', suffix='.tmp'
+  )
+  os.close(fd)
+  temp_path = pathlib.Path(temp_name)
+  # mkstemp files are only readable by their owner, keep the mode of the file
+  # being replaced instead
+  mode = file_path.stat().st_mode if file_path.exists() else 0o644
+  os.chmod(temp_path, stat.S_IMODE(mode))
+  try:
+    yield temp_path
+    os.replace(temp_path, file_path)
+  except BaseException:
+    temp_path.unlink(missing_ok=True)
+    raise
 
 
 def load_json(file_path: pathlib.Path) -> Any:
@@ -62,10 +227,23 @@ def get_data_model(
   ParametersClass: type[BlueprintType],
   file_path: pathlib.Path,
 ) -> BlueprintType:
+  return create_data_model(
+    ParametersClass,
+    load_json(file_path),
+    lambda image: pygame.image.load(file_path.parent / image).convert_alpha(),
+  )
+
+
+def create_data_model(
+  ParametersClass: type[BlueprintType],
+  json_data: dict[str, Any],
+  load_image: Callable[[Any], pygame.Surface],
+) -> BlueprintType:
+  """Create a dataclass from the values of an info json file. Every entry
+  of its images list is given to load_image to get the surface"""
   if not dataclasses.is_dataclass(ParametersClass):
     raise exceptions.NotDataclass(f'"{ParametersClass}" is not a dataclass.')
 
-  json_data = load_json(file_path)
   values = {}
 
   for field in dataclasses.fields(ParametersClass):
@@ -78,10 +256,7 @@ def get_data_model(
 
       # Load the images into the blueprint
       elif attr == 'images' and isinstance(value, list):
-        value = [
-          pygame.image.load(file_path.parent / image).convert_alpha()
-          for image in value
-        ]
+        value = [load_image(image) for image in value]
 
       # Check if we need to convert anything to a list
       if get_origin(field.type) is list and not isinstance(value, list):